@@ -2,6 +2,10 @@
 
 from .researcher_activities import (
     compile_research_input_activity,
+    market_trends_source_activity,
+    audience_insights_source_activity,
+    competitor_analysis_source_activity,
+    historical_performance_source_activity,
     summarise_research_findings_activity,
     research_brief_activity,
     research_concept_note_activity,
@@ -25,14 +29,25 @@ from .golive_activities import (
 
 from .measurements_activities import (
     fetch_previous_metrics_activity,
+    merge_measurements_activity,
     aggregate_measurements_activity,
     poll_measurements_activity,
     retrieval_activity,
 )
 
+from .task_queues import (
+    HEAVY_ACTIVITIES,
+    LIGHT_ACTIVITIES,
+    activity_task_queue,
+)
+
 __all__ = [
     # Researcher activities
     "compile_research_input_activity",
+    "market_trends_source_activity",
+    "audience_insights_source_activity",
+    "competitor_analysis_source_activity",
+    "historical_performance_source_activity",
     "summarise_research_findings_activity",
     "research_brief_activity",
     "research_concept_note_activity",
@@ -50,8 +65,13 @@ __all__ = [
     "deployment_activity",
     # Measurements activities
     "fetch_previous_metrics_activity",
+    "merge_measurements_activity",
     "aggregate_measurements_activity",
     "poll_measurements_activity",
     "retrieval_activity",
+    # Task queue routing
+    "HEAVY_ACTIVITIES",
+    "LIGHT_ACTIVITIES",
+    "activity_task_queue",
 ]
 
@@ -4,6 +4,9 @@ from temporalio import activity
 from typing import Dict, Any
 import logging
 
+from storage.claim_check import offload_large_values, resolve_claim_checks
+from storage.memo_cache import memoized
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +24,7 @@ async def prepare_creative_inputs_activity(research_output: Dict[str, Any]) -> D
 @activity.defn(name="consolidate_creatives_activity")
 async def consolidate_creatives_activity(creative_outputs: Dict[str, Any]) -> Dict[str, Any]:
     """Consolidate all creative outputs."""
+    creative_outputs = await resolve_claim_checks(creative_outputs)
     logger.info(f"Hello from consolidate_creatives_activity with creative_outputs: {creative_outputs}")
     return {
         "status": "success",
@@ -30,45 +34,53 @@ async def consolidate_creatives_activity(creative_outputs: Dict[str, Any]) -> Di
 
 
 @activity.defn(name="sms_generation_activity")
+@memoized(version="1")
 async def sms_generation_activity(creative_input: Dict[str, Any]) -> Dict[str, Any]:
     """Generate SMS content."""
+    creative_input = await resolve_claim_checks(creative_input)
     logger.info(f"Hello from sms_generation_activity with creative_input: {creative_input}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "SMS content generated successfully",
         "sms_content": "Generated SMS content"
-    }
+    })
 
 
 @activity.defn(name="image_generation_activity")
+@memoized(version="1")
 async def image_generation_activity(creative_input: Dict[str, Any]) -> Dict[str, Any]:
     """Generate image content."""
+    creative_input = await resolve_claim_checks(creative_input)
     logger.info(f"Hello from image_generation_activity with creative_input: {creative_input}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "Image content generated successfully",
         "image_url": "https://example.com/generated-image.jpg"
-    }
+    })
 
 
 @activity.defn(name="video_generation_activity")
+@memoized(version="1")
 async def video_generation_activity(creative_input: Dict[str, Any]) -> Dict[str, Any]:
     """Generate video content."""
+    creative_input = await resolve_claim_checks(creative_input)
     logger.info(f"Hello from video_generation_activity with creative_input: {creative_input}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "Video content generated successfully",
         "video_url": "https://example.com/generated-video.mp4"
-    }
+    })
 
 
 @activity.defn(name="email_template_generation_activity")
+@memoized(version="1")
 async def email_template_generation_activity(creative_input: Dict[str, Any]) -> Dict[str, Any]:
     """Generate email template."""
+    creative_input = await resolve_claim_checks(creative_input)
     logger.info(f"Hello from email_template_generation_activity with creative_input: {creative_input}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "Email template generated successfully",
         "email_template": "Generated email template HTML"
-    }
+    })
 
@@ -4,6 +4,8 @@ from temporalio import activity
 from typing import Dict, Any
 import logging
 
+from storage.claim_check import resolve_claim_checks
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +45,7 @@ async def media_buying_activity(media_plan: Dict[str, Any]) -> Dict[str, Any]:
 @activity.defn(name="deployment_activity")
 async def deployment_activity(deployment_data: Dict[str, Any]) -> Dict[str, Any]:
     """Deploy the campaign."""
+    deployment_data = await resolve_claim_checks(deployment_data)
     logger.info(f"Hello from deployment_activity with deployment_data: {deployment_data}")
     return {
         "status": "success",
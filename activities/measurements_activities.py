@@ -4,6 +4,9 @@ from temporalio import activity
 from typing import Dict, Any
 import logging
 
+from metrics.aggregation import METRIC_COLUMNS, MetricTable, rollup
+from storage.claim_check import offload_large_values, resolve_claim_checks
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,15 +21,73 @@ async def fetch_previous_metrics_activity(campaign_id: str) -> Dict[str, Any]:
     }
 
 
+def _new_rows(current: Dict[str, Any], hour: int = 0) -> MetricTable:
+    """Rows to aggregate from a poll result.
+
+    Polls that report per-channel/creative/hour rows pass them as ``rows``
+    (a column dict); a poll with only campaign totals becomes a single row
+    for the given hour.
+    """
+    if current.get("rows"):
+        return MetricTable.from_columns(current["rows"])
+
+    totals = current.get("measurements", {})
+    return MetricTable.from_columns({
+        "channel": ["all"],
+        "creative_id": ["all"],
+        "hour": [hour],
+        **{metric: [totals.get(metric, 0)] for metric in METRIC_COLUMNS},
+    })
+
+
+@activity.defn(name="merge_measurements_activity")
+async def merge_measurements_activity(poll: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge one poll's new measurements into the running aggregation table.
+
+    ``poll`` holds the table ``state`` returned by the previous call (None
+    at first), the poll's increase as ``measurements`` (or its new ``rows``)
+    and the ``hour`` of the poll. The returned state is a claim-check
+    reference once it grows large.
+    """
+    poll = await resolve_claim_checks(poll)
+    rows = _new_rows(poll, poll.get("hour", 0))
+    table = MetricTable.from_state(poll.get("state")).merge(rows)
+    logger.info(f"Merged {len(rows)} new measurement rows into {len(table)} groups")
+
+    return await offload_large_values({
+        "state": table.to_columns(),
+        "rows_processed": len(rows),
+        "groups": len(table),
+    })
+
+
 @activity.defn(name="aggregate_measurements_activity")
 async def aggregate_measurements_activity(measurements: Dict[str, Any]) -> Dict[str, Any]:
-    """Aggregate all measurements."""
-    logger.info(f"Hello from aggregate_measurements_activity with measurements: {measurements}")
-    return {
+    """Aggregate all measurements.
+
+    ``measurements`` holds the ``previous`` metrics and the ``current`` poll
+    result. A continuous poll result carries the table its poller merged
+    poll by poll (``aggregation_state``), so only the rollup is computed
+    here; a single poll's rows are aggregated from scratch.
+    """
+    measurements = await resolve_claim_checks(measurements)
+    current = measurements.get("current", {})
+    if "aggregation_state" in current:
+        table = MetricTable.from_state(current["aggregation_state"])
+        rows_processed = 0
+    else:
+        table = _new_rows(current)
+        rows_processed = len(table)
+    logger.info(f"Hello from aggregate_measurements_activity with {len(table)} groups")
+
+    previous = measurements.get("previous", {}).get("metrics", {})
+
+    return await offload_large_values({
         "status": "success",
         "message": "Measurements aggregated successfully",
-        "aggregated": "Aggregated measurements data"
-    }
+        "aggregated": rollup(table, previous),
+        "rows_processed": rows_processed,
+    })
 
 
 @activity.defn(name="poll_measurements_activity")
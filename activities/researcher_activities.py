@@ -4,12 +4,20 @@ from temporalio import activity
 from typing import Dict, Any
 import logging
 
+from storage.claim_check import offload_large_values, resolve_claim_checks
+from storage.memo_cache import memoized
+
 logger = logging.getLogger(__name__)
 
 
 @activity.defn(name="compile_research_input_activity")
 async def compile_research_input_activity(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Compile research inputs from campaign data. This fetch data from various data sources."""
+    """Compile research inputs from campaign data. This fetch data from various data sources.
+
+    No longer scheduled by ResearcherWorkflow, which fetches the research
+    sources in parallel. Kept registered so research stages that started
+    before that change can finish.
+    """
     logger.info(f"Hello from compile_research_input_activity with campaign_data: {campaign_data}")
     return {
         "status": "success",
@@ -18,9 +26,54 @@ async def compile_research_input_activity(campaign_data: Dict[str, Any]) -> Dict
     }
 
 
+@activity.defn(name="market_trends_source_activity")
+async def market_trends_source_activity(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch market trends for the campaign's objectives."""
+    logger.info(f"Hello from market_trends_source_activity with campaign_data: {campaign_data}")
+    return {
+        "status": "success",
+        "message": "Market trends fetched successfully",
+        "trends": "Market trends data"
+    }
+
+
+@activity.defn(name="audience_insights_source_activity")
+async def audience_insights_source_activity(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch audience insights for the campaign's channels."""
+    logger.info(f"Hello from audience_insights_source_activity with campaign_data: {campaign_data}")
+    return {
+        "status": "success",
+        "message": "Audience insights fetched successfully",
+        "insights": "Audience insights data"
+    }
+
+
+@activity.defn(name="competitor_analysis_source_activity")
+async def competitor_analysis_source_activity(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch competitor campaigns and positioning."""
+    logger.info(f"Hello from competitor_analysis_source_activity with campaign_data: {campaign_data}")
+    return {
+        "status": "success",
+        "message": "Competitor analysis fetched successfully",
+        "competitors": "Competitor analysis data"
+    }
+
+
+@activity.defn(name="historical_performance_source_activity")
+async def historical_performance_source_activity(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch the performance of earlier, similar campaigns."""
+    logger.info(f"Hello from historical_performance_source_activity with campaign_data: {campaign_data}")
+    return {
+        "status": "success",
+        "message": "Historical performance fetched successfully",
+        "history": "Historical performance data"
+    }
+
+
 @activity.defn(name="summarise_research_findings_activity")
 async def summarise_research_findings_activity(research_data: Dict[str, Any]) -> Dict[str, Any]:
     """Summarise research findings."""
+    research_data = await resolve_claim_checks(research_data)
     logger.info(f"Hello from summarise_research_findings_activity with research_data: {research_data}")
     return {
         "status": "success",
@@ -30,23 +83,26 @@ async def summarise_research_findings_activity(research_data: Dict[str, Any]) ->
 
 
 @activity.defn(name="research_brief_activity")
+@memoized(version="1")
 async def research_brief_activity(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """Generate research brief."""
     logger.info(f"Hello from research_brief_activity with input_data: {input_data}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "Research brief generated successfully",
         "brief": "Research brief content"
-    }
+    })
 
 
 @activity.defn(name="research_concept_note_activity")
+@memoized(version="1")
 async def research_concept_note_activity(brief_data: Dict[str, Any]) -> Dict[str, Any]:
     """Generate research concept note."""
+    brief_data = await resolve_claim_checks(brief_data)
     logger.info(f"Hello from research_concept_note_activity with brief_data: {brief_data}")
-    return {
+    return await offload_large_values({
         "status": "success",
         "message": "Research concept note generated successfully",
         "concept_note": "Concept note content"
-    }
+    })
 
@@ -0,0 +1,80 @@
+"""Task queue routing for activities.
+
+Activities are split into two classes, each served by its own task queue and
+worker pool so they can be scaled separately from each other and from
+workflow tasks:
+
+- heavy: slow generation and media work (LLM, image and video generation)
+- light: fast bookkeeping and integration activities
+"""
+
+from typing import Callable
+
+from config.settings import settings
+from .researcher_activities import (
+    compile_research_input_activity,
+    market_trends_source_activity,
+    audience_insights_source_activity,
+    competitor_analysis_source_activity,
+    historical_performance_source_activity,
+    summarise_research_findings_activity,
+    research_brief_activity,
+    research_concept_note_activity,
+)
+from .creative_activities import (
+    prepare_creative_inputs_activity,
+    consolidate_creatives_activity,
+    sms_generation_activity,
+    image_generation_activity,
+    video_generation_activity,
+    email_template_generation_activity,
+)
+from .golive_activities import (
+    prepare_media_plan_activity,
+    summarise_media_buy_report_activity,
+    media_buying_activity,
+    deployment_activity,
+)
+from .measurements_activities import (
+    fetch_previous_metrics_activity,
+    merge_measurements_activity,
+    aggregate_measurements_activity,
+    poll_measurements_activity,
+    retrieval_activity,
+)
+
+HEAVY_ACTIVITIES = [
+    research_brief_activity,
+    research_concept_note_activity,
+    sms_generation_activity,
+    image_generation_activity,
+    video_generation_activity,
+    email_template_generation_activity,
+]
+
+LIGHT_ACTIVITIES = [
+    compile_research_input_activity,
+    market_trends_source_activity,
+    audience_insights_source_activity,
+    competitor_analysis_source_activity,
+    historical_performance_source_activity,
+    summarise_research_findings_activity,
+    prepare_creative_inputs_activity,
+    consolidate_creatives_activity,
+    prepare_media_plan_activity,
+    summarise_media_buy_report_activity,
+    media_buying_activity,
+    deployment_activity,
+    fetch_previous_metrics_activity,
+    merge_measurements_activity,
+    aggregate_measurements_activity,
+    poll_measurements_activity,
+    retrieval_activity,
+]
+
+
+def activity_task_queue(activity_fn: Callable) -> str:
+    """Return the task queue of the worker pool that runs an activity."""
+    if activity_fn in HEAVY_ACTIVITIES:
+        return settings.temporal_heavy_activity_task_queue
+    return settings.temporal_light_activity_task_queue
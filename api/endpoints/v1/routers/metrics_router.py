@@ -0,0 +1,20 @@
+"""Metrics router."""
+
+from fastapi import APIRouter
+from api.schemas.v1.generated import MetricsResponse
+from client.temporal_client import get_temporal_client_manager
+from services.campaign_workflow import workflow_service
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+async def get_metrics():
+    """Get in-process API metrics."""
+    client_manager = get_temporal_client_manager()
+    payload_codec = client_manager.payload_codec
+    return MetricsResponse(
+        status_cache=workflow_service.status_cache.stats(),
+        temporal_client=client_manager.stats(),
+        payload_codec=payload_codec.stats() if payload_codec is not None else None,
+    )
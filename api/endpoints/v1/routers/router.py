@@ -1,8 +1,9 @@
 """V1 API routes."""
 
 from fastapi import APIRouter
-from . import workflow_router
+from . import metrics_router, workflow_router
 
 router = APIRouter(prefix="/api/v1")
 router.include_router(workflow_router.router)
+router.include_router(metrics_router.router)
 
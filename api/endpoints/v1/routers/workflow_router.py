@@ -1,17 +1,31 @@
 """Workflow router."""
 
+import json
 import logging
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Query, Path
+from fastapi import APIRouter, Header, HTTPException, Query, Path
+from fastapi.responses import StreamingResponse
 from api.schemas.v1.generated import (
     StartWorkflowRequest,
     StartWorkflowResponse,
+    StartWorkflowWithResearchResponse,
+    BatchStartWorkflowRequest,
+    BatchStartWorkflowResponse,
     SignalWorkflowRequest,
     SignalWorkflowResponse,
+    ApproveStageRequest,
+    ApproveStageResponse,
+    BatchSignalWorkflowRequest,
+    BatchSignalWorkflowResponse,
     GetWorkflowsResponse,
-    WorkflowStatusResponse
+    WorkflowStatusResponse,
+    CampaignProgressResponse,
+    BatchCampaignProgressRequest,
+    BatchCampaignProgressResponse,
 )
-from services.campaign_workflow import workflow_service
+from config.settings import settings
+from services.campaign_workflow import CampaignConflictError, DecisionRejectedError, workflow_service
+from services.workflow_events import workflow_event_hub
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +38,44 @@ async def start_workflow(request: StartWorkflowRequest):
     try:
         result = await workflow_service.start_workflow(request)
         return StartWorkflowResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error starting workflow: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/start/await-research", response_model=StartWorkflowWithResearchResponse)
+async def start_workflow_and_await_research(request: StartWorkflowRequest):
+    """Start a new workflow and return once the research stage has its first output."""
+    try:
+        result = await workflow_service.start_workflow_and_await_research(request)
+        return StartWorkflowWithResearchResponse(**result)
+    except CampaignConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error starting workflow with research output: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/start/batch", response_model=BatchStartWorkflowResponse)
+async def start_workflows_batch(request: BatchStartWorkflowRequest):
+    """Start several workflows concurrently."""
+    if len(request.workflows) > settings.api_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch contains {len(request.workflows)} workflows, maximum is {settings.api_batch_max_items}",
+        )
+    try:
+        result = await workflow_service.start_workflows(request.workflows)
+        return BatchStartWorkflowResponse(**result)
+    except Exception as e:
+        logger.error(f"Error starting workflow batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/signal", response_model=SignalWorkflowResponse)
 async def signal_workflow(request: SignalWorkflowRequest):
     """Send a signal to a running workflow."""
@@ -44,25 +91,106 @@ async def signal_workflow(request: SignalWorkflowRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/approve", response_model=ApproveStageResponse)
+async def approve_stage(request: ApproveStageRequest):
+    """Approve, reject or give feedback on a campaign stage, confirmed synchronously."""
+    try:
+        result = await workflow_service.submit_decision(
+            workflow_id=request.workflow_id,
+            stage=request.stage,
+            decision=request.decision,
+            feedback=request.feedback,
+            targets=request.targets,
+        )
+        return ApproveStageResponse(**result)
+    except DecisionRejectedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error submitting decision: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/signal/batch", response_model=BatchSignalWorkflowResponse)
+async def signal_workflows_batch(request: BatchSignalWorkflowRequest):
+    """Send signals to several workflows concurrently."""
+    if request.signals is not None and len(request.signals) > settings.api_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch contains {len(request.signals)} signals, maximum is {settings.api_batch_max_items}",
+        )
+    try:
+        if request.query is not None:
+            result = await workflow_service.signal_workflows_by_query(
+                query=request.query,
+                signal_name=request.signal_name,
+                signal_input=request.signal_input,
+            )
+        else:
+            result = await workflow_service.send_signals(request.signals)
+        return BatchSignalWorkflowResponse(**result)
+    except Exception as e:
+        logger.error(f"Error sending signal batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/progress/batch", response_model=BatchCampaignProgressResponse)
+async def get_campaign_progress_batch(request: BatchCampaignProgressRequest):
+    """Get the progress of several campaigns."""
+    if len(request.workflow_ids) > settings.api_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch contains {len(request.workflow_ids)} workflows, maximum is {settings.api_batch_max_items}",
+        )
+    try:
+        result = await workflow_service.get_campaign_progress_batch(request.workflow_ids)
+        return BatchCampaignProgressResponse(**result)
+    except Exception as e:
+        logger.error(f"Error getting campaign progress batch: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("", response_model=GetWorkflowsResponse)
 async def get_workflows(
-    limit: int = Query(default=10, ge=1, le=100, description="Maximum number of workflows to return"),
+    limit: int = Query(default=10, ge=1, le=settings.api_list_max_page_size, description="Maximum number of workflows to return (page size)"),
     workflow_type: Optional[str] = Query(default=None, description="Filter by workflow type (e.g., 'MarketingOrchestratorWorkflow')"),
-    status: Optional[str] = Query(default=None, description="Filter by workflow status (e.g., 'Running', 'Completed')")
+    status: Optional[str] = Query(default=None, description="Filter by workflow status (e.g., 'Running', 'Completed')"),
+    page_token: Optional[str] = Query(default=None, description="next_page_token from the previous page")
 ):
-    """Get list of workflows with optional filters."""
+    """Get a page of workflows with optional filters."""
     try:
         result = await workflow_service.list_workflows(
             limit=limit,
             workflow_type=workflow_type,
-            status=status
+            status=status,
+            page_token=page_token
         )
         return GetWorkflowsResponse(**result)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing workflows: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/export")
+async def export_workflows(
+    workflow_type: Optional[str] = Query(default=None, description="Filter by workflow type (e.g., 'MarketingOrchestratorWorkflow')"),
+    status: Optional[str] = Query(default=None, description="Filter by workflow status (e.g., 'Running', 'Completed')")
+):
+    """Stream all matching workflows as newline-delimited JSON."""
+
+    async def ndjson():
+        try:
+            async for workflow in workflow_service.stream_workflows(workflow_type=workflow_type, status=status):
+                yield json.dumps(workflow) + "\n"
+        except Exception as e:
+            # Headers are already sent, so the client only sees a truncated stream
+            logger.error(f"Error exporting workflows: {e}", exc_info=True)
+            raise
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/{workflow_id}", response_model=WorkflowStatusResponse)
 async def get_workflow_status(
     workflow_id: str = Path(..., description="ID of the workflow to get status for")
@@ -76,4 +204,46 @@ async def get_workflow_status(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{workflow_id}/progress", response_model=CampaignProgressResponse)
+async def get_campaign_progress(
+    workflow_id: str = Path(..., description="ID of the campaign workflow to get progress for")
+):
+    """Get a campaign's stage progress."""
+    try:
+        result = await workflow_service.get_campaign_progress(workflow_id)
+        return CampaignProgressResponse(**result)
+    except Exception as e:
+        logger.error(f"Error getting campaign progress: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{workflow_id}/events")
+async def stream_workflow_events(
+    workflow_id: str = Path(..., description="ID of the campaign workflow to stream stage events for"),
+    last_event_id: Optional[int] = Header(default=None, description="Resume after this event ID (sent by EventSource on reconnect)")
+):
+    """Stream a campaign's stage events as Server-Sent Events."""
+
+    async def sse():
+        try:
+            async for event in workflow_event_hub.events(workflow_id, heartbeat_seconds=settings.sse_heartbeat_seconds):
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                event_id = event.get("event_id")
+                if event_id is None:
+                    # Not a history event (watch_failed), so it can't be resumed after
+                    yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+                    continue
+                if last_event_id is not None and event_id <= last_event_id:
+                    continue
+                yield f"id: {event_id}\nevent: {event['event']}\ndata: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming events for workflow {workflow_id}: {e}", exc_info=True)
+            raise
 
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
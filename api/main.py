@@ -1,8 +1,10 @@
 """FastAPI application."""
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from api.endpoints.v1.routers import router as v1_router
+from client.temporal_client import get_temporal_client, get_temporal_client_manager
 from config.settings import settings
 
 logging.basicConfig(
@@ -10,10 +12,28 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect to Temporal before serving requests and monitor the connection."""
+    client_manager = get_temporal_client_manager()
+    try:
+        await get_temporal_client()
+    except Exception as e:
+        # Keep serving; the health checks retry the connection
+        logger.error(f"Could not connect to Temporal at startup: {e}")
+    client_manager.start_health_checks()
+    yield
+    await client_manager.stop_health_checks()
+
+
 app = FastAPI(
     title="Temporal Workflow API",
     version=settings.app_version,
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 app.include_router(v1_router)
@@ -1,7 +1,18 @@
 """Pydantic models for API requests and responses."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Any
+from pydantic import BaseModel, Field, model_validator
+from typing import Dict, List, Literal, Optional, Any
+
+
+class InitialSignal(BaseModel):
+    """A stage signal sent together with the campaign start."""
+
+    signal_name: str = Field(..., description="Name of the signal", examples=["approve_research", "provide_feedback"])
+    signal_input: Optional[Any] = Field(None, description="Optional input data for the signal")
+    stage: Optional[Literal["research", "creative", "golive", "measurements"]] = Field(
+        None,
+        description="Stage the signal is for; required for provide_feedback, inferred for approve/reject signals",
+    )
 
 
 class StartWorkflowRequest(BaseModel):
@@ -11,6 +22,15 @@ class StartWorkflowRequest(BaseModel):
     budget: float = Field(..., description="Campaign budget", examples=[100000])
     objectives: List[str] = Field(..., description="Campaign objectives", examples=[["Increase awareness"]])
     channels: List[str] = Field(..., description="Marketing channels", examples=[["email", "sms"]])
+    idempotency_key: Optional[str] = Field(
+        None,
+        description="Client-chosen key; retrying with the same key returns the existing campaign instead of starting a new one",
+        examples=["spring-launch-emea-2025"],
+    )
+    initial_signals: Optional[List[InitialSignal]] = Field(
+        None,
+        description="Stage signals to deliver to each stage as soon as it starts (e.g. pre-approvals), sent with the start",
+    )
 
 
 class StartWorkflowResponse(BaseModel):
@@ -18,9 +38,48 @@ class StartWorkflowResponse(BaseModel):
 
     workflow_id: str
     run_id: str
+    already_started: bool = False
     message: str = "Workflow started successfully"
 
 
+class StartWorkflowWithResearchResponse(BaseModel):
+    """Response after starting a workflow and waiting for its first research output."""
+
+    workflow_id: str
+    run_id: Optional[str] = None
+    already_started: bool = False
+    research_outputs: Optional[Dict[str, Any]] = Field(
+        None,
+        description="First research output; absent when a keyed campaign had already closed",
+    )
+    message: str = "Workflow started and research output ready"
+
+
+class BatchStartWorkflowRequest(BaseModel):
+    """Request to start several workflows at once."""
+
+    workflows: List[StartWorkflowRequest] = Field(..., min_length=1, description="Workflows to start")
+
+
+class BatchStartWorkflowResult(BaseModel):
+    """Outcome of starting one workflow in a batch."""
+
+    index: int = Field(..., description="Position of the request in the batch")
+    status: Literal["started", "already_started", "failed"]
+    workflow_id: Optional[str] = None
+    run_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchStartWorkflowResponse(BaseModel):
+    """Response after starting a batch of workflows."""
+
+    results: List[BatchStartWorkflowResult]
+    succeeded: int
+    failed: int
+    message: str = "Batch start completed"
+
+
 class SignalWorkflowRequest(BaseModel):
     """Request to send a signal to a running workflow."""
 
@@ -37,6 +96,74 @@ class SignalWorkflowResponse(BaseModel):
     message: str = "Signal sent successfully"
 
 
+class BatchSignalWorkflowRequest(BaseModel):
+    """Request to signal several workflows at once.
+
+    Either list the signals to send, or give a visibility query selecting the
+    workflows plus the signal to send to each of them.
+    """
+
+    signals: Optional[List[SignalWorkflowRequest]] = Field(None, min_length=1, description="Signals to send")
+    query: Optional[str] = Field(
+        None,
+        description="Visibility query selecting the workflows to signal (only running workflows are signalled)",
+        examples=["WorkflowType='ResearcherWorkflow' AND WorkflowId STARTS_WITH 'spring-launch'"],
+    )
+    signal_name: Optional[str] = Field(None, description="Signal to send to workflows matching the query")
+    signal_input: Optional[Any] = Field(None, description="Optional input data for the query signal")
+
+    @model_validator(mode="after")
+    def check_targets(self):
+        if (self.signals is None) == (self.query is None):
+            raise ValueError("Provide exactly one of 'signals' or 'query'")
+        if self.query is not None and not self.signal_name:
+            raise ValueError("'signal_name' is required with 'query'")
+        return self
+
+
+class BatchSignalResult(BaseModel):
+    """Outcome of sending one signal in a batch."""
+
+    workflow_id: str
+    signal_name: str
+    status: Literal["sent", "failed"]
+    error: Optional[str] = None
+
+
+class BatchSignalWorkflowResponse(BaseModel):
+    """Response after signalling a batch of workflows."""
+
+    results: List[BatchSignalResult]
+    succeeded: int
+    failed: int
+    batch_job_id: Optional[str] = Field(None, description="Temporal batch operation job ID, for large query batches")
+    message: str = "Batch signal completed"
+
+
+class ApproveStageRequest(BaseModel):
+    """Request to approve, reject or give feedback on a campaign stage."""
+
+    workflow_id: str = Field(..., description="Campaign (orchestrator) workflow ID", examples=["spring-launch-1e13946d"])
+    stage: Literal["research", "creative", "golive", "measurements"] = Field(..., description="Stage to decide on")
+    decision: Literal["approve", "reject", "feedback"] = Field(..., description="Decision to submit")
+    feedback: str = Field("", description="Optional comment, or the feedback for a feedback decision")
+    targets: Optional[List[str]] = Field(
+        None,
+        description="Creatives to revise with creative feedback: creative keys, generators or channels",
+        examples=[["video", "sms-v2"]],
+    )
+
+
+class ApproveStageResponse(BaseModel):
+    """Response after a stage accepted a decision."""
+
+    workflow_id: str
+    stage_workflow_id: str
+    stage: str
+    decision: str
+    message: str = "Decision accepted"
+
+
 class WorkflowInfo(BaseModel):
     """Information about a workflow execution."""
 
@@ -52,6 +179,7 @@ class GetWorkflowsResponse(BaseModel):
 
     workflows: List[WorkflowInfo]
     count: int
+    next_page_token: Optional[str] = Field(None, description="Pass as page_token to get the next page; null on the last page")
     message: str = "Workflows retrieved successfully"
 
 
@@ -65,3 +193,41 @@ class WorkflowStatusResponse(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
 
+class CampaignProgressResponse(BaseModel):
+    """Response containing a campaign's progress record."""
+
+    workflow_id: str
+    progress: Dict[str, Any] = Field(..., description="Current stage, per-stage state, timestamps and revision rounds")
+    message: str = "Campaign progress retrieved successfully"
+
+
+class BatchCampaignProgressRequest(BaseModel):
+    """Request for the progress of several campaigns."""
+
+    workflow_ids: List[str] = Field(..., min_length=1, description="Orchestrator workflow IDs")
+
+
+class BatchCampaignProgressResult(BaseModel):
+    """Progress of one campaign in a batch."""
+
+    workflow_id: str
+    status: Literal["ok", "failed"]
+    progress: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class BatchCampaignProgressResponse(BaseModel):
+    """Response containing the progress of several campaigns."""
+
+    results: List[BatchCampaignProgressResult]
+    succeeded: int
+    failed: int
+    message: str = "Campaign progress retrieved"
+
+
+class MetricsResponse(BaseModel):
+    """In-process API metrics."""
+
+    status_cache: Dict[str, Any] = Field(..., description="Workflow status cache statistics")
+    temporal_client: Dict[str, Any] = Field(..., description="Temporal connection and health check statistics")
+    payload_codec: Optional[Dict[str, Any]] = Field(None, description="Payload compression statistics, if compression is enabled")
@@ -0,0 +1 @@
+"""Campaign orchestration benchmarks."""
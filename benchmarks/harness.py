@@ -0,0 +1,156 @@
+"""Shared helpers for campaign benchmarks.
+
+Benchmarks run real campaigns against the Temporal time-skipping test
+environment with an in-process worker, approve every stage through the same
+signals the API uses, and then read the event histories of the whole
+campaign (orchestrator, stages and their children) back from the server.
+"""
+
+import asyncio
+import math
+import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Dict, Any, List, Optional
+
+from temporalio.api.enums.v1 import EventType
+from temporalio.client import Client, WorkflowHandle
+from temporalio.service import RPCError, RPCStatusCode
+
+from config.settings import settings
+from workers.worker import POOLS, build_workers
+
+# Stage child workflow ID suffix and the signal that approves it, in order
+STAGE_APPROVALS = [
+    ("researcher", "approve_research"),
+    ("creative", "approve_creatives"),
+    ("golive", "approve_media_buy"),
+    ("measurements", "approve_measurements"),
+]
+
+SAMPLE_CAMPAIGN = {
+    "campaign_id": "BENCH-001",
+    "campaign_name": "Benchmark Campaign",
+    "budget": 100000,
+    "objectives": ["Increase brand awareness"],
+    "channels": ["email", "sms", "social", "video"],
+}
+
+
+@dataclass
+class HistoryStats:
+    """Event history totals across all executions of one or more campaigns."""
+
+    workflow_executions: int = 0
+    history_events: int = 0
+    workflow_tasks: int = 0
+    activity_tasks: int = 0
+    child_workflows: int = 0
+
+    @property
+    def server_round_trips(self) -> int:
+        """Task round trips: every workflow or activity task is polled and completed once."""
+        return self.workflow_tasks + self.activity_tasks
+
+    def to_dict(self) -> Dict[str, int]:
+        return {**asdict(self), "server_round_trips": self.server_round_trips}
+
+
+@asynccontextmanager
+async def running_workers(client: Client) -> AsyncIterator[None]:
+    """Run in-process workers for every pool while the context is open."""
+    async with AsyncExitStack() as stack:
+        for worker in build_workers(client, list(POOLS)):
+            await stack.enter_async_context(worker)
+        yield
+
+
+async def approve_stage(client: Client, workflow_id: str, signal_name: str, poll_interval: float = 0.05) -> None:
+    """Approve a stage child workflow, waiting until it has been started."""
+    handle = client.get_workflow_handle(workflow_id)
+    while True:
+        try:
+            await handle.signal(signal_name, "Auto-approved by benchmark")
+            return
+        except RPCError as e:
+            if e.status != RPCStatusCode.NOT_FOUND:
+                raise
+        await asyncio.sleep(poll_interval)
+
+
+async def run_campaign(client: Client, campaign_input: Optional[Dict[str, Any]] = None) -> WorkflowHandle:
+    """Start a campaign, approve every stage and wait for it to complete."""
+    workflow_id = f"benchmark-{uuid.uuid4().hex[:8]}"
+    handle = await client.start_workflow(
+        "MarketingOrchestratorWorkflow",
+        campaign_input or SAMPLE_CAMPAIGN,
+        id=workflow_id,
+        task_queue=settings.temporal_task_queue,
+    )
+
+    for suffix, signal_name in STAGE_APPROVALS:
+        await approve_stage(client, f"{workflow_id}-{suffix}", signal_name)
+
+    await handle.result()
+    return handle
+
+
+async def collect_history_stats(
+    client: Client,
+    workflow_id: str,
+    run_id: Optional[str] = None,
+    stats: Optional[HistoryStats] = None,
+) -> HistoryStats:
+    """Add up the histories of a workflow, its continued runs and all its children."""
+    stats = stats or HistoryStats()
+
+    while True:
+        history = await client.get_workflow_handle(workflow_id, run_id=run_id).fetch_history()
+        stats.workflow_executions += 1
+        next_run_id = None
+
+        for event in history.events:
+            stats.history_events += 1
+            if event.event_type == EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED:
+                stats.workflow_tasks += 1
+            elif event.event_type == EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED:
+                stats.activity_tasks += 1
+            elif event.event_type == EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_STARTED:
+                child = event.child_workflow_execution_started_event_attributes.workflow_execution
+                stats.child_workflows += 1
+                await collect_history_stats(client, child.workflow_id, child.run_id, stats)
+            elif event.event_type == EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW:
+                next_run_id = event.workflow_execution_continued_as_new_event_attributes.new_execution_run_id
+
+        if next_run_id is None:
+            return stats
+        run_id = next_run_id
+
+
+async def stage_latencies(client: Client, workflow_id: str) -> Dict[str, float]:
+    """Seconds from start to completion of each stage child, from the orchestrator history."""
+    stage_prefix = f"{workflow_id}-"
+    started: Dict[str, float] = {}
+    latencies: Dict[str, float] = {}
+
+    history = await client.get_workflow_handle(workflow_id).fetch_history()
+    for event in history.events:
+        if event.event_type == EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_STARTED:
+            child_id = event.child_workflow_execution_started_event_attributes.workflow_execution.workflow_id
+            started[child_id] = event.event_time.ToDatetime().timestamp()
+        elif event.event_type == EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_COMPLETED:
+            child_id = event.child_workflow_execution_completed_event_attributes.workflow_execution.workflow_id
+            if child_id in started:
+                stage = child_id[len(stage_prefix):]
+                latencies[stage] = event.event_time.ToDatetime().timestamp() - started[child_id]
+
+    return latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
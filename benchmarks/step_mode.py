@@ -0,0 +1,78 @@
+"""Benchmark child workflow steps against direct activity calls.
+
+Runs the same campaigns with WORKFLOW_STEP_MODE=child_workflow and
+WORKFLOW_STEP_MODE=activity and reports, per campaign, the workflow
+executions, history events and task round trips against the server.
+
+Usage:
+    poetry run python -m benchmarks.step_mode --campaigns 5 --output step_mode.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from temporalio.testing import WorkflowEnvironment
+
+from benchmarks.harness import HistoryStats, collect_history_stats, run_campaign, running_workers
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+STEP_MODES = ["child_workflow", "activity"]
+
+
+async def benchmark_mode(env: WorkflowEnvironment, mode: str, campaigns: int) -> dict:
+    """Run campaigns sequentially in one step mode and return per-campaign averages."""
+    settings.workflow_step_mode = mode
+    totals = HistoryStats()
+
+    for _ in range(campaigns):
+        handle = await run_campaign(env.client)
+        await collect_history_stats(env.client, handle.id, stats=totals)
+
+    return {key: value / campaigns for key, value in totals.to_dict().items()}
+
+
+async def main(campaigns: int, output: str | None) -> dict:
+    """Benchmark both step modes and report the reduction."""
+    async with await WorkflowEnvironment.start_time_skipping() as env:
+        # Campaigns wait on human approval timers; skipping time while a
+        # campaign is still being approved would fire those timers early
+        with env.auto_time_skipping_disabled():
+            async with running_workers(env.client):
+                results = {mode: await benchmark_mode(env, mode, campaigns) for mode in STEP_MODES}
+
+    baseline, direct = results["child_workflow"], results["activity"]
+    results["reduction_percent"] = {
+        key: round(100 * (baseline[key] - direct[key]) / baseline[key], 1) if baseline[key] else 0.0
+        for key in baseline
+    }
+
+    print(f"{'per campaign':<22}{'child_workflow':>16}{'activity':>12}{'reduction':>12}")
+    for key in baseline:
+        print(f"{key:<22}{baseline[key]:>16.1f}{direct[key]:>12.1f}{results['reduction_percent'][key]:>11.1f}%")
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2))
+        logger.info(f"Results written to {output}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--campaigns", type=int, default=3, help="Campaigns to run per step mode")
+    parser.add_argument("--output", help="Optional path for JSON results")
+    args = parser.parse_args()
+
+    # Keep activity logging out of the benchmark output
+    logging.getLogger().setLevel(logging.WARNING)
+    asyncio.run(main(args.campaigns, args.output))
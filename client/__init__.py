@@ -1,6 +1,7 @@
 """Client module for Temporal connections."""
 
-from client.temporal_client import get_temporal_client, TemporalClient
+from client.temporal_client import get_temporal_client, get_temporal_client_manager, TemporalClient
+from client.payload_codec import CompressionPayloadCodec
 
-__all__ = ["get_temporal_client", "TemporalClient"]
+__all__ = ["get_temporal_client", "get_temporal_client_manager", "TemporalClient", "CompressionPayloadCodec"]
 
@@ -1,8 +1,24 @@
-"""Temporal client implementation."""
+"""Temporal client implementation.
 
+The client connects once per process, guarded by a lock so concurrent
+callers share a single connection attempt. The API and workers warm it up
+at startup. Optional periodic health checks reconnect with exponential
+backoff when the server stops answering, and connection metrics are kept
+for the /api/v1/metrics endpoint. With TEMPORAL_METRICS_BIND_ADDRESS set,
+the SDK metrics of the process are served for Prometheus.
+"""
+
+import asyncio
+import dataclasses
 import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
 from temporalio.client import Client, TLSConfig
+from temporalio.converter import DataConverter
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
 
+from client.payload_codec import CompressionPayloadCodec
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -13,6 +29,21 @@ class TemporalClient:
 
     _instance = None
     _client = None
+    _payload_codec: Optional[CompressionPayloadCodec] = None
+    _runtime: Optional[Runtime] = None
+    _lock: Optional[asyncio.Lock] = None
+    _health_task: Optional[asyncio.Task] = None
+
+    # Connection metrics
+    connects = 0
+    connect_failures = 0
+    reconnects = 0
+    health_checks = 0
+    health_check_failures = 0
+    consecutive_health_check_failures = 0
+    last_connect_seconds: Optional[float] = None
+    last_health_check_at: Optional[str] = None
+    last_error: Optional[str] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -41,15 +72,62 @@ class TemporalClient:
         logger.info(f"Connecting to Temporal server at {settings.temporal_host}")
         logger.info(f"Namespace: {settings.temporal_namespace}")
 
-        self._client = await Client.connect(
-            settings.temporal_host,
-            namespace=settings.temporal_namespace,
-            tls=tls_config,
-        )
+        started = time.monotonic()
+        try:
+            self._client = await Client.connect(
+                settings.temporal_host,
+                namespace=settings.temporal_namespace,
+                tls=tls_config,
+                data_converter=self._build_data_converter(),
+                runtime=self._get_runtime(),
+            )
+        except Exception as e:
+            self.connect_failures += 1
+            self.last_error = str(e)
+            raise
 
-        logger.info("Successfully connected to Temporal server")
+        self.connects += 1
+        self.last_connect_seconds = time.monotonic() - started
+        logger.info(f"Successfully connected to Temporal server in {self.last_connect_seconds:.3f}s")
         return self._client
 
+    def _build_data_converter(self) -> DataConverter:
+        """Build the data converter, with payload compression if configured."""
+        if settings.payload_codec == "none":
+            return DataConverter.default
+
+        # Reuse the codec on reconnect so its statistics carry over
+        if self._payload_codec is None:
+            self._payload_codec = CompressionPayloadCodec(
+                algorithm=settings.payload_codec,
+                threshold_bytes=settings.payload_codec_threshold_bytes,
+                level=settings.payload_codec_level,
+                offload_threshold_bytes=settings.payload_codec_offload_threshold_bytes,
+            )
+            logger.info(
+                f"Payload compression enabled: {settings.payload_codec} "
+                f"for payloads >= {settings.payload_codec_threshold_bytes} bytes"
+            )
+        return dataclasses.replace(DataConverter.default, payload_codec=self._payload_codec)
+
+    def _get_runtime(self) -> Runtime:
+        """The SDK runtime, serving Prometheus metrics if configured."""
+        if settings.temporal_metrics_bind_address is None:
+            return Runtime.default()
+
+        # The metrics endpoint is bound once per process and kept on reconnect
+        if self._runtime is None:
+            self._runtime = Runtime(telemetry=TelemetryConfig(
+                metrics=PrometheusConfig(bind_address=settings.temporal_metrics_bind_address),
+            ))
+            logger.info(f"Serving Temporal SDK metrics at {settings.temporal_metrics_bind_address}")
+        return self._runtime
+
+    @property
+    def payload_codec(self) -> Optional[CompressionPayloadCodec]:
+        """The payload codec in use, if payload compression is enabled."""
+        return self._payload_codec
+
     async def get_client(self) -> Client:
         """Get or create the Temporal client instance.
 
@@ -57,10 +135,105 @@ class TemporalClient:
             Client: The connected Temporal client instance.
         """
         if self._client is None:
-            await self._init_async()
+            async with self._get_lock():
+                # Another caller may have connected while we waited
+                if self._client is None:
+                    await self._init_async()
 
         return self._client
 
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def start_health_checks(self) -> None:
+        """Start checking the connection in the background (no-op if disabled or running)."""
+        if settings.temporal_health_check_interval_seconds <= 0:
+            return
+        if self._health_task is not None and not self._health_task.done():
+            return
+        self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def stop_health_checks(self) -> None:
+        """Stop background health checks."""
+        if self._health_task is None:
+            return
+        self._health_task.cancel()
+        try:
+            await self._health_task
+        except asyncio.CancelledError:
+            pass
+        self._health_task = None
+
+    async def _health_check_loop(self) -> None:
+        backoff = settings.temporal_reconnect_backoff_initial_seconds
+        while True:
+            if await self._check_health():
+                backoff = settings.temporal_reconnect_backoff_initial_seconds
+                await asyncio.sleep(settings.temporal_health_check_interval_seconds)
+                continue
+
+            logger.warning(
+                f"Temporal health check failed {self.consecutive_health_check_failures} time(s), "
+                f"reconnecting in {backoff:.1f}s"
+            )
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, settings.temporal_reconnect_backoff_max_seconds)
+            try:
+                await self._reconnect()
+            except Exception as e:
+                logger.error(f"Reconnecting to Temporal failed: {e}")
+
+    async def _check_health(self) -> bool:
+        """Check the frontend service health of the current connection."""
+        self.health_checks += 1
+        self.last_health_check_at = datetime.now(timezone.utc).isoformat()
+
+        healthy = False
+        if self._client is not None:
+            try:
+                healthy = await self._client.service_client.check_health(
+                    timeout=timedelta(seconds=settings.temporal_health_check_timeout_seconds),
+                )
+            except Exception as e:
+                self.last_error = str(e)
+
+        if healthy:
+            self.consecutive_health_check_failures = 0
+        else:
+            self.health_check_failures += 1
+            self.consecutive_health_check_failures += 1
+        return healthy
+
+    async def _reconnect(self) -> None:
+        """Replace the client with a fresh connection.
+
+        Callers keep using the old client until the new one is connected.
+        Workers stay bound to the client they were created with. The SDK
+        client has no close(); the old connection is released once no caller
+        holds a reference to it.
+        """
+        async with self._get_lock():
+            self.reconnects += 1
+            logger.info("Reconnecting to Temporal server")
+            await self._init_async()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return connection metrics."""
+        return {
+            "connected": self._client is not None,
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "reconnects": self.reconnects,
+            "last_connect_seconds": round(self.last_connect_seconds, 3) if self.last_connect_seconds is not None else None,
+            "health_checks": self.health_checks,
+            "health_check_failures": self.health_check_failures,
+            "consecutive_health_check_failures": self.consecutive_health_check_failures,
+            "last_health_check_at": self.last_health_check_at,
+            "last_error": self.last_error,
+        }
+
 
 # Global instance
 _temporal_client_instance = TemporalClient()
@@ -81,3 +254,7 @@ async def get_temporal_client() -> Client:
     """
     return await _temporal_client_instance.get_client()
 
+
+def get_temporal_client_manager() -> TemporalClient:
+    """Get the global TemporalClient, for health checks and connection metrics."""
+    return _temporal_client_instance
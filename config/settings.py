@@ -12,6 +12,7 @@ Benefits of using Pydantic Settings over raw .env:
 - Environment files: Automatic .env file loading
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
@@ -35,12 +36,75 @@ class Settings(BaseSettings):
     temporal_host: str = "localhost:7233"
     temporal_namespace: str = "default"
     temporal_task_queue: str = "marketing-orchestrator-queue"
+    # Activities run on their own task queues (see activities/task_queues.py)
+    temporal_light_activity_task_queue: str = "marketing-orchestrator-light-activities"
+    temporal_heavy_activity_task_queue: str = "marketing-orchestrator-heavy-activities"
+
+    # Connection Health Configuration
+    # Check the connection this often (0 = off) and reconnect with
+    # exponential backoff while checks fail
+    temporal_health_check_interval_seconds: float = Field(default=30.0, ge=0)
+    temporal_health_check_timeout_seconds: float = Field(default=5.0, gt=0)
+    temporal_reconnect_backoff_initial_seconds: float = Field(default=1.0, gt=0)
+    temporal_reconnect_backoff_max_seconds: float = Field(default=60.0, gt=0)
+
+    # SDK Metrics Configuration
+    # Serve the Temporal SDK metrics (including the memo cache counters) for
+    # Prometheus at this host:port (unset = off). Processes started by
+    # workers.launcher add their slot number to the port.
+    temporal_metrics_bind_address: str | None = None
 
     # TLS Configuration (optional)
     temporal_tls_enabled: bool = False
     temporal_client_cert: str | None = None
     temporal_client_key: str | None = None
 
+    # Payload Codec Configuration
+    # Compress workflow/activity payloads of at least the threshold size.
+    # API and workers must use the same setting ("zstd" needs zstandard).
+    payload_codec: Literal["none", "zlib", "zstd"] = "none"
+    payload_codec_threshold_bytes: int = 4096
+    payload_codec_level: int | None = None
+    # Payloads of at least this size are (de)compressed in a thread (0 = never)
+    payload_codec_offload_threshold_bytes: int = Field(default=1048576, ge=0)
+
+    # Claim-check Configuration
+    # Activity result values of at least the threshold size are stored in the
+    # blob store and only a reference is passed through workflows. The local
+    # backend needs a directory shared by all workers.
+    claim_check_enabled: bool = False
+    claim_check_threshold_bytes: int = 128 * 1024
+    blob_store_backend: str = "local"
+    blob_store_path: str = ".blobstore"
+
+    # Memoization Cache Configuration
+    # Reuse results of deterministic generation activities with the same
+    # input and generator version. "memory" is per worker process, "sqlite"
+    # is shared by the worker processes of one host (TTL 0 = no expiry)
+    memo_cache_enabled: bool = False
+    memo_cache_backend: str = "memory"
+    memo_cache_path: str = ".memocache.sqlite3"
+    memo_cache_ttl_seconds: float = Field(default=7 * 24 * 3600, ge=0)
+    memo_cache_max_entries: int = Field(default=10000, ge=1)
+
+    # Worker Configuration
+    # Comma-separated pools this worker process runs: workflow, light, heavy
+    worker_pools: str = "workflow,light,heavy"
+    # Worker processes started by workers.launcher (0 = one per CPU)
+    worker_processes: int = 0
+    worker_graceful_shutdown_seconds: int = 30
+    # "manual" uses the limits below, "auto" derives them from the CPU count
+    # and the activity mix (see workers/tuning.py)
+    worker_tuning_mode: Literal["manual", "auto"] = "manual"
+    worker_max_concurrent_workflow_tasks: int = 100
+    worker_light_max_concurrent_activities: int = 100
+    worker_heavy_max_concurrent_activities: int = 10
+    worker_max_concurrent_workflow_task_polls: int = 5
+    worker_max_concurrent_activity_task_polls: int = 5
+    worker_max_cached_workflows: int = 1000
+    # Observed share of activity executions that are heavy, used in auto mode
+    worker_auto_heavy_activity_share: float | None = Field(default=None, ge=0, le=1)
+
     # Logging Configuration
     # Using Literal ensures only valid log levels are accepted
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
@@ -49,6 +113,76 @@ class Settings(BaseSettings):
     app_name: str = "marketing-orchestrator"
     app_version: str = "0.1.0"
 
+    # API Batch Configuration
+    # Requests a batch endpoint sends to Temporal at once, and batch size limit
+    api_batch_max_concurrency: int = Field(default=20, ge=1)
+    api_batch_max_items: int = Field(default=1000, ge=1)
+    # Query batch signals matching more workflows than this run as a
+    # server-side Temporal batch operation instead of from the API
+    api_batch_signal_operation_threshold: int = Field(default=1000, ge=0)
+
+    # Status Cache Configuration
+    # Workflow status lookups are cached this long (0 = no caching, but
+    # concurrent lookups are still coalesced) in an LRU of this many entries
+    status_cache_ttl_seconds: float = Field(default=2.0, ge=0)
+    status_cache_max_entries: int = Field(default=10000, ge=1)
+
+    # Server-Sent Events Configuration
+    # Keep-alive comment interval on idle event streams
+    sse_heartbeat_seconds: float = Field(default=15.0, gt=0)
+
+    # API Listing Configuration
+    # Largest page size for workflow listing; export streams pages of this size
+    api_list_max_page_size: int = Field(default=1000, ge=1)
+
+    # Research Sources Configuration
+    # Comma-separated sources (market_trends, audience_insights,
+    # competitor_analysis, historical_performance) the research brief waits
+    # for; the others are merged if they return before the summary
+    research_required_sources: str = "market_trends,audience_insights"
+
+    # Creative Generation Configuration
+    # Comma-separated generators (sms, image, video, email) that must be ready
+    # before creatives go to approval if the campaign uses them; the rest are
+    # added to the creatives awaiting approval as they finish
+    creative_required_channels: str = "sms,image,video,email"
+    # Cancel the other creatives as soon as a required generator fails
+    creative_fail_fast: bool = False
+    # Creatives generated per generator (A/B variants), and how many
+    # generations may run at once (0 = no limit)
+    creative_variants_per_channel: int = Field(default=1, ge=1)
+    creative_max_concurrent_generations: int = Field(default=0, ge=0)
+
+    # Measurements Polling Configuration
+    # "single" polls once; "continuous" keeps polling a live campaign for the
+    # duration, backing off from the minimum to the maximum interval while
+    # metrics grow less than the stable threshold (relative) per poll. The
+    # campaign is polled once per measurements stage; feedback rounds
+    # re-aggregate the polled totals. Continuous mode requires claim-check,
+    # which keeps the aggregation table out of history
+    measurements_polling_mode: Literal["single", "continuous"] = "single"
+    measurements_poll_duration_seconds: float = Field(default=7 * 24 * 3600, gt=0)
+    measurements_poll_min_interval_seconds: float = Field(default=60.0, gt=0)
+    measurements_poll_max_interval_seconds: float = Field(default=3600.0, gt=0)
+    measurements_poll_backoff_factor: float = Field(default=2.0, ge=1)
+    measurements_poll_stable_threshold: float = Field(default=0.01, ge=0)
+    # Continue as new after this many polls to keep history bounded
+    measurements_poll_continue_as_new_every: int = Field(default=100, ge=1)
+
+    # Revision Configuration
+    # Stage workflows continue as new after this many feedback rounds in one
+    # run, or once their event history grows past this many events
+    revision_max_rounds_per_run: int = 5
+    revision_max_history_events: int = 2000
+    revision_feedback_history_size: int = 10
+
+    # Orchestration Configuration
+    # Speculatively prepare the next stage while a stage awaits approval
+    orchestrator_pipelined_stages: bool = False
+    # Run single-activity sub-workflows as child workflows (per-step
+    # visibility) or call their activity directly from the parent stage
+    workflow_step_mode: Literal["child_workflow", "activity"] = "child_workflow"
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,10 @@
+"""Columnar campaign metrics aggregation."""
+
+from metrics.aggregation import METRIC_COLUMNS, KEY_COLUMNS, MetricTable, rollup
+
+__all__ = [
+    "METRIC_COLUMNS",
+    "KEY_COLUMNS",
+    "MetricTable",
+    "rollup",
+]
@@ -0,0 +1,249 @@
+"""Columnar, incremental campaign metrics aggregation.
+
+Metric rows (one per channel, creative and hour, or finer-grained events)
+are aggregated into a ``MetricTable``: NumPy arrays holding one row per
+(channel, creative_id, hour) group and one column per metric. Groups are
+kept sorted by their key, so merging new rows only groups those rows and
+looks them up in the existing groups with a binary search; the raw rows
+aggregated before are never touched again, and a stored table is restored
+without regrouping it. A poller feeds each poll's new rows into the table
+returned by the previous merge.
+
+Rows and tables travel between activities and workflows as plain column
+dicts (``{"channel": [...], "creative_id": [...], "hour": [...],
+"impressions": [...], ...}``), which serialise to compact JSON.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+KEY_COLUMNS = ("channel", "creative_id", "hour")
+METRIC_COLUMNS = ("impressions", "clicks", "conversions")
+PERCENTILES = (50, 95, 99)
+
+
+def _group_keys(channel: np.ndarray, creative_id: np.ndarray, hour: np.ndarray) -> np.ndarray:
+    """Sortable key of each (channel, creative_id, hour) group."""
+    if not len(hour):
+        return np.empty(0, dtype=str)
+    # Zero-padded hours sort numerically; the separator sorts before any
+    # character of an ID
+    return np.char.add(
+        np.char.add(np.char.add(channel.astype(str), "\x1f"), np.char.add(creative_id.astype(str), "\x1f")),
+        np.char.zfill(hour.astype(str), 20),
+    )
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise ratio, 0 where the denominator is 0."""
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.shape(numerator), dtype=np.float64),
+        where=denominator != 0,
+    )
+
+
+class MetricTable:
+    """Metric sums per (channel, creative_id, hour) group, stored column-wise.
+
+    Build tables of rows with ``from_columns``, which groups the rows and
+    sorts the groups, and restore stored tables with ``from_state``; the
+    constructor expects unique groups sorted by ``keys``.
+    """
+
+    def __init__(
+        self,
+        channel: np.ndarray,
+        creative_id: np.ndarray,
+        hour: np.ndarray,
+        values: np.ndarray,
+        keys: Optional[np.ndarray] = None,
+    ):
+        self.channel = channel
+        self.creative_id = creative_id
+        self.hour = hour
+        # One row per group, one column per entry of METRIC_COLUMNS
+        self.values = values
+        self.keys = _group_keys(channel, creative_id, hour) if keys is None else keys
+
+    def __len__(self) -> int:
+        return len(self.hour)
+
+    @classmethod
+    def empty(cls) -> "MetricTable":
+        return cls(
+            np.empty(0, dtype=object),
+            np.empty(0, dtype=object),
+            np.empty(0, dtype=np.int64),
+            np.empty((0, len(METRIC_COLUMNS)), dtype=np.int64),
+        )
+
+    @classmethod
+    def from_columns(cls, columns: Optional[Dict[str, Sequence[Any]]]) -> "MetricTable":
+        """Build a table from a column dict; missing metric columns count as 0."""
+        if not columns or not len(columns.get("hour", ())):
+            return cls.empty()
+
+        rows = len(columns["hour"])
+        values = np.zeros((rows, len(METRIC_COLUMNS)), dtype=np.int64)
+        for index, metric in enumerate(METRIC_COLUMNS):
+            if metric in columns:
+                values[:, index] = np.asarray(columns[metric], dtype=np.int64)
+
+        return cls._grouped(
+            np.asarray(columns.get("channel", ["all"] * rows), dtype=object),
+            np.asarray(columns.get("creative_id", ["all"] * rows), dtype=object),
+            np.asarray(columns["hour"], dtype=np.int64),
+            values,
+        )
+
+    @classmethod
+    def from_state(cls, columns: Optional[Dict[str, Sequence[Any]]]) -> "MetricTable":
+        """Rebuild a table from its ``to_columns`` dict without grouping it again.
+
+        The groups of a stored table are already unique and sorted, so this
+        costs one pass over the columns instead of a sort.
+        """
+        if not columns or not len(columns.get("hour", ())):
+            return cls.empty()
+
+        return cls(
+            np.asarray(columns["channel"], dtype=object),
+            np.asarray(columns["creative_id"], dtype=object),
+            np.asarray(columns["hour"], dtype=np.int64),
+            np.column_stack([np.asarray(columns[metric], dtype=np.int64) for metric in METRIC_COLUMNS]),
+        )
+
+    @classmethod
+    def _grouped(cls, channel: np.ndarray, creative_id: np.ndarray, hour: np.ndarray, values: np.ndarray) -> "MetricTable":
+        """Sum rows into one row per group, sorted by group key."""
+        # Encode each key column as integer codes, then combine them into
+        # one int64 group key so grouping is a single np.unique. Codes
+        # follow the sort order of the values, so the groups come out
+        # sorted by group key.
+        channel_values, channel_codes = np.unique(channel.astype(str), return_inverse=True)
+        creative_values, creative_codes = np.unique(creative_id.astype(str), return_inverse=True)
+        hour_values, hour_codes = np.unique(hour, return_inverse=True)
+        group_key = (channel_codes.astype(np.int64) * len(creative_values) + creative_codes) * len(hour_values) + hour_codes
+
+        keys, group_index = np.unique(group_key, return_inverse=True)
+        sums = np.zeros((len(keys), len(METRIC_COLUMNS)), dtype=np.int64)
+        for column in range(len(METRIC_COLUMNS)):
+            sums[:, column] = np.bincount(group_index, weights=values[:, column], minlength=len(keys))
+
+        hour_code = keys % len(hour_values)
+        creative_code = keys // len(hour_values) % len(creative_values)
+        channel_code = keys // (len(hour_values) * len(creative_values))
+        return cls(
+            channel_values[channel_code].astype(object),
+            creative_values[creative_code].astype(object),
+            hour_values[hour_code],
+            sums,
+        )
+
+    def to_columns(self) -> Dict[str, list]:
+        """Return the table as a JSON-serialisable column dict."""
+        columns = {
+            "channel": self.channel.tolist(),
+            "creative_id": self.creative_id.tolist(),
+            "hour": self.hour.tolist(),
+        }
+        for index, metric in enumerate(METRIC_COLUMNS):
+            columns[metric] = self.values[:, index].tolist()
+        return columns
+
+    def merge(self, rows: "MetricTable") -> "MetricTable":
+        """Return a new table with the rows (a table from ``from_columns``) added to their groups."""
+        if not len(rows):
+            return self
+
+        # Find each new group in the sorted existing groups
+        position = np.searchsorted(self.keys, rows.keys)
+        existing = position < len(self)
+        existing[existing] = self.keys[position[existing]] == rows.keys[existing]
+
+        values = self.values.copy()
+        values[position[existing]] += rows.values[existing]
+
+        # Insert the groups seen for the first time at their sorted positions
+        new = ~existing
+        at = position[new]
+        return MetricTable(
+            np.insert(self.channel, at, rows.channel[new]),
+            np.insert(self.creative_id, at, rows.creative_id[new]),
+            np.insert(self.hour, at, rows.hour[new]),
+            np.insert(values, at, rows.values[new], axis=0),
+            # Widen the fixed-width key strings so longer new keys aren't cut
+            np.insert(self.keys.astype(np.result_type(self.keys, rows.keys)), at, rows.keys[new]),
+        )
+
+    def totals(self) -> np.ndarray:
+        return self.values.sum(axis=0)
+
+    def group_by(self, column: str) -> Dict[str, Dict[str, Any]]:
+        """Metric totals with CTR and CVR per value of one key column."""
+        labels, codes = np.unique(getattr(self, column).astype(str), return_inverse=True)
+        sums = np.zeros((len(labels), len(METRIC_COLUMNS)), dtype=np.int64)
+        for index in range(len(METRIC_COLUMNS)):
+            sums[:, index] = np.bincount(codes, weights=self.values[:, index], minlength=len(labels))
+
+        impressions, clicks, conversions = sums.T
+        ctr = _ratio(clicks, impressions)
+        cvr = _ratio(conversions, clicks)
+        return {
+            label: {
+                **{metric: int(sums[row, index]) for index, metric in enumerate(METRIC_COLUMNS)},
+                "ctr": float(ctr[row]),
+                "cvr": float(cvr[row]),
+            }
+            for row, label in enumerate(labels.tolist())
+        }
+
+    def hourly_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles of hourly impressions, clicks, conversions and CTR."""
+        if not len(self):
+            return {}
+
+        hours, codes = np.unique(self.hour, return_inverse=True)
+        hourly = np.zeros((len(hours), len(METRIC_COLUMNS)), dtype=np.float64)
+        for index in range(len(METRIC_COLUMNS)):
+            hourly[:, index] = np.bincount(codes, weights=self.values[:, index], minlength=len(hours))
+
+        series = {metric: hourly[:, index] for index, metric in enumerate(METRIC_COLUMNS)}
+        series["ctr"] = _ratio(hourly[:, 1], hourly[:, 0])
+
+        return {
+            name: dict(zip((f"p{pct}" for pct in PERCENTILES), np.percentile(values, PERCENTILES).tolist()))
+            for name, values in series.items()
+        }
+
+
+def rollup(table: MetricTable, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Compute totals, rates, deltas versus previous totals and percentiles."""
+    totals = table.totals()
+    impressions, clicks, conversions = (int(value) for value in totals)
+
+    previous = previous or {}
+    previous_totals = np.array([previous.get(metric, 0) for metric in METRIC_COLUMNS], dtype=np.int64)
+    delta = totals - previous_totals
+    delta_pct = _ratio(delta.astype(np.float64), previous_totals)
+
+    return {
+        "totals": {
+            "impressions": impressions,
+            "clicks": clicks,
+            "conversions": conversions,
+            "ctr": clicks / impressions if impressions else 0.0,
+            "cvr": conversions / clicks if clicks else 0.0,
+        },
+        "delta_vs_previous": {
+            metric: {"absolute": int(delta[index]), "relative": float(delta_pct[index])}
+            for index, metric in enumerate(METRIC_COLUMNS)
+        },
+        "by_channel": table.group_by("channel"),
+        "by_creative": table.group_by("creative_id"),
+        "hourly_percentiles": table.hourly_percentiles(),
+        "groups": len(table),
+    }
@@ -65,5 +65,5 @@ echo ""
 echo "Press Ctrl+C to stop the worker"
 echo ""
 
-poetry run python -m workers.worker
+poetry run python -m workers.worker "$@"
 
@@ -1,62 +1,399 @@
 """Service layer for workflow operations."""
 
+import asyncio
+import base64
+import hashlib
 import logging
+import time
 import uuid
-from typing import Dict, Optional
-from temporalio.client import Client
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from temporalio.api.batch.v1 import BatchOperationSignal
+from temporalio.api.common.v1 import Payloads
+from temporalio.api.workflowservice.v1 import StartBatchOperationRequest
+from temporalio.client import (
+    Client,
+    WithStartWorkflowOperation,
+    WorkflowExecutionDescription,
+    WorkflowExecutionStatus,
+    WorkflowUpdateFailedError,
+    WorkflowUpdateStage,
+)
+from temporalio.common import WorkflowIDConflictPolicy, WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
 from client.temporal_client import get_temporal_client
 from config.settings import settings
+from workflows.approvals import STAGE_WORKFLOW_ID_SUFFIXES, SUBMIT_DECISION_UPDATE
+from workflows.stage_signals import QUEUE_STAGE_SIGNALS_SIGNAL, stage_for_signal
 
 logger = logging.getLogger(__name__)
 
+# Bytes of the query hash prefixed to page tokens
+PAGE_TOKEN_TAG_BYTES = 8
+
+# Status cache key prefix for campaign progress records
+PROGRESS_CACHE_PREFIX = "progress:"
+
+# Memo key marking campaigns whose research stage reports its first output
+NOTIFY_RESEARCH_OUTPUT_MEMO = "notify_research_output"
+
+
+class DecisionRejectedError(Exception):
+    """A stage rejected an approval decision, e.g. because it wasn't awaiting approval."""
+
+
+class CampaignConflictError(Exception):
+    """An existing campaign can't serve a request, e.g. because it was started in another mode."""
+
+
+class StatusCache:
+    """Short-lived LRU cache of workflow status lookups.
+
+    Concurrent lookups of the same key while it is being loaded share a
+    single load. A TTL of 0 disables caching but still coalesces
+    concurrent lookups.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, loading it at most once at a time."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            # Load in its own task so a cancelled request doesn't cancel it for the others
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._load_done(key, done))
+        return await asyncio.shield(task)
+
+    def _load_done(self, key: str, task: asyncio.Future) -> None:
+        # Not cached if invalidated while loading
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._store(key, task.result())
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop the cached value for key, and keep an in-flight load from caching it."""
+        self.invalidations += 1
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "max_entries": self.max_entries,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+        }
+
 
 class WorkflowService:
     """Service for managing workflows."""
 
     def __init__(self):
-        self._client: Optional[Client] = None
+        self.status_cache = StatusCache(
+            ttl_seconds=settings.status_cache_ttl_seconds,
+            max_entries=settings.status_cache_max_entries,
+        )
 
     async def get_client(self) -> Client:
-        """Get Temporal client."""
-        if self._client is None:
-            self._client = await get_temporal_client()
-        return self._client
+        """Get Temporal client.
 
-    def _generate_workflow_id(self, campaign_name: str) -> str:
+        Not cached here, so a reconnected client is picked up.
+        """
+        return await get_temporal_client()
+
+    def _generate_workflow_id(self, campaign_name: str, idempotency_key: Optional[str] = None) -> str:
         normalized_name = campaign_name.replace(" ", "-").lower()
+        if idempotency_key:
+            # Same key -> same workflow ID, so the server rejects duplicate starts
+            key_hash = hashlib.sha256(idempotency_key.encode("utf-8")).hexdigest()[:16]
+            return f"{normalized_name}-{key_hash}"
         short_uuid = str(uuid.uuid4())[:8]
         return f"{normalized_name}-{short_uuid}"
 
-    async def start_workflow(self, request) -> Dict[str, str]:
-        client = await self.get_client()
-        workflow_id = self._generate_workflow_id(request.campaign_name)
-        workflow_type = "MarketingOrchestratorWorkflow"
-        task_queue = settings.temporal_task_queue
-
-        # Build workflow input
-        workflow_input = {
+    @staticmethod
+    def _workflow_input(request) -> Dict[str, Any]:
+        return {
             "campaign_name": request.campaign_name,
             "budget": request.budget,
             "objectives": request.objectives,
             "channels": request.channels,
         }
 
+    @staticmethod
+    def _stage_signals_request(request) -> Optional[Dict[str, Any]]:
+        """Build the queue_stage_signals payload for a start request's initial signals.
+
+        Raises ValueError if a signal can't be matched to a stage.
+        """
+        initial_signals = getattr(request, "initial_signals", None)
+        if not initial_signals:
+            return None
+        return {
+            # Lets the orchestrator ignore the signals of a retried keyed start
+            "request_id": getattr(request, "idempotency_key", None),
+            "signals": [
+                {
+                    "stage": stage_for_signal(signal.signal_name, signal.stage),
+                    "signal_name": signal.signal_name,
+                    "signal_input": signal.signal_input,
+                }
+                for signal in initial_signals
+            ],
+        }
+
+    async def start_workflow(self, request) -> Dict[str, Any]:
+        """Start a campaign workflow.
+
+        Initial signals are sent in the same request with signal-with-start.
+        """
+        client = await self.get_client()
+        idempotency_key = getattr(request, "idempotency_key", None)
+        workflow_id = self._generate_workflow_id(request.campaign_name, idempotency_key)
+        workflow_type = "MarketingOrchestratorWorkflow"
+        task_queue = settings.temporal_task_queue
+
+        # Build workflow input
+        workflow_input = self._workflow_input(request)
+        stage_signals = self._stage_signals_request(request)
+
         logger.info(f"Starting workflow: {workflow_type} with ID: {workflow_id}")
         logger.info(f"Campaign: {request.campaign_name}, Budget: {request.budget}")
         logger.info(f"Task queue: {task_queue}")
 
-        handle = await client.start_workflow(
-            workflow_type,
-            workflow_input,
+        start_options: Dict[str, Any] = {}
+        running_run_id: Optional[str] = None
+        if stage_signals is not None:
+            logger.info(f"Starting with {len(stage_signals['signals'])} initial stage signals")
+            start_options = {
+                "start_signal": QUEUE_STAGE_SIGNALS_SIGNAL,
+                "start_signal_args": [stage_signals],
+            }
+            if idempotency_key:
+                # Signal-with-start signals a running workflow instead of
+                # failing, so check for one to report a retried start
+                running = await self._running_workflow(client, workflow_id)
+                running_run_id = running.run_id if running is not None else None
+
+        try:
+            handle = await client.start_workflow(
+                workflow_type,
+                workflow_input,
+                id=workflow_id,
+                task_queue=task_queue,
+                # Keyed campaigns are never started twice, even after they close
+                id_reuse_policy=(
+                    WorkflowIDReusePolicy.REJECT_DUPLICATE if idempotency_key
+                    else WorkflowIDReusePolicy.ALLOW_DUPLICATE
+                ),
+                **start_options,
+            )
+        except WorkflowAlreadyStartedError as e:
+            if not idempotency_key:
+                raise
+            run_id = e.run_id
+            if run_id is None:
+                run_id = (await client.get_workflow_handle(workflow_id).describe()).run_id
+            logger.info(f"Workflow already started for idempotency key: {workflow_id}, run_id: {run_id}")
+            self._invalidate_status(workflow_id)
+            return {
+                "workflow_id": workflow_id,
+                "run_id": run_id,
+                "already_started": True,
+            }
+
+        already_started = running_run_id is not None and handle.result_run_id == running_run_id
+        if already_started:
+            logger.info(f"Workflow already started for idempotency key: {workflow_id}, run_id: {running_run_id}")
+        else:
+            logger.info(f"Workflow started: {workflow_id}, run_id: {handle.result_run_id}")
+        self._invalidate_status(workflow_id)
+
+        return {
+            "workflow_id": handle.id,
+            "run_id": handle.result_run_id,
+            "already_started": already_started,
+        }
+
+    @staticmethod
+    async def _running_workflow(client: Client, workflow_id: str) -> Optional[WorkflowExecutionDescription]:
+        """Return the description of a running workflow with this ID, if any."""
+        try:
+            description = await client.get_workflow_handle(workflow_id).describe()
+        except RPCError as e:
+            if e.status != RPCStatusCode.NOT_FOUND:
+                raise
+            return None
+        if description.status != WorkflowExecutionStatus.RUNNING:
+            return None
+        return description
+
+    async def start_workflow_and_await_research(self, request) -> Dict[str, Any]:
+        """Start a campaign and wait for its first research output, with update-with-start.
+
+        The start and the wait_for_research_output update go to the server in
+        one request. Initial signals follow as a separate signal once the
+        update is accepted. With an idempotency key, a retry attaches to the
+        running campaign instead of starting a new one, and a retry after the
+        campaign closed reports it as already started without research output.
+
+        Raises CampaignConflictError if the key's running campaign was not
+        started by this method, since its research stage doesn't report its
+        first output.
+        """
+        client = await self.get_client()
+        idempotency_key = getattr(request, "idempotency_key", None)
+        workflow_id = self._generate_workflow_id(request.campaign_name, idempotency_key)
+        stage_signals = self._stage_signals_request(request)
+
+        logger.info(f"Starting workflow with research output update: {workflow_id}")
+
+        running_run_id: Optional[str] = None
+        if idempotency_key:
+            # A running campaign is reused instead of failing the start, so
+            # check for one to report a retried start
+            running = await self._running_workflow(client, workflow_id)
+            if running is not None:
+                if not (await running.memo()).get(NOTIFY_RESEARCH_OUTPUT_MEMO):
+                    raise CampaignConflictError(
+                        f"Campaign {workflow_id} is already running and was started without waiting "
+                        "for research output, so its research output can't be awaited"
+                    )
+                running_run_id = running.run_id
+
+        start_operation = WithStartWorkflowOperation(
+            "MarketingOrchestratorWorkflow",
+            args=[self._workflow_input(request), {"notify_research_output": True}],
             id=workflow_id,
-            task_queue=task_queue,
+            task_queue=settings.temporal_task_queue,
+            memo={NOTIFY_RESEARCH_OUTPUT_MEMO: True},
+            id_conflict_policy=(
+                WorkflowIDConflictPolicy.USE_EXISTING if idempotency_key
+                else WorkflowIDConflictPolicy.FAIL
+            ),
+            # Keyed campaigns are never started twice, even after they close
+            id_reuse_policy=(
+                WorkflowIDReusePolicy.REJECT_DUPLICATE if idempotency_key
+                else WorkflowIDReusePolicy.ALLOW_DUPLICATE
+            ),
         )
+        try:
+            update_handle = await client.start_update_with_start_workflow(
+                "wait_for_research_output",
+                start_workflow_operation=start_operation,
+                wait_for_stage=WorkflowUpdateStage.ACCEPTED,
+            )
+        except WorkflowAlreadyStartedError as e:
+            # Only a closed keyed campaign gets here; there is no research
+            # output left to wait for
+            if not idempotency_key:
+                raise
+            run_id = e.run_id
+            if run_id is None:
+                run_id = (await client.get_workflow_handle(workflow_id).describe()).run_id
+            logger.info(f"Workflow already started for idempotency key: {workflow_id}, run_id: {run_id}")
+            self._invalidate_status(workflow_id)
+            return {
+                "workflow_id": workflow_id,
+                "run_id": run_id,
+                "already_started": True,
+                "research_outputs": None,
+            }
+        handle = await start_operation.workflow_handle()
+        already_started = running_run_id is not None and handle.result_run_id == running_run_id
+        if already_started:
+            logger.info(f"Workflow already started for idempotency key: {workflow_id}, run_id: {running_run_id}")
+        self._invalidate_status(workflow_id)
+
+        if stage_signals is not None:
+            await handle.signal(QUEUE_STAGE_SIGNALS_SIGNAL, stage_signals)
 
-        logger.info(f"Workflow started: {workflow_id}, run_id: {handle.result_run_id}")
+        research_outputs = await update_handle.result()
+        logger.info(f"Research output ready for workflow: {workflow_id}")
 
         return {
             "workflow_id": handle.id,
             "run_id": handle.result_run_id,
+            "already_started": already_started,
+            "research_outputs": research_outputs,
+        }
+
+    async def start_workflows(self, requests: List[Any]) -> Dict[str, Any]:
+        """Start many workflows concurrently, reporting a result per request.
+
+        At most ``settings.api_batch_max_concurrency`` starts are in flight at
+        once. A failed start does not affect the others.
+        """
+        semaphore = asyncio.Semaphore(settings.api_batch_max_concurrency)
+
+        async def start_one(index: int, request) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await self.start_workflow(request)
+                except Exception as e:
+                    logger.error(f"Error starting batch item {index} ({request.campaign_name}): {e}")
+                    return {"index": index, "status": "failed", "error": str(e)}
+            status = "already_started" if result["already_started"] else "started"
+            return {
+                "index": index,
+                "status": status,
+                "workflow_id": result["workflow_id"],
+                "run_id": result["run_id"],
+            }
+
+        logger.info(f"Starting batch of {len(requests)} workflows")
+        results = await asyncio.gather(*(start_one(i, r) for i, r in enumerate(requests)))
+        failed = sum(1 for result in results if result["status"] == "failed")
+        logger.info(f"Batch start finished: {len(results) - failed} started, {failed} failed")
+
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
         }
 
     async def send_signal(self, workflow_id: str, signal_name: str, signal_input=None) -> Dict[str, str]:
@@ -70,7 +407,11 @@ class WorkflowService:
         handle = client.get_workflow_handle(workflow_id)
 
         # Send the signal
-        await handle.signal(signal_name, signal_input)
+        try:
+            await handle.signal(signal_name, signal_input)
+        finally:
+            # The signal may have changed the workflow's state
+            self._invalidate_status(workflow_id)
 
         logger.info(f"Signal '{signal_name}' sent successfully to workflow: {workflow_id}")
 
@@ -79,20 +420,126 @@ class WorkflowService:
             "signal_name": signal_name,
         }
 
-    async def list_workflows(
-        self,
-        limit: int = 10,
-        workflow_type: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> dict:
+    async def send_signals(self, signals: List[Any]) -> Dict[str, Any]:
+        """Send many signals concurrently, reporting a result per target.
+
+        Each item needs ``workflow_id``, ``signal_name`` and ``signal_input``.
+        At most ``settings.api_batch_max_concurrency`` signals are in flight.
+        """
+        semaphore = asyncio.Semaphore(settings.api_batch_max_concurrency)
+
+        async def signal_one(item) -> Dict[str, Any]:
+            result = {"workflow_id": item.workflow_id, "signal_name": item.signal_name}
+            async with semaphore:
+                try:
+                    await self.send_signal(item.workflow_id, item.signal_name, item.signal_input)
+                except Exception as e:
+                    logger.error(f"Error sending signal '{item.signal_name}' to {item.workflow_id}: {e}")
+                    return {**result, "status": "failed", "error": str(e)}
+            return {**result, "status": "sent"}
+
+        logger.info(f"Sending batch of {len(signals)} signals")
+        results = await asyncio.gather(*(signal_one(item) for item in signals))
+        failed = sum(1 for result in results if result["status"] == "failed")
+        logger.info(f"Batch signal finished: {len(results) - failed} sent, {failed} failed")
+
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "batch_job_id": None,
+        }
+
+    async def signal_workflows_by_query(self, query: str, signal_name: str, signal_input=None) -> Dict[str, Any]:
+        """Signal every running workflow matching a visibility query.
+
+        Up to ``settings.api_batch_signal_operation_threshold`` matches are
+        signalled from the API with per-target results. Larger sets are handed
+        to a server-side Temporal batch operation and only its job ID is
+        returned.
+        """
         client = await self.get_client()
+        query = f"({query}) AND ExecutionStatus='Running'"
+
+        count = (await client.count_workflows(query)).count
+        logger.info(f"Visibility query matched {count} running workflows: {query}")
+
+        if count > settings.api_batch_signal_operation_threshold:
+            job_id = str(uuid.uuid4())
+            payloads = await client.data_converter.encode([signal_input])
+            await client.workflow_service.start_batch_operation(
+                StartBatchOperationRequest(
+                    namespace=client.namespace,
+                    visibility_query=query,
+                    job_id=job_id,
+                    reason=f"Batch signal '{signal_name}' from {settings.app_name}",
+                    signal_operation=BatchOperationSignal(
+                        signal=signal_name,
+                        input=Payloads(payloads=payloads),
+                        identity=client.identity,
+                    ),
+                )
+            )
+            logger.info(f"Started batch operation {job_id} to signal '{signal_name}' to {count} workflows")
+            return {
+                "results": [],
+                "succeeded": 0,
+                "failed": 0,
+                "batch_job_id": job_id,
+            }
 
-        # Enforce maximum limit
-        limit = min(limit, 100)
+        targets = [
+            SimpleNamespace(workflow_id=workflow.id, signal_name=signal_name, signal_input=signal_input)
+            async for workflow in client.list_workflows(query)
+        ]
+        return await self.send_signals(targets)
 
-        logger.info(f"Listing workflows with limit: {limit}, type: {workflow_type}, status: {status}")
+    async def submit_decision(
+        self,
+        workflow_id: str,
+        stage: str,
+        decision: str,
+        feedback: str = "",
+        targets: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Approve, reject or give feedback on a campaign stage with an update.
+
+        Returns once the stage has taken the decision. Raises
+        DecisionRejectedError if the stage isn't running or isn't awaiting
+        approval. ``targets`` limits creative feedback to those creatives.
+        """
+        client = await self.get_client()
+        stage_workflow_id = f"{workflow_id}-{STAGE_WORKFLOW_ID_SUFFIXES[stage]}"
+
+        logger.info(f"Submitting '{decision}' decision to workflow: {stage_workflow_id}")
+
+        handle = client.get_workflow_handle(stage_workflow_id)
+        try:
+            result = await handle.execute_update(
+                SUBMIT_DECISION_UPDATE,
+                {"decision": decision, "feedback": feedback, "targets": targets},
+            )
+        except WorkflowUpdateFailedError as e:
+            reason = e.cause.message if getattr(e.cause, "message", None) else str(e)
+            logger.warning(f"Decision rejected by {stage_workflow_id}: {reason}")
+            raise DecisionRejectedError(reason)
+        except RPCError as e:
+            if e.status != RPCStatusCode.NOT_FOUND:
+                raise
+            raise DecisionRejectedError(f"The {stage} stage of {workflow_id} is not running")
+        finally:
+            self._invalidate_status(stage_workflow_id)
+            self._invalidate_status(workflow_id)
+
+        logger.info(f"Decision '{decision}' accepted by workflow: {stage_workflow_id}")
 
-        # Build query filter
+        return {
+            "workflow_id": workflow_id,
+            "stage_workflow_id": stage_workflow_id,
+            **result,
+        }
+
+    def _build_list_query(self, workflow_type: Optional[str] = None, status: Optional[str] = None) -> str:
         query_parts = []
 
         if workflow_type:
@@ -101,32 +548,149 @@ class WorkflowService:
         if status:
             query_parts.append(f"ExecutionStatus='{status}'")
 
-        query = " AND ".join(query_parts) if query_parts else ""
+        return " AND ".join(query_parts) if query_parts else ""
 
-        workflows = []
+    @staticmethod
+    def _workflow_info(workflow) -> Dict[str, Any]:
+        return {
+            "workflow_id": workflow.id,
+            "run_id": workflow.run_id,
+            "workflow_type": workflow.workflow_type,
+            "status": workflow.status.name,
+            "start_time": workflow.start_time.isoformat() if workflow.start_time else None,
+        }
 
-        # List workflow executions with filters
-        async for workflow in client.list_workflows(query):
-            if len(workflows) >= limit:
-                break
+    @staticmethod
+    def _encode_page_token(query: str, server_token: Optional[bytes]) -> Optional[str]:
+        """Wrap the server's page token, tagged with the query it belongs to."""
+        if not server_token:
+            return None
+        query_tag = hashlib.sha256(query.encode("utf-8")).digest()[:PAGE_TOKEN_TAG_BYTES]
+        return base64.urlsafe_b64encode(query_tag + server_token).decode("ascii")
+
+    @staticmethod
+    def _decode_page_token(query: str, page_token: str) -> bytes:
+        """Unwrap a page token, checking it was issued for the same filters."""
+        try:
+            raw = base64.urlsafe_b64decode(page_token.encode("ascii"))
+        except (ValueError, UnicodeEncodeError):
+            raise ValueError("Invalid page token")
+        query_tag = hashlib.sha256(query.encode("utf-8")).digest()[:PAGE_TOKEN_TAG_BYTES]
+        if len(raw) <= PAGE_TOKEN_TAG_BYTES or raw[:PAGE_TOKEN_TAG_BYTES] != query_tag:
+            raise ValueError("Page token does not match the requested filters")
+        return raw[PAGE_TOKEN_TAG_BYTES:]
 
-            workflow_info = {
-                "workflow_id": workflow.id,
-                "run_id": workflow.run_id,
-                "workflow_type": workflow.workflow_type,
-                "status": workflow.status.name,
-                "start_time": workflow.start_time.isoformat() if workflow.start_time else None,
-            }
-            workflows.append(workflow_info)
+    async def list_workflows(
+        self,
+        limit: int = 10,
+        workflow_type: Optional[str] = None,
+        status: Optional[str] = None,
+        page_token: Optional[str] = None,
+    ) -> dict:
+        """List one page of workflows.
+
+        ``limit`` is the page size and is passed to the server, and
+        ``page_token`` resumes after the previous page, so every page costs a
+        single visibility request. Raises ValueError for an invalid token.
+        """
+        client = await self.get_client()
+
+        # Enforce maximum page size
+        limit = min(limit, settings.api_list_max_page_size)
+
+        logger.info(f"Listing workflows with limit: {limit}, type: {workflow_type}, status: {status}")
+
+        query = self._build_list_query(workflow_type, status)
+        next_page_token = self._decode_page_token(query, page_token) if page_token else None
+
+        # Fetch exactly one page from the server
+        iterator = client.list_workflows(query, page_size=limit, next_page_token=next_page_token)
+        await iterator.fetch_next_page()
+        workflows = [self._workflow_info(workflow) for workflow in iterator.current_page or []]
 
         logger.info(f"Retrieved {len(workflows)} workflows")
 
         return {
             "workflows": workflows,
             "count": len(workflows),
+            "next_page_token": self._encode_page_token(query, iterator.next_page_token),
         }
 
+    async def stream_workflows(
+        self,
+        workflow_type: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every matching workflow, fetching pages from the server as needed."""
+        client = await self.get_client()
+        query = self._build_list_query(workflow_type, status)
+
+        logger.info(f"Exporting workflows with type: {workflow_type}, status: {status}")
+
+        count = 0
+        async for workflow in client.list_workflows(query, page_size=settings.api_list_max_page_size):
+            count += 1
+            yield self._workflow_info(workflow)
+
+        logger.info(f"Exported {count} workflows")
+
     async def get_workflow_status(self, workflow_id: str) -> dict:
+        """Get a workflow's status, served from the status cache when fresh."""
+        return await self.status_cache.get_or_load(
+            workflow_id,
+            lambda: self._describe_workflow(workflow_id),
+        )
+
+    async def get_campaign_progress(self, workflow_id: str) -> dict:
+        """Get a campaign's progress record from the orchestrator's status query.
+
+        Served from the status cache when fresh.
+        """
+        progress = await self.status_cache.get_or_load(
+            f"{PROGRESS_CACHE_PREFIX}{workflow_id}",
+            lambda: self._query_campaign_progress(workflow_id),
+        )
+        return {
+            "workflow_id": workflow_id,
+            "progress": progress,
+        }
+
+    async def _query_campaign_progress(self, workflow_id: str) -> Dict[str, Any]:
+        client = await self.get_client()
+
+        logger.info(f"Querying progress of campaign: {workflow_id}")
+
+        handle = client.get_workflow_handle(workflow_id)
+        return await handle.query("get_campaign_status")
+
+    async def get_campaign_progress_batch(self, workflow_ids: List[str]) -> Dict[str, Any]:
+        """Get the progress of many campaigns concurrently, reporting a result per campaign."""
+        semaphore = asyncio.Semaphore(settings.api_batch_max_concurrency)
+
+        async def progress_one(workflow_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await self.get_campaign_progress(workflow_id)
+                except Exception as e:
+                    logger.error(f"Error getting progress of campaign {workflow_id}: {e}")
+                    return {"workflow_id": workflow_id, "status": "failed", "error": str(e)}
+            return {**result, "status": "ok"}
+
+        logger.info(f"Getting progress of {len(workflow_ids)} campaigns")
+        results = await asyncio.gather(*(progress_one(workflow_id) for workflow_id in workflow_ids))
+        failed = sum(1 for result in results if result["status"] == "failed")
+
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+        }
+
+    def _invalidate_status(self, workflow_id: str) -> None:
+        self.status_cache.invalidate(workflow_id)
+        self.status_cache.invalidate(f"{PROGRESS_CACHE_PREFIX}{workflow_id}")
+
+    async def _describe_workflow(self, workflow_id: str) -> dict:
         client = await self.get_client()
 
         logger.info(f"Getting status for workflow: {workflow_id}")
@@ -0,0 +1,194 @@
+"""Campaign stage events, streamed from the orchestrator's history.
+
+One watcher per campaign long-polls the orchestrator workflow's event
+history and turns it into stage events. Every client subscribed to that
+campaign is fed by that watcher, so the number of Temporal calls doesn't
+grow with the number of connected clients. The watcher stops once its last
+subscriber leaves.
+
+Events:
+- campaign_started / campaign_completed / campaign_failed
+- stage_started / stage_completed / stage_failed (stage child workflows)
+- stage_awaiting_approval / stage_revising / stage_approved (reported by
+  the stage workflows through the stage_progress signal)
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import HistoryEvent
+from temporalio.client import Client
+
+from client.temporal_client import get_temporal_client
+from workflows.approvals import STAGE_WORKFLOW_ID_SUFFIXES
+from workflows.progress import STAGE_PROGRESS_SIGNAL
+
+logger = logging.getLogger(__name__)
+
+# Stage child workflow ID suffix -> stage name
+STAGE_CHILD_SUFFIXES = {suffix: stage for stage, suffix in STAGE_WORKFLOW_ID_SUFFIXES.items()}
+
+CHILD_EVENTS = {
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_STARTED: (
+        "stage_started", "child_workflow_execution_started_event_attributes"),
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_COMPLETED: (
+        "stage_completed", "child_workflow_execution_completed_event_attributes"),
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_FAILED: (
+        "stage_failed", "child_workflow_execution_failed_event_attributes"),
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_CANCELED: (
+        "stage_failed", "child_workflow_execution_canceled_event_attributes"),
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_TIMED_OUT: (
+        "stage_failed", "child_workflow_execution_timed_out_event_attributes"),
+    EventType.EVENT_TYPE_CHILD_WORKFLOW_EXECUTION_TERMINATED: (
+        "stage_failed", "child_workflow_execution_terminated_event_attributes"),
+}
+
+CAMPAIGN_EVENTS = {
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED: "campaign_started",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED: "campaign_completed",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED: "campaign_failed",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CANCELED: "campaign_failed",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TIMED_OUT: "campaign_failed",
+    EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED: "campaign_failed",
+}
+
+
+class WorkflowEventWatcher:
+    """Watches one campaign's history and fans its stage events out to subscribers."""
+
+    def __init__(self, client: Client, workflow_id: str):
+        self.client = client
+        self.workflow_id = workflow_id
+        # Every event so far, replayed to subscribers that join late
+        self.events: List[Dict[str, Any]] = []
+        self.done = False
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Add a subscriber; its queue gets every event, then None at the end."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for event in self.events:
+            queue.put_nowait(event)
+        if self.done:
+            queue.put_nowait(None)
+        self._subscribers.add(queue)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    def _publish(self, event: Optional[Dict[str, Any]]) -> None:
+        if event is not None:
+            self.events.append(event)
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    async def _watch(self) -> None:
+        logger.info(f"Watching events of workflow: {self.workflow_id}")
+        handle = self.client.get_workflow_handle(self.workflow_id)
+        try:
+            # Long-polls for new events until the workflow closes
+            async for history_event in handle.fetch_history_events(wait_new_event=True):
+                event = await self._to_stage_event(history_event)
+                if event is not None:
+                    self._publish(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error watching workflow {self.workflow_id}: {e}")
+            self._publish({"event": "watch_failed", "workflow_id": self.workflow_id, "error": str(e)})
+        finally:
+            self.done = True
+            self._publish(None)
+            logger.info(f"Stopped watching workflow: {self.workflow_id}")
+
+    async def _to_stage_event(self, history_event: HistoryEvent) -> Optional[Dict[str, Any]]:
+        """Convert an orchestrator history event to a stage event, if it is one."""
+        event: Dict[str, Any] = {
+            "workflow_id": self.workflow_id,
+            "event_id": history_event.event_id,
+            "timestamp": history_event.event_time.ToDatetime().isoformat() + "Z",
+        }
+
+        if history_event.event_type in CAMPAIGN_EVENTS:
+            return {"event": CAMPAIGN_EVENTS[history_event.event_type], **event}
+
+        if history_event.event_type in CHILD_EVENTS:
+            name, attributes = CHILD_EVENTS[history_event.event_type]
+            child_id = getattr(history_event, attributes).workflow_execution.workflow_id
+            suffix = child_id[len(self.workflow_id) + 1:]
+            if not child_id.startswith(f"{self.workflow_id}-") or suffix not in STAGE_CHILD_SUFFIXES:
+                return None
+            return {"event": name, "stage": STAGE_CHILD_SUFFIXES[suffix], **event}
+
+        if history_event.event_type == EventType.EVENT_TYPE_WORKFLOW_EXECUTION_SIGNALED:
+            attributes = history_event.workflow_execution_signaled_event_attributes
+            if attributes.signal_name != STAGE_PROGRESS_SIGNAL:
+                return None
+            stage, state, revision_round = await self.client.data_converter.decode(attributes.input.payloads)
+            return {"event": f"stage_{state}", "stage": stage, "revision_round": revision_round, **event}
+
+        return None
+
+
+class WorkflowEventHub:
+    """Keeps one shared watcher per watched workflow."""
+
+    def __init__(self):
+        self._watchers: Dict[str, WorkflowEventWatcher] = {}
+
+    @property
+    def watcher_count(self) -> int:
+        return len(self._watchers)
+
+    async def events(
+        self,
+        workflow_id: str,
+        heartbeat_seconds: Optional[float] = None,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """Yield a workflow's stage events until it closes.
+
+        If heartbeat_seconds is set, None is yielded whenever no event arrived
+        for that long, so callers can keep idle connections alive.
+        """
+        watcher = self._watchers.get(workflow_id)
+        if watcher is None or watcher.done:
+            watcher = WorkflowEventWatcher(await get_temporal_client(), workflow_id)
+            self._watchers[workflow_id] = watcher
+
+        queue = watcher.subscribe()
+        logger.info(f"Subscribed to workflow {workflow_id} events ({watcher.subscriber_count} subscribers)")
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            watcher.unsubscribe(queue)
+            if watcher.subscriber_count == 0:
+                watcher.stop()
+                if self._watchers.get(workflow_id) is watcher:
+                    del self._watchers[workflow_id]
+
+
+# Global event hub instance
+workflow_event_hub = WorkflowEventHub()
@@ -0,0 +1,30 @@
+"""Blob storage and claim-check helpers for large activity results."""
+
+from storage.blob_store import BlobStore, LocalFileBlobStore, get_blob_store, register_blob_store_backend
+from storage.claim_check import offload_large_values, resolve_claim_checks, is_claim_check
+from storage.memo_cache import (
+    MemoCache,
+    InMemoryMemoCache,
+    SqliteMemoCache,
+    get_memo_cache,
+    memo_cache_stats,
+    memoized,
+    register_memo_cache_backend,
+)
+
+__all__ = [
+    "BlobStore",
+    "LocalFileBlobStore",
+    "get_blob_store",
+    "register_blob_store_backend",
+    "offload_large_values",
+    "resolve_claim_checks",
+    "is_claim_check",
+    "MemoCache",
+    "InMemoryMemoCache",
+    "SqliteMemoCache",
+    "get_memo_cache",
+    "memo_cache_stats",
+    "memoized",
+    "register_memo_cache_backend",
+]
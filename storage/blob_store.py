@@ -0,0 +1,107 @@
+"""Content-addressed blob stores.
+
+Blobs are keyed by the SHA-256 of their content, so storing the same content
+twice is a no-op and identical creatives or research documents are only kept
+once. Backends are pluggable: register a factory under a name with
+``register_blob_store_backend`` and select it with ``BLOB_STORE_BACKEND``.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStore(ABC):
+    """Content-addressed blob store."""
+
+    @staticmethod
+    def content_key(data: bytes) -> str:
+        """Return the content address for a blob."""
+        return hashlib.sha256(data).hexdigest()
+
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Store a blob and return its key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        """Load a blob by key. Raises KeyError if it does not exist."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check whether a blob exists."""
+
+
+class LocalFileBlobStore(BlobStore):
+    """Blob store backed by a local (or mounted shared) directory."""
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        # Fan out into subdirectories to keep directory sizes reasonable
+        return self.root / key[:2] / key
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so readers never see partial blobs
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _read(self, key: str) -> bytes:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    async def put(self, data: bytes) -> str:
+        key = self.content_key(data)
+        await asyncio.to_thread(self._write, key, data)
+        return key
+
+    async def get(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._read, key)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).exists)
+
+
+_backends: Dict[str, Callable[[], BlobStore]] = {
+    "local": lambda: LocalFileBlobStore(settings.blob_store_path),
+}
+_stores: Dict[str, BlobStore] = {}
+
+
+def register_blob_store_backend(name: str, factory: Callable[[], BlobStore]) -> None:
+    """Register a blob store backend factory under a name."""
+    _backends[name] = factory
+    _stores.pop(name, None)
+
+
+def get_blob_store(backend: str | None = None) -> BlobStore:
+    """Get the blob store for a backend (the configured one by default)."""
+    backend = backend or settings.blob_store_backend
+    if backend not in _stores:
+        if backend not in _backends:
+            raise ValueError(f"Unknown blob store backend: {backend}")
+        _stores[backend] = _backends[backend]()
+        logger.info(f"Initialized '{backend}' blob store")
+    return _stores[backend]
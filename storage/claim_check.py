@@ -0,0 +1,72 @@
+"""Claim-check offloading of large activity results.
+
+Activities pass large result values through ``offload_large_values`` before
+returning them. Any top-level value whose JSON encoding reaches
+``CLAIM_CHECK_THRESHOLD_BYTES`` is written to the blob store and replaced by a
+small reference, so only the reference travels through workflow histories.
+Activities that actually need the content call ``resolve_claim_checks`` on
+their input; everything else passes references along untouched.
+"""
+
+import json
+import logging
+from typing import Any, Dict
+
+from config.settings import settings
+from storage.blob_store import get_blob_store
+
+logger = logging.getLogger(__name__)
+
+CLAIM_CHECK_KEY = "$claim_check"
+
+
+def is_claim_check(value: Any) -> bool:
+    """Check whether a value is a claim-check reference."""
+    return isinstance(value, dict) and len(value) == 1 and CLAIM_CHECK_KEY in value
+
+
+def canonical_json(value: Any) -> bytes:
+    """Encode a value as canonical JSON, so equal values always get the same key."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+async def offload_large_values(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace large top-level values of an activity result with references."""
+    if not settings.claim_check_enabled:
+        return result
+
+    store = get_blob_store()
+    offloaded = {}
+    for name, value in result.items():
+        if is_claim_check(value):
+            offloaded[name] = value
+            continue
+
+        data = canonical_json(value)
+        if len(data) < settings.claim_check_threshold_bytes:
+            offloaded[name] = value
+            continue
+
+        key = await store.put(data)
+        logger.info(f"Offloaded '{name}' ({len(data)} bytes) to blob {key}")
+        offloaded[name] = {
+            CLAIM_CHECK_KEY: {
+                "backend": settings.blob_store_backend,
+                "key": key,
+                "size": len(data),
+            }
+        }
+    return offloaded
+
+
+async def resolve_claim_checks(value: Any) -> Any:
+    """Replace claim-check references anywhere in a value with their content."""
+    if is_claim_check(value):
+        ref = value[CLAIM_CHECK_KEY]
+        data = await get_blob_store(ref["backend"]).get(ref["key"])
+        return json.loads(data)
+    if isinstance(value, dict):
+        return {name: await resolve_claim_checks(item) for name, item in value.items()}
+    if isinstance(value, list):
+        return [await resolve_claim_checks(item) for item in value]
+    return value
@@ -0,0 +1,293 @@
+"""Memoization cache for deterministic activities.
+
+Generation activities are deterministic functions of their input and the
+generator (model/prompt) version, so reruns and duplicate campaign variants
+can reuse an earlier result. ``memoized`` caches an activity's result under
+the SHA-256 of its canonical JSON input, the activity name and a version
+string; bump the version whenever the generator changes. Inputs still
+holding claim-check references hash by those references, which are content
+addresses themselves, so large inputs aren't loaded just to compute a key.
+
+Backends are pluggable like the blob stores: "memory" is an LRU per worker
+process and "sqlite" is a file shared by the worker processes of one host.
+Register others with ``register_memo_cache_backend`` and select them with
+``MEMO_CACHE_BACKEND``. Both built-in backends expire entries after
+``MEMO_CACHE_TTL_SECONDS`` and evict the least recently used entries beyond
+``MEMO_CACHE_MAX_ENTRIES``.
+
+Hit, miss, set, eviction and error counts are available from
+``memo_cache_stats()`` and, inside activities, are also recorded on the
+activity's Temporal metric meter as ``memo_cache_<counter>`` counters, so
+they are exported with the worker's other SDK metrics (see
+``TEMPORAL_METRICS_BIND_ADDRESS``).
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from temporalio import activity
+
+from config.settings import settings
+from storage.claim_check import canonical_json
+
+logger = logging.getLogger(__name__)
+
+
+def memo_key(name: str, version: str, value: Any) -> str:
+    """Return the cache key for an activity input."""
+    digest = hashlib.sha256(f"{name}:{version}:".encode("utf-8"))
+    digest.update(canonical_json(value))
+    return digest.hexdigest()
+
+
+class MemoCache(ABC):
+    """Key-value cache of encoded activity results with hit-rate metrics."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int, report_every: int = 1000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.report_every = report_every
+        # Counters are updated from executor threads by some backends
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at >= self.ttl_seconds
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Load an entry, or None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, data: bytes) -> None:
+        """Store an entry, evicting old ones if the cache is full."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def count(self, counter: str, value: int = 1) -> None:
+        """Add to a statistics counter and to the activity's metric of the same name."""
+        if not value:
+            return
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + value)
+        # asyncio.to_thread carries the activity context into executor threads
+        if activity.in_activity():
+            activity.metric_meter().create_counter(
+                f"memo_cache_{counter}", f"Memo cache {counter}"
+            ).add(value, {"memo_cache_backend": type(self).__name__})
+
+    def record_lookup(self, hit: bool) -> None:
+        self.count("hits" if hit else "misses")
+        lookups = self.hits + self.misses
+        if self.report_every and lookups % self.report_every == 0:
+            logger.info(f"Memo cache hit rate {self.hit_rate:.1%} over {lookups} lookups")
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "backend": type(self).__name__,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+class InMemoryMemoCache(MemoCache):
+    """LRU cache held in the worker process."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        super().__init__(ttl_seconds, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created_at, data = entry
+        if self._expired(created_at):
+            del self._entries[key]
+            self.count("evictions")
+            return None
+        self._entries.move_to_end(key)
+        return data
+
+    async def set(self, key: str, data: bytes) -> None:
+        self._entries[key] = (time.time(), data)
+        self._entries.move_to_end(key)
+        self.count("sets")
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.count("evictions")
+
+
+class SqliteMemoCache(MemoCache):
+    """Cache in a SQLite file, shared by the worker processes of a host."""
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int) -> None:
+        super().__init__(ttl_seconds, max_entries)
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS memo ("
+                "key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS memo_accessed_at ON memo (accessed_at)")
+            # Entry count as of this process's last write, so stats() doesn't
+            # query the file on the event loop
+            self._entries = conn.execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; asyncio.to_thread uses a thread pool
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT data, created_at FROM memo WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            data, created_at = row
+            if self._expired(created_at):
+                deleted = conn.execute("DELETE FROM memo WHERE key = ?", (key,))
+                self.count("evictions", deleted.rowcount)
+                self._entries = max(self._entries - deleted.rowcount, 0)
+                return None
+            conn.execute("UPDATE memo SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return data
+
+    def _set(self, key: str, data: bytes) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO memo (key, data, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, data, now, now),
+            )
+            if self.ttl_seconds > 0:
+                expired = conn.execute("DELETE FROM memo WHERE created_at <= ?", (now - self.ttl_seconds,))
+                self.count("evictions", expired.rowcount)
+            # Drop the least recently used entries beyond the size limit
+            evicted = conn.execute(
+                "DELETE FROM memo WHERE key IN ("
+                "SELECT key FROM memo ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.count("evictions", evicted.rowcount)
+            self._entries = conn.execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+        self.count("sets")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._set, key, data)
+
+
+_backends: Dict[str, Callable[[], MemoCache]] = {
+    "memory": lambda: InMemoryMemoCache(settings.memo_cache_ttl_seconds, settings.memo_cache_max_entries),
+    "sqlite": lambda: SqliteMemoCache(
+        settings.memo_cache_path,
+        settings.memo_cache_ttl_seconds,
+        settings.memo_cache_max_entries,
+    ),
+}
+_caches: Dict[str, MemoCache] = {}
+
+
+def register_memo_cache_backend(name: str, factory: Callable[[], MemoCache]) -> None:
+    """Register a memo cache backend factory under a name."""
+    _backends[name] = factory
+    _caches.pop(name, None)
+
+
+def get_memo_cache(backend: str | None = None) -> MemoCache:
+    """Get the memo cache for a backend (the configured one by default)."""
+    backend = backend or settings.memo_cache_backend
+    if backend not in _caches:
+        if backend not in _backends:
+            raise ValueError(f"Unknown memo cache backend: {backend}")
+        _caches[backend] = _backends[backend]()
+        logger.info(f"Initialized '{backend}' memo cache")
+    return _caches[backend]
+
+
+def memo_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics of the memo caches in use in this process."""
+    return {backend: cache.stats() for backend, cache in _caches.items()}
+
+
+def memoized(version: str) -> Callable[[Callable[[Any], Awaitable[Any]]], Callable[[Any], Awaitable[Any]]]:
+    """Cache a single-argument async activity's results when MEMO_CACHE_ENABLED is set.
+
+    Apply below ``@activity.defn``. Cache errors are logged and the activity
+    runs normally.
+
+    Args:
+        version: Generator version; results of other versions aren't reused
+    """
+    def decorator(fn: Callable[[Any], Awaitable[Any]]) -> Callable[[Any], Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(arg: Any) -> Any:
+            if not settings.memo_cache_enabled:
+                return await fn(arg)
+
+            cache = get_memo_cache()
+            key = memo_key(fn.__name__, version, arg)
+            try:
+                data = await cache.get(key)
+            except Exception as e:
+                cache.count("errors")
+                logger.warning(f"Memo cache lookup failed for {fn.__name__}: {e}")
+                data = None
+
+            cache.record_lookup(data is not None)
+            if data is not None:
+                logger.info(f"Memo cache hit for {fn.__name__} ({key[:12]})")
+                return json.loads(data)
+
+            result = await fn(arg)
+            try:
+                await cache.set(key, canonical_json(result))
+            except Exception as e:
+                cache.count("errors")
+                logger.warning(f"Memo cache store failed for {fn.__name__}: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
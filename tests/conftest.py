@@ -0,0 +1,139 @@
+"""Shared test fixtures."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from temporalio import workflow
+
+from config.settings import settings
+
+
+class ContinueAsNewCalled(Exception):
+    """Raised in place of the SDK's continue-as-new, with the new run's args."""
+
+    def __init__(self, args: List[Any]):
+        super().__init__("continue_as_new")
+        self.args = args
+
+
+class FakeChildHandle(asyncio.Future):
+    """A started child workflow; the test completes it with ``set_result``."""
+
+    def __init__(self, workflow_id: str, args: List[Any]) -> None:
+        super().__init__()
+        self.id = workflow_id
+        self.args = args
+        self.signals: List[Tuple[str, Any]] = []
+
+    async def signal(self, name: str, arg: Any = None) -> None:
+        self.signals.append((name, arg))
+
+
+class FakeWorkflowRuntime:
+    """Runs workflow code on a plain asyncio loop with mocked activities.
+
+    Replaces the ``temporalio.workflow`` calls the workflows make. Activities
+    are looked up by name in ``activities``; stage steps run as activities,
+    and started child workflows are kept in ``children`` for the test to
+    complete.
+    Timers don't sleep: a ``wait_condition`` whose condition stays false
+    until the loop has nothing left to run times out at once and moves
+    ``now`` forward by the timeout.
+    """
+
+    def __init__(self) -> None:
+        self.activities: Dict[str, Callable[[Any], Awaitable[Any]]] = {}
+        # (activity name, input) of every activity call, in call order
+        self.calls: List[Tuple[str, Any]] = []
+        # (workflow ID, signal name, args) of signals sent to other workflows
+        self.signals: List[Tuple[str, str, List[Any]]] = []
+        # Started child workflows by workflow ID
+        self.children: Dict[str, FakeChildHandle] = {}
+        # Signal handler tasks of signals delivered to the workflow under test
+        self.handlers: List[asyncio.Task] = []
+        self.now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.parent: Optional[SimpleNamespace] = None
+        self.workflow_id = "campaign-1"
+
+    async def execute_activity(self, activity: Callable, arg: Any = None, **options: Any) -> Any:
+        name = activity.__name__
+        self.calls.append((name, arg))
+        return await self.activities[name](arg)
+
+    def start_activity(self, activity: Callable, arg: Any = None, **options: Any) -> asyncio.Task:
+        return asyncio.ensure_future(self.execute_activity(activity, arg, **options))
+
+    async def start_child_workflow(self, run: Callable, *, args: List[Any], id: str, **options: Any) -> FakeChildHandle:
+        self.children[id] = FakeChildHandle(id, args)
+        return self.children[id]
+
+    def called(self, name: str) -> List[Any]:
+        """Inputs of the calls to one activity."""
+        return [arg for called, arg in self.calls if called == name]
+
+    def info(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            workflow_id=self.workflow_id,
+            run_id="run-1",
+            task_queue="test",
+            parent=self.parent,
+            get_current_history_length=lambda: 0,
+            is_continue_as_new_suggested=lambda: False,
+        )
+
+    async def wait_condition(self, fn: Callable[[], bool], *, timeout: Optional[timedelta] = None) -> None:
+        for _ in range(1000):
+            if fn():
+                return
+            await asyncio.sleep(0)
+        if timeout is None:
+            raise AssertionError("Workflow is blocked on a condition that never becomes true")
+        self.now += timeout
+        raise asyncio.TimeoutError()
+
+    async def until(self, fn: Callable[[], bool]) -> None:
+        """Let the workflow run until a condition holds."""
+        for _ in range(1000):
+            if fn():
+                return
+            await asyncio.sleep(0)
+        raise AssertionError("Condition never became true")
+
+    def signal(self, handler: Awaitable[None]) -> asyncio.Task:
+        """Deliver a signal; like the SDK, its handler runs as a separate task."""
+        task = asyncio.ensure_future(handler)
+        self.handlers.append(task)
+        return task
+
+    def all_handlers_finished(self) -> bool:
+        return all(task.done() for task in self.handlers)
+
+    def continue_as_new(self, args: List[Any]) -> None:
+        raise ContinueAsNewCalled(args)
+
+    def get_external_workflow_handle(self, workflow_id: str) -> SimpleNamespace:
+        async def signal(name: str, args: List[Any]) -> None:
+            self.signals.append((workflow_id, name, args))
+
+        return SimpleNamespace(signal=signal)
+
+
+@pytest.fixture
+def workflow_runtime(monkeypatch) -> FakeWorkflowRuntime:
+    runtime = FakeWorkflowRuntime()
+    monkeypatch.setattr(workflow, "execute_activity", runtime.execute_activity)
+    monkeypatch.setattr(workflow, "start_activity", runtime.start_activity)
+    monkeypatch.setattr(workflow, "start_child_workflow", runtime.start_child_workflow)
+    monkeypatch.setattr(workflow, "info", runtime.info)
+    monkeypatch.setattr(workflow, "now", lambda: runtime.now)
+    monkeypatch.setattr(workflow, "wait_condition", runtime.wait_condition)
+    monkeypatch.setattr(workflow, "all_handlers_finished", runtime.all_handlers_finished)
+    monkeypatch.setattr(workflow, "continue_as_new", runtime.continue_as_new)
+    monkeypatch.setattr(workflow, "get_external_workflow_handle", runtime.get_external_workflow_handle)
+    monkeypatch.setattr(workflow, "logger", logging.getLogger("workflow"))
+    monkeypatch.setattr(settings, "workflow_step_mode", "activity")
+    return runtime
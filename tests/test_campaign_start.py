@@ -0,0 +1,117 @@
+"""Tests for keyed update-with-start campaign kickoff."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from temporalio.client import WorkflowExecutionStatus
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+from temporalio.service import RPCError, RPCStatusCode
+
+from api.schemas.v1.generated import StartWorkflowRequest
+from services import campaign_workflow
+from services.campaign_workflow import NOTIFY_RESEARCH_OUTPUT_MEMO, CampaignConflictError, WorkflowService
+
+
+class FakeStartOperation:
+    def __init__(self, workflow, *, args, **options):
+        self.options = options
+
+    async def workflow_handle(self):
+        return SimpleNamespace(id=self.options["id"], result_run_id="run-1")
+
+
+class FakeHandle:
+    def __init__(self, client):
+        self.client = client
+
+    async def describe(self):
+        if self.client.running is None:
+            raise RPCError("not found", RPCStatusCode.NOT_FOUND, b"")
+        memo = self.client.running
+
+        async def get_memo():
+            return memo
+
+        return SimpleNamespace(status=WorkflowExecutionStatus.RUNNING, run_id="run-1", memo=get_memo)
+
+
+class FakeClient:
+    def __init__(self, running=None, start_error=None):
+        # Memo of the running campaign, None if there is none
+        self.running = running
+        self.start_error = start_error
+        self.operations = []
+
+    def get_workflow_handle(self, workflow_id):
+        return FakeHandle(self)
+
+    async def start_update_with_start_workflow(self, update, *, start_workflow_operation, wait_for_stage):
+        self.operations.append(start_workflow_operation)
+        if self.start_error is not None:
+            raise self.start_error
+
+        async def result():
+            return {"research_brief": "brief"}
+
+        return SimpleNamespace(result=result)
+
+
+@pytest.fixture(autouse=True)
+def fake_start_operation(monkeypatch):
+    monkeypatch.setattr(campaign_workflow, "WithStartWorkflowOperation", FakeStartOperation)
+
+
+def start(client):
+    service = WorkflowService()
+
+    async def get_client():
+        return client
+
+    service.get_client = get_client
+    request = StartWorkflowRequest(
+        campaign_name="Spring launch",
+        budget=1000,
+        objectives=["awareness"],
+        channels=["email"],
+        idempotency_key="spring-2026",
+    )
+    return asyncio.run(service.start_workflow_and_await_research(request))
+
+
+def test_new_keyed_campaign_is_marked_and_never_started_twice():
+    client = FakeClient()
+
+    result = start(client)
+
+    assert result["research_outputs"] == {"research_brief": "brief"}
+    assert result["already_started"] is False
+    options = client.operations[0].options
+    assert options["memo"] == {NOTIFY_RESEARCH_OUTPUT_MEMO: True}
+    assert options["id_reuse_policy"] == WorkflowIDReusePolicy.REJECT_DUPLICATE
+
+
+def test_retry_attaches_to_running_campaign():
+    result = start(FakeClient(running={NOTIFY_RESEARCH_OUTPUT_MEMO: True}))
+
+    assert result["already_started"] is True
+    assert result["research_outputs"] == {"research_brief": "brief"}
+
+
+def test_campaign_started_without_research_output_is_a_conflict():
+    client = FakeClient(running={})
+
+    with pytest.raises(CampaignConflictError):
+        start(client)
+    assert client.operations == []
+
+
+def test_retry_after_campaign_closed_reports_already_started():
+    error = WorkflowAlreadyStartedError("spring-launch", "MarketingOrchestratorWorkflow", run_id="run-0")
+
+    result = start(FakeClient(start_error=error))
+
+    assert result["already_started"] is True
+    assert result["run_id"] == "run-0"
+    assert result["research_outputs"] is None
@@ -0,0 +1,69 @@
+"""Tests for claim-check offloading of large activity results."""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from storage import blob_store
+from storage.blob_store import LocalFileBlobStore, register_blob_store_backend
+from storage.claim_check import is_claim_check, offload_large_values, resolve_claim_checks
+
+
+@pytest.fixture
+def claim_checks(monkeypatch, tmp_path):
+    monkeypatch.setattr(blob_store, "_backends", dict(blob_store._backends))
+    monkeypatch.setattr(blob_store, "_stores", {})
+    register_blob_store_backend("test", lambda: LocalFileBlobStore(str(tmp_path)))
+    monkeypatch.setattr(settings, "blob_store_backend", "test")
+    monkeypatch.setattr(settings, "claim_check_enabled", True)
+    monkeypatch.setattr(settings, "claim_check_threshold_bytes", 100)
+    return tmp_path
+
+
+def test_offload_and_resolve_round_trip(claim_checks):
+    result = {
+        "summary": "short",
+        "document": {"sections": ["x" * 200, "y" * 200]},
+    }
+
+    offloaded = asyncio.run(offload_large_values(result))
+
+    assert offloaded["summary"] == "short"
+    assert is_claim_check(offloaded["document"])
+    assert offloaded["document"]["$claim_check"]["backend"] == "test"
+    assert asyncio.run(resolve_claim_checks({"input": offloaded})) == {"input": result}
+
+
+def test_threshold_is_inclusive(claim_checks):
+    # The JSON encoding of this string is exactly the threshold ("" adds 2 bytes)
+    at_threshold = "a" * (settings.claim_check_threshold_bytes - 2)
+    below_threshold = at_threshold[1:]
+
+    offloaded = asyncio.run(offload_large_values({"at": at_threshold, "below": below_threshold}))
+
+    assert is_claim_check(offloaded["at"])
+    assert offloaded["at"]["$claim_check"]["size"] == settings.claim_check_threshold_bytes
+    assert offloaded["below"] == below_threshold
+
+
+def test_identical_content_is_stored_once(claim_checks):
+    value = {"body": "z" * 500}
+
+    offloaded = asyncio.run(offload_large_values({"a": value, "b": dict(value)}))
+
+    assert offloaded["a"] == offloaded["b"]
+    assert len([path for path in claim_checks.rglob("*") if path.is_file()]) == 1
+
+
+def test_references_are_not_offloaded_again(claim_checks):
+    offloaded = asyncio.run(offload_large_values({"document": "d" * 500}))
+
+    assert asyncio.run(offload_large_values(offloaded)) == offloaded
+
+
+def test_disabled_returns_result_unchanged(claim_checks, monkeypatch):
+    monkeypatch.setattr(settings, "claim_check_enabled", False)
+    result = {"document": "d" * 500}
+
+    assert asyncio.run(offload_large_values(result)) is result
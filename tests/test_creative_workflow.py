@@ -0,0 +1,255 @@
+"""Tests for the creative workflow's generator fan-out and quorum."""
+
+import asyncio
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from config.settings import settings
+from workflows.creatives_workflows.creative_workflow import COMPLETED, CreativeWorkflow, RUNNING
+
+GENERATORS = {
+    "sms": "sms_generation_activity",
+    "image": "image_generation_activity",
+    "video": "video_generation_activity",
+    "email": "email_template_generation_activity",
+}
+
+
+class Generators:
+    """Generator activities that finish (or fail) when the test releases them."""
+
+    def __init__(self, runtime):
+        self.gates = {name: asyncio.Event() for name in GENERATORS}
+        self.errors = {}
+        self.cancelled = []
+        for name, activity in GENERATORS.items():
+            runtime.activities[activity] = self._generator(name)
+
+    def _generator(self, name):
+        async def generate(creative_input):
+            try:
+                await self.gates[name].wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(name)
+                raise
+            if name in self.errors:
+                raise ApplicationError(self.errors[name])
+            return {"channel": name, "variant": creative_input.get("variant"), "input": creative_input}
+
+        return generate
+
+    def release(self, *names):
+        for name in names:
+            self.gates[name].set()
+
+
+@pytest.fixture
+def creatives(workflow_runtime, monkeypatch):
+    monkeypatch.setattr(settings, "creative_required_channels", "sms,video")
+    monkeypatch.setattr(settings, "creative_fail_fast", False)
+    monkeypatch.setattr(settings, "creative_variants_per_channel", 1)
+    monkeypatch.setattr(settings, "creative_max_concurrent_generations", 0)
+
+    async def prepare(research_output):
+        return {"prepared_from": research_output}
+
+    async def consolidate(creative_outputs):
+        return {"creatives": sorted(creative_outputs)}
+
+    workflow_runtime.activities["prepare_creative_inputs_activity"] = prepare
+    workflow_runtime.activities["consolidate_creatives_activity"] = consolidate
+    return workflow_runtime, Generators(workflow_runtime)
+
+
+async def turns(count: int = 20) -> None:
+    for _ in range(count):
+        await asyncio.sleep(0)
+
+
+def test_waits_for_all_generators_when_none_is_required(creatives):
+    runtime, generators = creatives
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}, channels=["social"]))
+        await turns()
+        # "social" is served by the image generator, which is not required
+        assert not wf.awaiting_approval
+        assert wf.creatives["image"]["status"] == RUNNING
+
+        generators.release("image")
+        await runtime.until(lambda: wf.awaiting_approval)
+        assert wf.creatives["image"]["status"] == COMPLETED
+        await wf.approve_creatives()
+        return await run
+
+    result = asyncio.run(scenario())
+
+    assert list(result["creative_outputs"]) == ["image"]
+    assert runtime.called("consolidate_creatives_activity") == [result["creative_outputs"]]
+
+
+def test_goes_to_approval_once_required_generators_are_ready(creatives):
+    runtime, generators = creatives
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}))
+        generators.release("sms", "video")
+        await runtime.until(lambda: wf.awaiting_approval)
+        first_submission = runtime.called("consolidate_creatives_activity")[-1]
+
+        # An optional creative finishing before the decision is sent for approval too
+        generators.release("image")
+        await runtime.until(lambda: len(runtime.called("consolidate_creatives_activity")) == 2)
+        await turns()
+        assert wf.creatives["image"]["awaiting_approval"]
+        assert not wf.creatives["email"]["awaiting_approval"]
+
+        await wf.approve_creatives()
+        return first_submission, await run, wf
+
+    first_submission, result, wf = asyncio.run(scenario())
+
+    assert sorted(first_submission) == ["sms", "video"]
+    assert sorted(result["creative_outputs"]) == ["image", "sms", "video"]
+    assert result["consolidated"] == {"creatives": ["image", "sms", "video"]}
+    # The decision cancels the creatives still generating
+    assert generators.cancelled == ["email"]
+    assert wf.creatives["email"]["status"] == "cancelled"
+
+
+def test_failed_required_generator_cancels_the_others_with_fail_fast(creatives, monkeypatch):
+    runtime, generators = creatives
+    monkeypatch.setattr(settings, "creative_fail_fast", True)
+    generators.errors["sms"] = "sms model unavailable"
+    generators.release("sms")
+
+    with pytest.raises(ApplicationError, match="sms model unavailable"):
+        asyncio.run(CreativeWorkflow().run({"research": "done"}))
+
+    assert sorted(generators.cancelled) == ["email", "image", "video"]
+    assert runtime.called("consolidate_creatives_activity") == []
+
+
+def test_failed_required_generator_lets_the_others_finish_without_fail_fast(creatives):
+    runtime, generators = creatives
+    generators.errors["sms"] = "sms model unavailable"
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}))
+        generators.release("sms")
+        await runtime.until(lambda: wf.creatives.get("sms", {}).get("status") == "failed")
+        await turns()
+        assert not run.done()
+
+        generators.release("image", "video", "email")
+        with pytest.raises(ApplicationError, match="sms model unavailable"):
+            await run
+        return wf
+
+    wf = asyncio.run(scenario())
+
+    assert generators.cancelled == []
+    assert {key: creative["status"] for key, creative in wf.creatives.items()} == {
+        "sms": "failed",
+        "image": COMPLETED,
+        "video": COMPLETED,
+        "email": COMPLETED,
+    }
+
+
+def test_fans_out_to_the_generators_of_the_campaign_channels(creatives, monkeypatch):
+    runtime, generators = creatives
+    monkeypatch.setattr(settings, "creative_variants_per_channel", 2)
+    generators.release(*GENERATORS)
+    wf = CreativeWorkflow()
+    wf.approval_status = "approved"
+
+    # "social" is served by the image generator too; "push" has no generator
+    result = asyncio.run(wf.run({"research": "done"}, channels=["sms", "image", "social", "push"]))
+
+    assert sorted(result["creative_outputs"]) == ["image-v1", "image-v2", "sms-v1", "sms-v2"]
+    assert result["creative_outputs"]["sms-v2"]["variant"] == 2
+    assert runtime.called("video_generation_activity") == []
+    assert runtime.called("email_template_generation_activity") == []
+
+
+def test_caps_concurrent_generations(creatives, monkeypatch):
+    runtime, generators = creatives
+    monkeypatch.setattr(settings, "creative_max_concurrent_generations", 1)
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}, channels=["sms", "video"]))
+        await turns()
+        started_first = [name for name, _ in runtime.calls if name.endswith("generation_activity")]
+        generators.release("sms", "video")
+        await runtime.until(lambda: wf.awaiting_approval)
+        await wf.approve_creatives()
+        await run
+        return started_first
+
+    assert asyncio.run(scenario()) == ["sms_generation_activity"]
+    assert len(runtime.called("video_generation_activity")) == 1
+
+
+def test_no_generator_for_the_channels_fails_the_stage(creatives):
+    with pytest.raises(ApplicationError) as failed:
+        asyncio.run(CreativeWorkflow().run({"research": "done"}, channels=["push"]))
+
+    assert failed.value.type == "NoCreativeGenerator"
+    assert failed.value.non_retryable
+
+
+def test_feedback_regenerates_only_the_targeted_creatives(creatives):
+    runtime, generators = creatives
+    generators.release(*GENERATORS)
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}, channels=["sms", "video", "email"]))
+        await runtime.until(
+            lambda: wf.awaiting_approval
+            and all(creative["status"] == COMPLETED for creative in wf.get_creative_results().values())
+        )
+        first_round = {key: creative["output"] for key, creative in wf.get_creative_results().items()}
+
+        await wf.provide_feedback({"feedback": "shorter video", "targets": ["video"]})
+        await runtime.until(lambda: len(runtime.called("video_generation_activity")) == 2)
+        await runtime.until(lambda: wf.awaiting_approval)
+        await wf.approve_creatives()
+        return first_round, await run, wf
+
+    first_round, result, wf = asyncio.run(scenario())
+
+    assert len(runtime.called("prepare_creative_inputs_activity")) == 1
+    assert len(runtime.called("sms_generation_activity")) == 1
+    assert len(runtime.called("email_template_generation_activity")) == 1
+    video_input = runtime.called("video_generation_activity")[1]
+    assert video_input["revision"]["feedback_history"] == ["shorter video"]
+    assert result["creative_outputs"]["sms"] == first_round["sms"]
+    assert result["creative_outputs"]["video"]["input"] == video_input
+    assert wf.creatives["sms"]["reused"]
+
+
+def test_feedback_without_targets_regenerates_everything(creatives):
+    runtime, generators = creatives
+    generators.release(*GENERATORS)
+
+    async def scenario():
+        wf = CreativeWorkflow()
+        run = asyncio.create_task(wf.run({"research": "done"}, channels=["sms", "video"]))
+        await runtime.until(lambda: wf.awaiting_approval)
+        await wf.provide_feedback("more playful")
+        await runtime.until(lambda: len(runtime.called("sms_generation_activity")) == 2)
+        await runtime.until(lambda: wf.awaiting_approval)
+        await wf.approve_creatives()
+        return await run
+
+    asyncio.run(scenario())
+
+    assert len(runtime.called("prepare_creative_inputs_activity")) == 2
+    assert len(runtime.called("video_generation_activity")) == 2
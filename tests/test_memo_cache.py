@@ -0,0 +1,83 @@
+"""Tests for the activity memoization cache."""
+
+import asyncio
+
+import pytest
+
+from storage import memo_cache
+from storage.memo_cache import InMemoryMemoCache, SqliteMemoCache, memo_key
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def make(ttl_seconds: float, max_entries: int):
+        if request.param == "memory":
+            return InMemoryMemoCache(ttl_seconds, max_entries)
+        return SqliteMemoCache(str(tmp_path / "memo.sqlite3"), ttl_seconds, max_entries)
+
+    return make
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(memo_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_key_ignores_dict_order_and_includes_version():
+    assert memo_key("generate", "v1", {"a": 1, "b": 2}) == memo_key("generate", "v1", {"b": 2, "a": 1})
+    assert memo_key("generate", "v1", {"a": 1}) != memo_key("generate", "v2", {"a": 1})
+    assert memo_key("generate", "v1", {"a": 1}) != memo_key("other", "v1", {"a": 1})
+
+
+def test_entries_expire_after_ttl(make_cache, clock):
+    cache = make_cache(ttl_seconds=60, max_entries=10)
+    asyncio.run(cache.set("key", b"value"))
+
+    clock[0] += 59
+    assert asyncio.run(cache.get("key")) == b"value"
+
+    clock[0] += 1
+    assert asyncio.run(cache.get("key")) is None
+    assert cache.evictions == 1
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(make_cache, clock):
+    cache = make_cache(ttl_seconds=0, max_entries=2)
+
+    async def scenario():
+        await cache.set("a", b"1")
+        clock[0] += 1
+        await cache.set("b", b"2")
+        clock[0] += 1
+        # Reading "a" makes "b" the least recently used
+        assert await cache.get("a") == b"1"
+        clock[0] += 1
+        await cache.set("c", b"3")
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [b"1", None, b"3"]
+    assert cache.evictions == 1
+    assert len(cache) == 2
+    assert cache.stats()["entries"] == 2
+
+
+def test_memoized_activity_runs_once(monkeypatch):
+    monkeypatch.setattr(memo_cache.settings, "memo_cache_enabled", True)
+    monkeypatch.setattr(memo_cache, "_caches", {"memory": InMemoryMemoCache(60, 10)})
+    monkeypatch.setattr(memo_cache.settings, "memo_cache_backend", "memory")
+    calls = []
+
+    @memo_cache.memoized("v1")
+    async def generate(arg):
+        calls.append(arg)
+        return {"copy": arg["brief"].upper()}
+
+    async def scenario():
+        return [await generate({"brief": "launch"}) for _ in range(2)]
+
+    assert asyncio.run(scenario()) == [{"copy": "LAUNCH"}] * 2
+    assert calls == [{"brief": "launch"}]
+    assert memo_cache.memo_cache_stats()["memory"]["hits"] == 1
@@ -0,0 +1,105 @@
+"""Tests for columnar metrics aggregation."""
+
+import random
+from collections import defaultdict
+
+from metrics.aggregation import METRIC_COLUMNS, MetricTable, rollup
+
+
+def random_rows(rng: random.Random, count: int) -> dict:
+    columns = {
+        "channel": [rng.choice(["email", "social", "search_ads"]) for _ in range(count)],
+        "creative_id": [rng.choice(["c1", "c2", "creative-long-id-10"]) for _ in range(count)],
+        "hour": [rng.randrange(0, 30) for _ in range(count)],
+    }
+    for metric in METRIC_COLUMNS:
+        columns[metric] = [rng.randrange(0, 1_000) for _ in range(count)]
+    return columns
+
+
+def naive_merge(*batches: dict) -> dict:
+    sums = defaultdict(lambda: [0] * len(METRIC_COLUMNS))
+    for columns in batches:
+        for row in range(len(columns["hour"])):
+            key = (columns["channel"][row], columns["creative_id"][row], columns["hour"][row])
+            for index, metric in enumerate(METRIC_COLUMNS):
+                sums[key][index] += columns[metric][row]
+    return dict(sums)
+
+
+def as_dict(table: MetricTable) -> dict:
+    columns = table.to_columns()
+    return {
+        (channel, creative_id, hour): [columns[metric][row] for metric in METRIC_COLUMNS]
+        for row, (channel, creative_id, hour) in enumerate(
+            zip(columns["channel"], columns["creative_id"], columns["hour"])
+        )
+    }
+
+
+def test_incremental_merge_matches_naive_merge():
+    rng = random.Random(7)
+    batches = [random_rows(rng, count) for count in (50, 1, 0, 200, 75)]
+
+    table = MetricTable.empty()
+    for columns in batches:
+        table = table.merge(MetricTable.from_columns(columns))
+
+    assert as_dict(table) == naive_merge(*batches)
+    # Groups stay sorted, so later merges can binary search them
+    assert list(table.keys) == sorted(table.keys)
+
+
+def test_stored_table_is_restored_without_regrouping(monkeypatch):
+    rng = random.Random(11)
+    batches = [random_rows(rng, 100), random_rows(rng, 20)]
+    stored = MetricTable.from_columns(batches[0]).to_columns()
+
+    rows = MetricTable.from_columns(batches[1])
+
+    def regroup(*args):
+        raise AssertionError("stored table was grouped again")
+
+    monkeypatch.setattr(MetricTable, "_grouped", regroup)
+    restored = MetricTable.from_state(stored)
+
+    assert restored.to_columns() == stored
+    assert as_dict(restored.merge(rows)) == naive_merge(*batches)
+    assert len(MetricTable.from_state(None)) == 0
+
+
+def test_merge_widens_keys_for_longer_new_groups():
+    table = MetricTable.from_columns({"channel": ["a"], "creative_id": ["b"], "hour": [1], "clicks": [1]})
+    rows = {"channel": ["a-much-longer-channel"], "creative_id": ["b"], "hour": [1], "clicks": [2]}
+
+    merged = table.merge(MetricTable.from_columns(rows)).merge(MetricTable.from_columns(rows))
+
+    assert len(merged) == 2
+    assert as_dict(merged)[("a-much-longer-channel", "b", 1)][1] == 4
+
+
+def test_missing_columns_default():
+    table = MetricTable.from_columns({"hour": [1, 1, 2], "impressions": [10, 5, 1]})
+
+    assert as_dict(table) == {("all", "all", 1): [15, 0, 0], ("all", "all", 2): [1, 0, 0]}
+    assert len(MetricTable.from_columns(None)) == 0
+
+
+def test_rollup_totals_and_deltas():
+    table = MetricTable.from_columns({
+        "channel": ["email", "social"],
+        "creative_id": ["c1", "c1"],
+        "hour": [0, 1],
+        "impressions": [100, 300],
+        "clicks": [10, 30],
+        "conversions": [1, 2],
+    })
+
+    result = rollup(table, previous={"impressions": 200, "clicks": 40, "conversions": 0})
+
+    assert result["totals"]["impressions"] == 400
+    assert result["totals"]["ctr"] == 0.1
+    assert result["delta_vs_previous"]["impressions"] == {"absolute": 200, "relative": 1.0}
+    assert result["delta_vs_previous"]["conversions"] == {"absolute": 3, "relative": 0.0}
+    assert result["by_channel"]["social"]["clicks"] == 30
+    assert result["groups"] == 2
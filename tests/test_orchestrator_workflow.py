@@ -0,0 +1,82 @@
+"""Tests for the orchestrator's pipelined stage speculation."""
+
+import asyncio
+
+import pytest
+
+from config.settings import settings
+from workflows.orchestrator_workflow import MarketingOrchestratorWorkflow
+from workflows.pipelining import pending_result
+
+RESEARCH_ID = "campaign-1-researcher"
+CREATIVE_ID = "campaign-1-creative"
+
+
+@pytest.fixture
+def orchestrator(workflow_runtime, monkeypatch):
+    monkeypatch.setattr(settings, "orchestrator_pipelined_stages", True)
+    release = asyncio.Event()
+    cancelled = []
+
+    async def prepare(research_result):
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(research_result["research_outputs"])
+            raise
+        return {"prepared_from": research_result["research_outputs"]}
+
+    workflow_runtime.activities["prepare_creative_inputs_activity"] = prepare
+    return workflow_runtime, release, cancelled
+
+
+def run_research_stage(runtime, release, outputs, approved):
+    """Send each pending research output, approve with ``approved`` and return the creative stage's args."""
+
+    async def scenario():
+        wf = MarketingOrchestratorWorkflow()
+        run = asyncio.create_task(wf.run({"campaign_name": "launch", "channels": ["sms"]}))
+        await runtime.until(lambda: RESEARCH_ID in runtime.children)
+
+        for count, output in enumerate(outputs, start=1):
+            await wf.stage_output_pending("research", pending_result("research_outputs", output))
+            await runtime.until(lambda: len(runtime.called("prepare_creative_inputs_activity")) == count)
+
+        release.set()
+        runtime.children[RESEARCH_ID].set_result(approved)
+        await runtime.until(lambda: CREATIVE_ID in runtime.children)
+        run.cancel()
+        return runtime.children[CREATIVE_ID].args
+
+    return asyncio.run(scenario())
+
+
+def test_speculation_is_committed_when_approved_unchanged(orchestrator):
+    runtime, release, _ = orchestrator
+    output = {"research_brief": "v1"}
+
+    creative_args = run_research_stage(runtime, release, [output], pending_result("research_outputs", output))
+
+    assert creative_args[2] == {"prepared_from": output}
+    assert creative_args[3] == ["sms"]
+
+
+def test_speculation_is_discarded_when_approved_with_comment(orchestrator):
+    runtime, release, _ = orchestrator
+    output = {"research_brief": "v1"}
+    approved = {**pending_result("research_outputs", output), "approval_feedback": "tighten the brief"}
+
+    creative_args = run_research_stage(runtime, release, [output], approved)
+
+    assert creative_args[0] == approved
+    assert creative_args[2] is None
+
+
+def test_speculation_restarts_on_a_revised_output(orchestrator):
+    runtime, release, cancelled = orchestrator
+    first, revised = {"research_brief": "v1"}, {"research_brief": "v2"}
+
+    creative_args = run_research_stage(runtime, release, [first, revised], pending_result("research_outputs", revised))
+
+    assert cancelled == [first]
+    assert creative_args[2] == {"prepared_from": revised}
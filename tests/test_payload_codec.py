@@ -0,0 +1,80 @@
+"""Tests for the compressing payload codec."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from temporalio.api.common.v1 import Payload
+
+from client.payload_codec import ENCODINGS, CompressionPayloadCodec
+
+
+def json_payload(size: int) -> Payload:
+    return Payload(metadata={"encoding": b"json/plain"}, data=b'"' + b"a" * size + b'"')
+
+
+def round_trip(codec: CompressionPayloadCodec, payloads):
+    async def encode_decode():
+        encoded = await codec.encode(payloads)
+        return encoded, await codec.decode(encoded)
+
+    return asyncio.run(encode_decode())
+
+
+@pytest.mark.parametrize("algorithm", ["zlib", "zstd"])
+def test_round_trip_under_and_over_threshold(algorithm):
+    if algorithm == "zstd":
+        pytest.importorskip("zstandard")
+    codec = CompressionPayloadCodec(algorithm, threshold_bytes=100, offload_threshold_bytes=10_000)
+    payloads = [json_payload(10), json_payload(1_000), json_payload(50_000)]
+
+    encoded, decoded = round_trip(codec, payloads)
+
+    assert decoded == payloads
+    # Below the threshold the payload is sent as is
+    assert encoded[0] == payloads[0]
+    assert [p.metadata["encoding"] for p in encoded[1:]] == [ENCODINGS[algorithm]] * 2
+    stats = codec.stats()
+    assert stats["payloads_seen"] == 3
+    assert stats["payloads_compressed"] == 2
+    # Only the largest payload is compressed in a thread; it decompresses
+    # from far fewer bytes
+    assert stats["payloads_offloaded"] == 1
+
+
+def test_incompressible_payload_is_sent_as_is():
+    codec = CompressionPayloadCodec("zlib", threshold_bytes=100)
+    payload = Payload(metadata={"encoding": b"binary/plain"}, data=os.urandom(1_000))
+
+    encoded, decoded = round_trip(codec, [payload])
+
+    assert encoded == [payload]
+    assert decoded == [payload]
+    assert codec.stats()["payloads_compressed"] == 0
+
+
+def test_decodes_either_algorithm():
+    pytest.importorskip("zstandard")
+    payloads = [json_payload(5_000)]
+    encoded, _ = round_trip(CompressionPayloadCodec("zstd", threshold_bytes=100), payloads)
+
+    _, decoded = round_trip(CompressionPayloadCodec("zlib", threshold_bytes=100), encoded)
+
+    assert decoded == payloads
+
+
+def test_concurrent_zstd_compression_in_threads():
+    pytest.importorskip("zstandard")
+    # Every payload is above the offload threshold, so it is compressed in a
+    # thread while other encodes compress theirs
+    codec = CompressionPayloadCodec("zstd", threshold_bytes=100, offload_threshold_bytes=1_000)
+    batches = [
+        [Payload(metadata={"encoding": b"json/plain"}, data=os.urandom(64) * 2_000 + bytes([index]))]
+        for index in range(32)
+    ]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda payloads: round_trip(codec, payloads)[1], batches))
+
+    assert results == batches
@@ -0,0 +1,76 @@
+"""Tests for the continuous measurements polling loop."""
+
+import asyncio
+
+import pytest
+
+from activities.measurements_activities import merge_measurements_activity
+from config.settings import settings
+from workflows.measuements_workflows.poll_measurements_workflow import PollMeasurementsWorkflow
+from tests.conftest import ContinueAsNewCalled
+
+
+@pytest.fixture
+def polling(workflow_runtime, monkeypatch):
+    monkeypatch.setattr(settings, "measurements_polling_mode", "continuous")
+    monkeypatch.setattr(settings, "measurements_poll_duration_seconds", 24 * 3600)
+    monkeypatch.setattr(settings, "measurements_poll_continue_as_new_every", 2)
+    polls = []
+
+    async def poll(deployment_id):
+        polls.append(deployment_id)
+        impressions = 1000 * len(polls)
+        return {"measurements": {"impressions": impressions, "clicks": impressions // 20}}
+
+    workflow_runtime.activities["poll_measurements_activity"] = poll
+    workflow_runtime.activities["merge_measurements_activity"] = merge_measurements_activity
+    return workflow_runtime, polls
+
+
+def test_continues_as_new_with_its_state(polling):
+    runtime, polls = polling
+
+    with pytest.raises(ContinueAsNewCalled) as continued:
+        asyncio.run(PollMeasurementsWorkflow().run("deployment-1"))
+
+    deployment_id, state = continued.value.args
+    assert deployment_id == "deployment-1"
+    assert state["polls"] == len(polls) == 2
+    assert state["totals"] == {"impressions": 2000, "clicks": 100}
+    # Both polls fall in the first hour
+    assert state["aggregation_state"]["impressions"] == [2000]
+
+
+def test_stop_signal_during_timer_ends_polling(polling):
+    runtime, polls = polling
+    wf = PollMeasurementsWorkflow()
+
+    async def scenario():
+        run = asyncio.create_task(wf.run("deployment-1"))
+        await runtime.until(lambda: len(polls) == 1)
+        await runtime.signal(wf.stop_polling())
+        return await run
+
+    result = asyncio.run(scenario())
+
+    assert result["polls"] == 1
+    assert result["measurements"] == {"impressions": 1000, "clicks": 50}
+
+
+def test_stop_signal_delivered_with_the_last_poll_of_a_run_is_kept(polling):
+    runtime, polls = polling
+    wf = PollMeasurementsWorkflow()
+
+    async def merge_then_signal(poll):
+        # The signal arrives in the same workflow task as this result, so
+        # its handler hasn't run when the workflow decides to continue as new
+        if len(polls) == 2:
+            runtime.signal(wf.stop_polling())
+        return await merge_measurements_activity(poll)
+
+    runtime.activities["merge_measurements_activity"] = merge_then_signal
+
+    result = asyncio.run(wf.run("deployment-1"))
+
+    assert result["polls"] == 2
+    assert wf.stop_requested
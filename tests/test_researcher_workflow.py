@@ -0,0 +1,99 @@
+"""Tests for the researcher workflow's parallel research sources."""
+
+import asyncio
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from config.settings import settings
+from workflows.researcher_workflows.researcher_workflow import ResearcherWorkflow
+
+SOURCES = ["market_trends", "audience_insights", "competitor_analysis", "historical_performance"]
+
+
+async def turns(count: int) -> None:
+    for _ in range(count):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def research(workflow_runtime, monkeypatch):
+    monkeypatch.setattr(settings, "research_required_sources", "market_trends,audience_insights")
+    # Turns each source takes; a source with an error fails after them
+    delays = {name: 0 for name in SOURCES}
+    errors = {}
+
+    def source(name):
+        async def fetch(campaign_data):
+            await turns(delays[name])
+            if name in errors:
+                raise ApplicationError(errors[name])
+            return {"source": name}
+
+        return fetch
+
+    for name in SOURCES:
+        workflow_runtime.activities[f"{name}_source_activity"] = source(name)
+
+    async def step(arg):
+        return {"input": arg}
+
+    workflow_runtime.activities["research_brief_activity"] = step
+    workflow_runtime.activities["research_concept_note_activity"] = step
+    workflow_runtime.activities["summarise_research_findings_activity"] = step
+    return workflow_runtime, delays, errors
+
+
+def run_approved(campaign_data):
+    wf = ResearcherWorkflow()
+    # Approved as soon as it waits for approval
+    wf.approval_status = "approved"
+    return asyncio.run(wf.run(campaign_data))
+
+
+def test_brief_starts_after_required_sources(research):
+    runtime, delays, _ = research
+    delays["competitor_analysis"] = 1_000
+
+    result = run_approved({"campaign_name": "launch"})
+
+    brief_input = runtime.called("research_brief_activity")[0]
+    assert set(brief_input["sources"]) == {"market_trends", "audience_insights", "historical_performance"}
+    assert result["research_outputs"]["research_sources"] == {
+        "market_trends": "completed",
+        "audience_insights": "completed",
+        "historical_performance": "completed",
+        "competitor_analysis": "skipped",
+    }
+
+
+def test_optional_source_failure_is_recorded(research):
+    _, _, errors = research
+    errors["historical_performance"] = "warehouse unavailable"
+
+    result = run_approved({"campaign_name": "launch"})
+
+    status = result["research_outputs"]["research_sources"]
+    assert status["historical_performance"] == "failed: warehouse unavailable"
+    assert status["market_trends"] == "completed"
+
+
+def test_required_source_failure_cancels_the_others(research):
+    runtime, delays, errors = research
+    delays["competitor_analysis"] = 1_000
+    errors["audience_insights"] = "audience API down"
+
+    with pytest.raises(ApplicationError, match="audience API down"):
+        run_approved({"campaign_name": "launch"})
+    assert runtime.called("research_brief_activity") == []
+
+
+def test_last_pending_required_source_failure_fails_the_stage(research):
+    runtime, delays, errors = research
+    # Every other source has returned by the time it fails
+    delays["market_trends"] = 50
+    errors["market_trends"] = "market data unavailable"
+
+    with pytest.raises(ApplicationError, match="market data unavailable"):
+        run_approved({"campaign_name": "launch"})
+    assert runtime.called("research_brief_activity") == []
@@ -0,0 +1,109 @@
+"""Tests for the workflow status cache."""
+
+import asyncio
+
+from services.campaign_workflow import StatusCache
+
+
+def test_concurrent_lookups_share_one_load():
+    cache = StatusCache(ttl_seconds=60, max_entries=10)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return {"status": "RUNNING"}
+
+    async def lookups():
+        return await asyncio.gather(*(cache.get_or_load("wf-1", loader) for _ in range(5)))
+
+    results = asyncio.run(lookups())
+
+    assert loads == 1
+    assert results == [{"status": "RUNNING"}] * 5
+    assert (cache.misses, cache.coalesced) == (1, 4)
+
+    # Later lookups are served from the cache
+    assert asyncio.run(cache.get_or_load("wf-1", loader)) == {"status": "RUNNING"}
+    assert loads == 1
+    assert cache.hits == 1
+
+
+def test_zero_ttl_coalesces_without_caching():
+    cache = StatusCache(ttl_seconds=0, max_entries=10)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return loads
+
+    async def lookups():
+        return await asyncio.gather(*(cache.get_or_load("wf-1", loader) for _ in range(3)))
+
+    assert asyncio.run(lookups()) == [1, 1, 1]
+    assert asyncio.run(cache.get_or_load("wf-1", loader)) == 2
+
+
+def test_invalidate_drops_entry_and_inflight_load():
+    cache = StatusCache(ttl_seconds=60, max_entries=10)
+    loads = 0
+
+    async def loader():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return loads
+
+    async def scenario():
+        assert await cache.get_or_load("wf-1", loader) == 1
+        cache.invalidate("wf-1")
+        assert await cache.get_or_load("wf-1", loader) == 2
+
+        # A load started before an invalidation is returned to its callers
+        # but not cached
+        cache.invalidate("wf-1")
+        stale = asyncio.ensure_future(cache.get_or_load("wf-1", loader))
+        await asyncio.sleep(0)
+        cache.invalidate("wf-1")
+        assert await stale == 3
+        assert await cache.get_or_load("wf-1", loader) == 4
+
+    asyncio.run(scenario())
+    assert cache.invalidations == 3
+
+
+def test_failed_load_is_not_cached():
+    cache = StatusCache(ttl_seconds=60, max_entries=10)
+
+    async def failing():
+        raise RuntimeError("unavailable")
+
+    async def succeeding():
+        return "ok"
+
+    async def scenario():
+        try:
+            await cache.get_or_load("wf-1", failing)
+        except RuntimeError:
+            pass
+        return await cache.get_or_load("wf-1", succeeding)
+
+    assert asyncio.run(scenario()) == "ok"
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = StatusCache(ttl_seconds=60, max_entries=2)
+
+    async def scenario():
+        for key in ("a", "b"):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, key))
+        # Touch "a" so "b" is the least recently used
+        await cache.get_or_load("a", lambda: asyncio.sleep(0, "reloaded"))
+        await cache.get_or_load("c", lambda: asyncio.sleep(0, "c"))
+        return await cache.get_or_load("b", lambda: asyncio.sleep(0, "reloaded"))
+
+    assert asyncio.run(scenario()) == "reloaded"
+    assert cache.evictions == 2
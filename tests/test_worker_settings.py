@@ -0,0 +1,17 @@
+"""Tests for the worker's startup settings checks."""
+
+import pytest
+
+from config.settings import settings
+from workers.worker import validate_workflow_settings
+
+
+def test_continuous_polling_requires_claim_check(monkeypatch):
+    monkeypatch.setattr(settings, "measurements_polling_mode", "continuous")
+    monkeypatch.setattr(settings, "claim_check_enabled", False)
+
+    with pytest.raises(ValueError, match="CLAIM_CHECK_ENABLED"):
+        validate_workflow_settings()
+
+    monkeypatch.setattr(settings, "claim_check_enabled", True)
+    validate_workflow_settings()
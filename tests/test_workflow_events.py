@@ -0,0 +1,36 @@
+"""Tests for the campaign stage event stream."""
+
+import asyncio
+
+from api.endpoints.v1.routers import workflow_router
+from services import workflow_events
+
+
+class FailingHandle:
+    async def fetch_history_events(self, wait_new_event: bool = False):
+        raise RuntimeError("history unavailable")
+        yield  # pragma: no cover
+
+
+class FailingClient:
+    def get_workflow_handle(self, workflow_id: str) -> FailingHandle:
+        return FailingHandle()
+
+
+def test_watch_failure_reaches_client(monkeypatch):
+    async def get_client():
+        return FailingClient()
+
+    monkeypatch.setattr(workflow_events, "get_temporal_client", get_client)
+    monkeypatch.setattr(workflow_router, "workflow_event_hub", workflow_events.WorkflowEventHub())
+
+    async def read_stream(last_event_id):
+        response = await workflow_router.stream_workflow_events("campaign-1", last_event_id)
+        return [frame async for frame in response.body_iterator]
+
+    for last_event_id in (None, 3):
+        frames = asyncio.run(read_stream(last_event_id))
+        assert len(frames) == 1
+        assert frames[0].startswith("event: watch_failed\n")
+        assert "history unavailable" in frames[0]
+        assert "id:" not in frames[0]
@@ -0,0 +1,84 @@
+"""Tests for cursor-paginated workflow listing."""
+
+import asyncio
+import base64
+
+import pytest
+
+from services.campaign_workflow import WorkflowService
+
+
+class FakeIterator:
+    def __init__(self, next_page_token):
+        self.current_page = []
+        self.next_page_token = next_page_token
+
+    async def fetch_next_page(self):
+        pass
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def list_workflows(self, query, page_size, next_page_token=None):
+        self.calls.append((query, next_page_token))
+        return FakeIterator(b"server-token-2")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = WorkflowService()
+    client = FakeClient()
+
+    async def get_client():
+        return client
+
+    monkeypatch.setattr(service, "get_client", get_client)
+    service.client = client
+    return service
+
+
+def test_page_token_round_trip():
+    query = WorkflowService()._build_list_query("MarketingOrchestratorWorkflow", "Running")
+
+    token = WorkflowService._encode_page_token(query, b"server-token")
+
+    assert WorkflowService._decode_page_token(query, token) == b"server-token"
+
+
+def test_no_server_token_means_last_page():
+    assert WorkflowService._encode_page_token("", None) is None
+    assert WorkflowService._encode_page_token("", b"") is None
+
+
+def test_token_from_other_query_is_rejected():
+    token = WorkflowService._encode_page_token("ExecutionStatus='Running'", b"server-token")
+
+    with pytest.raises(ValueError, match="does not match"):
+        WorkflowService._decode_page_token("ExecutionStatus='Completed'", token)
+
+
+@pytest.mark.parametrize("token", ["not base64!", "é", base64.urlsafe_b64encode(b"short").decode()])
+def test_malformed_token_is_rejected(token):
+    with pytest.raises(ValueError):
+        WorkflowService._decode_page_token("", token)
+
+
+def test_list_passes_the_unwrapped_server_token(service):
+    first = asyncio.run(service.list_workflows(status="Running"))
+    second = asyncio.run(service.list_workflows(status="Running", page_token=first["next_page_token"]))
+
+    assert service.client.calls == [
+        ("ExecutionStatus='Running'", None),
+        ("ExecutionStatus='Running'", b"server-token-2"),
+    ]
+    assert second["next_page_token"] == first["next_page_token"]
+
+
+def test_list_rejects_token_for_other_filters(service):
+    first = asyncio.run(service.list_workflows(status="Running"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.list_workflows(status="Completed", page_token=first["next_page_token"]))
+    assert len(service.client.calls) == 1
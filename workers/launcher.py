@@ -0,0 +1,142 @@
+"""Multi-process worker launcher.
+
+A single worker process runs one asyncio event loop, so workflow task
+processing is limited to one core. The launcher starts N worker processes
+(one per CPU by default) that poll the same task queues, each with its own
+Temporal client connection. It restarts processes that exit unexpectedly,
+backing off when they keep crashing, and on SIGINT/SIGTERM forwards the
+signal so every process shuts down gracefully before it gives up and kills
+the stragglers.
+
+Usage:
+    poetry run python -m workers.launcher --processes 4 --pools workflow,light
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import settings
+from workers.worker import POOLS, parse_pools, run_worker_process
+
+logger = logging.getLogger(__name__)
+
+# A process that exits within this many seconds of starting counts as a crash loop
+MIN_HEALTHY_UPTIME_SECONDS = 30
+MAX_RESTART_BACKOFF_SECONDS = 60
+
+
+class WorkerSupervisor:
+    """Start, supervise, restart and stop a fixed number of worker processes."""
+
+    def __init__(self, processes: int, pools: List[str]) -> None:
+        self.processes = processes
+        self.pools = pools
+        # Split the cores between processes for auto tuning
+        self.cpu_share = max(1, (os.cpu_count() or 1) // processes)
+
+        self._context = multiprocessing.get_context("spawn")
+        self._procs: List[Optional[multiprocessing.process.BaseProcess]] = [None] * processes
+        self._started_at: List[float] = [0.0] * processes
+        self._failures: List[int] = [0] * processes
+        self._next_start: List[float] = [0.0] * processes
+        self._stopping = False
+
+    def _start(self, slot: int) -> None:
+        proc = self._context.Process(
+            target=run_worker_process,
+            args=(self.pools, self.cpu_share, slot),
+            name=f"temporal-worker-{slot}",
+        )
+        proc.start()
+        self._procs[slot] = proc
+        self._started_at[slot] = time.monotonic()
+        logger.info(f"Started worker process {slot} (pid {proc.pid})")
+
+    def _request_stop(self, signum, frame) -> None:
+        logger.info(f"Received signal {signum}, stopping worker processes...")
+        self._stopping = True
+
+    def _check(self, slot: int) -> None:
+        """Restart a worker process that has exited, with backoff on crash loops."""
+        proc = self._procs[slot]
+        now = time.monotonic()
+
+        if proc is not None and proc.is_alive():
+            return
+
+        if proc is not None:
+            uptime = now - self._started_at[slot]
+            logger.warning(f"Worker process {slot} (pid {proc.pid}) exited with code {proc.exitcode} after {uptime:.0f}s")
+            self._failures[slot] = self._failures[slot] + 1 if uptime < MIN_HEALTHY_UPTIME_SECONDS else 0
+            backoff = min(MAX_RESTART_BACKOFF_SECONDS, 2 ** self._failures[slot] - 1)
+            self._next_start[slot] = now + backoff
+            self._procs[slot] = None
+            if backoff:
+                logger.warning(f"Restarting worker process {slot} in {backoff}s")
+
+        if now >= self._next_start[slot]:
+            self._start(slot)
+
+    def _shutdown(self) -> None:
+        """Ask every process to stop gracefully, then kill any that do not."""
+        alive = [proc for proc in self._procs if proc is not None and proc.is_alive()]
+        for proc in alive:
+            proc.terminate()
+
+        # Leave the workers their own graceful shutdown time plus some slack
+        deadline = time.monotonic() + settings.worker_graceful_shutdown_seconds + 10
+        for proc in alive:
+            proc.join(max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                logger.warning(f"Worker process pid {proc.pid} did not stop in time, killing it")
+                proc.kill()
+                proc.join()
+
+    def run(self) -> None:
+        """Run until SIGINT/SIGTERM."""
+        signal.signal(signal.SIGINT, self._request_stop)
+        signal.signal(signal.SIGTERM, self._request_stop)
+
+        logger.info(f"Launching {self.processes} worker processes for pools: {', '.join(self.pools)}")
+        try:
+            while not self._stopping:
+                for slot in range(self.processes):
+                    self._check(slot)
+                time.sleep(1)
+        finally:
+            self._shutdown()
+        logger.info("All worker processes stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run multiple Temporal worker processes")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.worker_processes,
+        help="Number of worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--pools",
+        default=settings.worker_pools,
+        help=f"Comma-separated worker pools each process runs ({', '.join(POOLS)})",
+    )
+    args = parser.parse_args()
+
+    processes = args.processes or os.cpu_count() or 1
+    WorkerSupervisor(processes, parse_pools(args.pools)).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Worker concurrency and poller tuning.
+
+In "manual" mode the values come straight from ``Settings``. In "auto" mode
+they are derived from the CPU count and the activity mix:
+
+- Workflow tasks are CPU-bound Python, so workflow task slots and pollers
+  scale with the number of cores.
+- Activities are mostly waiting on external services, so activity slots are
+  larger and split between the light and heavy pools by the share of heavy
+  activity executions. That share comes from
+  ``WORKER_AUTO_HEAVY_ACTIVITY_SHARE`` (e.g. measured from production
+  metrics); when unset, the share of heavy activities registered is used.
+"""
+
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+
+from activities import HEAVY_ACTIVITIES, LIGHT_ACTIVITIES
+from config.settings import settings
+
+
+@dataclass(frozen=True)
+class WorkerTuning:
+    """Effective concurrency, poller and cache limits for the worker pools."""
+
+    max_concurrent_workflow_tasks: int
+    max_concurrent_light_activities: int
+    max_concurrent_heavy_activities: int
+    max_concurrent_workflow_task_polls: int
+    max_concurrent_activity_task_polls: int
+    max_cached_workflows: int
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def heavy_activity_share() -> float:
+    """Share of activity executions expected to run on the heavy pool."""
+    if settings.worker_auto_heavy_activity_share is not None:
+        return settings.worker_auto_heavy_activity_share
+    return len(HEAVY_ACTIVITIES) / (len(HEAVY_ACTIVITIES) + len(LIGHT_ACTIVITIES))
+
+
+def resolve_worker_tuning(cpu_count: Optional[int] = None) -> WorkerTuning:
+    """Resolve the tuning for this process from settings or auto-sizing.
+
+    Args:
+        cpu_count: Cores available to this process (defaults to os.cpu_count())
+    """
+    if settings.worker_tuning_mode == "manual":
+        return WorkerTuning(
+            max_concurrent_workflow_tasks=settings.worker_max_concurrent_workflow_tasks,
+            max_concurrent_light_activities=settings.worker_light_max_concurrent_activities,
+            max_concurrent_heavy_activities=settings.worker_heavy_max_concurrent_activities,
+            max_concurrent_workflow_task_polls=settings.worker_max_concurrent_workflow_task_polls,
+            max_concurrent_activity_task_polls=settings.worker_max_concurrent_activity_task_polls,
+            max_cached_workflows=settings.worker_max_cached_workflows,
+        )
+
+    cpus = cpu_count or os.cpu_count() or 1
+    heavy_share = heavy_activity_share()
+
+    max_concurrent_workflow_tasks = 10 * cpus
+    return WorkerTuning(
+        max_concurrent_workflow_tasks=max_concurrent_workflow_tasks,
+        max_concurrent_light_activities=max(10, round(50 * cpus * (1 - heavy_share))),
+        max_concurrent_heavy_activities=max(2, round(10 * cpus * heavy_share)),
+        # Keep at least two pollers so sticky and non-sticky queues are both polled
+        max_concurrent_workflow_task_polls=max(2, min(cpus, 16)),
+        max_concurrent_activity_task_polls=max(2, min(2 * cpus, 32)),
+        # Enough cached workflows that in-flight ones are rarely evicted
+        max_cached_workflows=max(settings.worker_max_cached_workflows, 10 * max_concurrent_workflow_tasks),
+    )
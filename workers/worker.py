@@ -1,17 +1,26 @@
 """Temporal worker implementation."""
 
+import argparse
 import asyncio
 import logging
+import signal
 import sys
+from datetime import timedelta
 from pathlib import Path
+from typing import List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+from temporalio.client import Client
 from temporalio.worker import Worker
 
 from client.temporal_client import get_temporal_client
 from config.settings import settings
+from storage.memo_cache import memo_cache_stats
+from workers.tuning import WorkerTuning, resolve_worker_tuning
+from workflows.creatives_workflows.creative_workflow import parse_required_channels
+from workflows.researcher_workflows.sources import parse_required_sources
 from workflows import (
     MarketingOrchestratorWorkflow,
     ResearcherWorkflow,
@@ -29,30 +38,7 @@ from workflows import (
     PollMeasurementsWorkflow,
     RetrievalWorkflow,
 )
-from activities import (
-    # Researcher activities
-    compile_research_input_activity,
-    summarise_research_findings_activity,
-    research_brief_activity,
-    research_concept_note_activity,
-    # Creative activities
-    prepare_creative_inputs_activity,
-    consolidate_creatives_activity,
-    sms_generation_activity,
-    image_generation_activity,
-    video_generation_activity,
-    email_template_generation_activity,
-    # GoLive activities
-    prepare_media_plan_activity,
-    summarise_media_buy_report_activity,
-    media_buying_activity,
-    deployment_activity,
-    # Measurements activities
-    fetch_previous_metrics_activity,
-    aggregate_measurements_activity,
-    poll_measurements_activity,
-    retrieval_activity,
-)
+from activities import HEAVY_ACTIVITIES, LIGHT_ACTIVITIES
 
 # Configure logging
 logging.basicConfig(
@@ -61,81 +47,174 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# All workflows served by the workflow pool
+WORKFLOWS = [
+    # Main orchestrator
+    MarketingOrchestratorWorkflow,
+    # Researcher workflows
+    ResearcherWorkflow,
+    ResearchBriefWorkflow,
+    ResearchConceptNoteWorkflow,
+    # Creative workflows
+    CreativeWorkflow,
+    SMSGenerationWorkflow,
+    ImageGenerationWorkflow,
+    VideoGenerationWorkflow,
+    EmailTemplateWorkflow,
+    # GoLive workflows
+    GoLiveWorkflow,
+    MediaBuyingWorkflow,
+    DeploymentWorkflow,
+    # Measurements workflows
+    MeasurementsWorkflow,
+    PollMeasurementsWorkflow,
+    RetrievalWorkflow,
+]
+
+# Worker pools: workflow tasks, lightweight activities and heavy generation activities
+POOLS = ("workflow", "light", "heavy")
+
+
+def parse_pools(value: str) -> List[str]:
+    """Parse a comma-separated list of worker pools."""
+    pools = [pool.strip() for pool in value.split(",") if pool.strip()]
+    unknown = set(pools) - set(POOLS)
+    if unknown or not pools:
+        raise ValueError(f"Invalid worker pools {value!r}, expected a subset of {', '.join(POOLS)}")
+    return pools
+
+
+def validate_workflow_settings() -> None:
+    """Check the settings that workflow code parses.
+
+    Raises ValueError on a bad value, so the worker fails at startup instead
+    of failing (and endlessly retrying) the workflow tasks that read it.
+    """
+    parse_required_channels(settings.creative_required_channels)
+    parse_required_sources(settings.research_required_sources)
+    if settings.measurements_polling_mode == "continuous" and not settings.claim_check_enabled:
+        # Otherwise every poll writes the whole aggregation table to history twice
+        raise ValueError("MEASUREMENTS_POLLING_MODE=continuous requires CLAIM_CHECK_ENABLED=true")
+
+
+def build_workers(client: Client, pools: List[str], tuning: Optional[WorkerTuning] = None) -> List[Worker]:
+    """Create one worker per requested pool, each on its own task queue."""
+    tuning = tuning or resolve_worker_tuning()
+    workers = []
+
+    if "workflow" in pools:
+        validate_workflow_settings()
+        workers.append(Worker(
+            client,
+            task_queue=settings.temporal_task_queue,
+            workflows=WORKFLOWS,
+            max_concurrent_workflow_tasks=tuning.max_concurrent_workflow_tasks,
+            max_concurrent_workflow_task_polls=tuning.max_concurrent_workflow_task_polls,
+            max_cached_workflows=tuning.max_cached_workflows,
+        ))
+        logger.info(f"Workflow pool: {len(WORKFLOWS)} workflows on '{settings.temporal_task_queue}'")
+
+    if "light" in pools:
+        workers.append(Worker(
+            client,
+            task_queue=settings.temporal_light_activity_task_queue,
+            activities=LIGHT_ACTIVITIES,
+            max_concurrent_activities=tuning.max_concurrent_light_activities,
+            max_concurrent_activity_task_polls=tuning.max_concurrent_activity_task_polls,
+            graceful_shutdown_timeout=timedelta(seconds=settings.worker_graceful_shutdown_seconds),
+        ))
+        logger.info(f"Light activity pool: {len(LIGHT_ACTIVITIES)} activities on '{settings.temporal_light_activity_task_queue}'")
+
+    if "heavy" in pools:
+        workers.append(Worker(
+            client,
+            task_queue=settings.temporal_heavy_activity_task_queue,
+            activities=HEAVY_ACTIVITIES,
+            max_concurrent_activities=tuning.max_concurrent_heavy_activities,
+            max_concurrent_activity_task_polls=tuning.max_concurrent_activity_task_polls,
+            graceful_shutdown_timeout=timedelta(seconds=settings.worker_graceful_shutdown_seconds),
+        ))
+        logger.info(f"Heavy activity pool: {len(HEAVY_ACTIVITIES)} activities on '{settings.temporal_heavy_activity_task_queue}'")
+
+    return workers
+
+
+async def main(pools: Optional[List[str]] = None, cpu_count: Optional[int] = None):
+    """Run the Temporal worker pools until SIGINT/SIGTERM, then shut down gracefully.
+
+    Args:
+        pools: Worker pools to run (defaults to WORKER_POOLS)
+        cpu_count: Cores available to this process, for auto tuning
+    """
+    pools = pools or parse_pools(settings.worker_pools)
 
-async def main():
-    """Run the Temporal worker."""
     logger.info("Starting Temporal worker...")
     logger.info(f"Connecting to Temporal server at {settings.temporal_host}")
 
     # Get Temporal client (reusable singleton)
     client = await get_temporal_client()
 
-    logger.info(f"Task queue: {settings.temporal_task_queue}")
-
-    # Create worker with all workflows and activities
-    worker = Worker(
-        client,
-        task_queue=settings.temporal_task_queue,
-        workflows=[
-            # Main orchestrator
-            MarketingOrchestratorWorkflow,
-            # Researcher workflows
-            ResearcherWorkflow,
-            ResearchBriefWorkflow,
-            ResearchConceptNoteWorkflow,
-            # Creative workflows
-            CreativeWorkflow,
-            SMSGenerationWorkflow,
-            ImageGenerationWorkflow,
-            VideoGenerationWorkflow,
-            EmailTemplateWorkflow,
-            # GoLive workflows
-            GoLiveWorkflow,
-            MediaBuyingWorkflow,
-            DeploymentWorkflow,
-            # Measurements workflows
-            MeasurementsWorkflow,
-            PollMeasurementsWorkflow,
-            RetrievalWorkflow,
-        ],
-        activities=[
-            # Researcher activities
-            compile_research_input_activity,
-            summarise_research_findings_activity,
-            research_brief_activity,
-            research_concept_note_activity,
-            # Creative activities
-            prepare_creative_inputs_activity,
-            consolidate_creatives_activity,
-            sms_generation_activity,
-            image_generation_activity,
-            video_generation_activity,
-            email_template_generation_activity,
-            # GoLive activities
-            prepare_media_plan_activity,
-            summarise_media_buy_report_activity,
-            media_buying_activity,
-            deployment_activity,
-            # Measurements activities
-            fetch_previous_metrics_activity,
-            aggregate_measurements_activity,
-            poll_measurements_activity,
-            retrieval_activity,
-        ],
-    )
+    # Resolve concurrency/poller limits and log the effective values
+    tuning = resolve_worker_tuning(cpu_count)
+    logger.info(f"Worker tuning ({settings.worker_tuning_mode}):")
+    for name, value in tuning.to_dict().items():
+        logger.info(f"  {name} = {value}")
+
+    # Create one worker per pool
+    workers = build_workers(client, pools, tuning)
 
     logger.info("=" * 60)
     logger.info("Worker started and listening for tasks!")
-    logger.info("Registered 14 workflows and 18 activities")
+    logger.info(f"Running pools: {', '.join(pools)}")
     logger.info("=" * 60)
 
-    # Run the worker
-    await worker.run()
+    # Stop on SIGINT/SIGTERM (e.g. from the multi-process launcher)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    # Run the workers
+    run_task = asyncio.gather(*(worker.run() for worker in workers))
+    stop_task = asyncio.ensure_future(stop.wait())
+    await asyncio.wait([run_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+
+    if stop.is_set():
+        logger.info("Shutting down workers, waiting for running tasks to finish...")
+        await asyncio.gather(*(worker.shutdown() for worker in workers))
+    else:
+        stop_task.cancel()
+    await run_task
+    for backend, stats in memo_cache_stats().items():
+        logger.info(f"Memo cache ({backend}): {stats}")
+    logger.info("Workers stopped")
+
+
+def metrics_bind_address(address: str, slot: int) -> str:
+    """Offset the port of a host:port metrics address by a launcher slot."""
+    host, port = address.rsplit(":", 1)
+    return f"{host}:{int(port) + slot}"
+
+
+def run_worker_process(pools: List[str], cpu_count: Optional[int] = None, slot: int = 0) -> None:
+    """Entry point for worker processes started by the launcher."""
+    if settings.temporal_metrics_bind_address is not None:
+        # Every process serves its metrics on a port of its own
+        settings.temporal_metrics_bind_address = metrics_bind_address(settings.temporal_metrics_bind_address, slot)
+    asyncio.run(main(pools, cpu_count))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Temporal worker pools")
+    parser.add_argument(
+        "--pools",
+        default=settings.worker_pools,
+        help=f"Comma-separated worker pools to run ({', '.join(POOLS)})",
+    )
+    args = parser.parse_args()
+
     try:
-        asyncio.run(main())
+        asyncio.run(main(parse_pools(args.pools)))
     except KeyboardInterrupt:
         logger.info("Worker stopped by user")
     except Exception as e:
@@ -0,0 +1,36 @@
+"""Update-based approval decisions for stage workflows.
+
+Besides the fire-and-forget approval signals, every stage workflow accepts a
+``submit_decision`` update. Its validator rejects the decision unless the
+stage is waiting for approval right now, so the caller learns synchronously
+whether the decision was taken instead of polling ``get_approval_status``.
+"""
+
+from typing import Dict, Any
+
+SUBMIT_DECISION_UPDATE = "submit_decision"
+
+# Decision -> approval status it sets
+DECISION_STATUSES = {
+    "approve": "approved",
+    "reject": "rejected",
+    "feedback": "feedback",
+}
+
+# Stage -> suffix of its child workflow ID under the orchestrator
+STAGE_WORKFLOW_ID_SUFFIXES = {
+    "research": "researcher",
+    "creative": "creative",
+    "golive": "golive",
+    "measurements": "measurements",
+}
+
+
+def validate_decision(stage: str, decision: Dict[str, Any], awaiting_approval: bool, approval_status: str) -> None:
+    """Reject a decision that is malformed or arrives while the stage isn't awaiting approval."""
+    if decision.get("decision") not in DECISION_STATUSES:
+        raise ValueError(f"Unknown decision: {decision.get('decision')} (expected approve, reject or feedback)")
+    if decision.get("targets") and (decision["decision"] != "feedback" or stage != "creative"):
+        raise ValueError("Feedback targets are only supported for creative feedback")
+    if not awaiting_approval or approval_status != "pending":
+        raise ValueError(f"The {stage} stage is not awaiting approval")
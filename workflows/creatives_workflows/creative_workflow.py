@@ -1,19 +1,106 @@
-"""Main creative workflow."""
+"""Main creative workflow.
+
+The stage only runs the creative generators of the campaign's channels (see
+``registry.py``), ``CREATIVE_VARIANTS_PER_CHANNEL`` times each for A/B tests
+and at most ``CREATIVE_MAX_CONCURRENT_GENERATIONS`` at once.
+
+Creatives are collected in completion order. Each finished creative is
+recorded right away and can be read with the ``get_creative_results``
+query. Creatives go to approval as soon as the generators in
+``CREATIVE_REQUIRED_CHANNELS`` are ready (all of the campaign's generators
+if it has none of them). The other generators keep running until the
+decision; each one that finishes before it is consolidated into the
+creatives awaiting approval, which are sent for approval again. The
+decision applies to the creatives last sent for approval (marked
+``awaiting_approval`` in the query), and creatives still generating are
+cancelled. A failed required generator fails the stage; with
+``CREATIVE_FAIL_FAST`` the other creatives are cancelled at once instead of
+being allowed to finish.
+
+Feedback can target creatives (``{"feedback": "...", "targets": [...]}``,
+see ``revision.py``). Only the targeted creatives are generated again, from
+the previous round's inputs with the feedback attached; the others are
+reused from the previous round's output.
+"""
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
+from temporalio.exceptions import ApplicationError
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 
 with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
+    from config.settings import settings
     from activities.creative_activities import (
         prepare_creative_inputs_activity,
         consolidate_creatives_activity,
     )
-    from workflows.creatives_workflows.sms_generation_workflow import SMSGenerationWorkflow
-    from workflows.creatives_workflows.image_generation_workflow import ImageGenerationWorkflow
-    from workflows.creatives_workflows.video_generation_workflow import VideoGenerationWorkflow
-    from workflows.creatives_workflows.email_template_workflow import EmailTemplateWorkflow
+    # Importing the built-in generator steps registers them
+    import workflows.creatives_workflows.sms_generation_workflow  # noqa: F401
+    import workflows.creatives_workflows.image_generation_workflow  # noqa: F401
+    import workflows.creatives_workflows.video_generation_workflow  # noqa: F401
+    import workflows.creatives_workflows.email_template_workflow  # noqa: F401
+    from workflows.creatives_workflows.registry import (
+        creative_generator_names,
+        generators_for_channels,
+        get_creative_generator,
+        has_creative_generator,
+    )
+    from workflows.revision import (
+        new_revision_state,
+        record_feedback,
+        split_feedback,
+        with_revision_context,
+        should_continue_as_new,
+    )
+    from workflows.pipelining import notify_pending_output
+    from workflows.progress import AWAITING_APPROVAL, REVISING, APPROVED, notify_stage_progress
+    from workflows.approvals import SUBMIT_DECISION_UPDATE, DECISION_STATUSES, validate_decision
+
+# Creative states
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def parse_required_channels(value: str) -> List[str]:
+    """Parse the comma-separated required creative generators.
+
+    Raises ValueError on unknown generators; the worker checks the setting
+    at startup, so workflow code never raises it.
+    """
+    channels = [channel.strip() for channel in value.split(",") if channel.strip()]
+    names = creative_generator_names()
+    unknown = set(channels) - set(names)
+    if unknown or not channels:
+        raise ValueError(f"Invalid creative channels {value!r}, expected a subset of {', '.join(names)}")
+    return channels
+
+
+def variant_keys(generator: str, variants: int) -> List[str]:
+    """Creative keys (and child workflow ID suffixes) of a generator's variants."""
+    if variants == 1:
+        return [generator]
+    return [f"{generator}-v{index}" for index in range(1, variants + 1)]
+
+
+def resolve_feedback_targets(targets: List[str], plan: Dict[str, str]) -> List[str]:
+    """Creative keys addressed by feedback targets.
+
+    A target is a creative key (``sms-v2``), a generator (``sms``, all its
+    variants) or a campaign channel (``social``). ``plan`` maps the round's
+    creative keys to their generators.
+    """
+    keys: List[str] = []
+    for target in targets:
+        generators = [target] if target in plan.values() else generators_for_channels([target])
+        for key, generator in plan.items():
+            if (key == target or generator in generators) and key not in keys:
+                keys.append(key)
+    return keys
 
 
 @workflow.defn(name="CreativeWorkflow")
@@ -23,107 +110,316 @@ class CreativeWorkflow:
     def __init__(self) -> None:
         self.approval_status: str = "pending"
         self.approval_feedback: str = ""
+        # Creatives/channels the latest feedback is about (None = all)
+        self.feedback_targets: Optional[List[str]] = None
+        self.awaiting_approval: bool = False
+        # Inputs the current round's creatives were generated from
+        self._creative_inputs: Optional[Dict[str, Any]] = None
+        # Creative key -> {"generator", "variant", "status", "output" or "error"}
+        # for the current round
+        self.creatives: Dict[str, Dict[str, Any]] = {}
+        self._creative_tasks: Dict[asyncio.Task, str] = {}
 
     @workflow.run
-    async def run(self, research_output: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute creative workflow."""
+    async def run(
+        self,
+        research_output: Dict[str, Any],
+        revision: Optional[Dict[str, Any]] = None,
+        prepared_inputs: Optional[Dict[str, Any]] = None,
+        channels: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Execute creative workflow.
+
+        Args:
+            research_output: Approved output of the research stage
+            revision: Revision state carried over from a previous run that
+                continued as new
+            prepared_inputs: Creative inputs the orchestrator already prepared
+                from research_output in pipelined mode
+            channels: Campaign channels to generate creatives for (all
+                generators if not given)
+        """
         workflow.logger.info(f"Starting CreativeWorkflow with research_output: {research_output}")
 
-        # Step 1: Prepare creative inputs
-        creative_inputs = await workflow.execute_activity(
-            prepare_creative_inputs_activity,
-            research_output,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        revision = new_revision_state(revision)
+        rounds_in_run = 0
 
-        # Step 2: Execute all creative generation workflows in parallel
-        workflow.logger.info("Executing creative generation workflows in parallel")
+        while True:
+            await self._generate_creatives(
+                with_revision_context(research_output, revision),
+                prepared_inputs,
+                channels,
+                revision,
+            )
+            # Prepared inputs only match the first round's input
+            prepared_inputs = None
 
-        sms_task = workflow.execute_child_workflow(
-            SMSGenerationWorkflow.run,
-            creative_inputs,
-            id=f"{workflow.info().workflow_id}-sms",
-            task_queue=workflow.info().task_queue,
-        )
+            # Step 3: Consolidate the creatives and send them for approval
+            creative_outputs, consolidated = await self._submit_for_approval()
+            await notify_stage_progress("creative", AWAITING_APPROVAL, revision["round"])
 
-        image_task = workflow.execute_child_workflow(
-            ImageGenerationWorkflow.run,
-            creative_inputs,
-            id=f"{workflow.info().workflow_id}-image",
-            task_queue=workflow.info().task_queue,
-        )
+            # Step 4: Human-in-the-middle - Wait for approval signal, updating
+            # the creatives awaiting approval as optional ones finish
+            workflow.logger.info("Waiting for creative approval signal...")
+            self.awaiting_approval = True
+            while True:
+                await workflow.wait_condition(
+                    lambda: self.approval_status != "pending"
+                    or len(self._completed_outputs()) > len(creative_outputs)
+                )
+                if self.approval_status != "pending":
+                    break
+                workflow.logger.info("More creatives finished, updating the creatives awaiting approval")
+                creative_outputs, consolidated = await self._submit_for_approval(creative_outputs, consolidated)
+            self.awaiting_approval = False
 
-        video_task = workflow.execute_child_workflow(
-            VideoGenerationWorkflow.run,
-            creative_inputs,
-            id=f"{workflow.info().workflow_id}-video",
-            task_queue=workflow.info().task_queue,
-        )
+            # The decision covers the creatives sent for approval; channels
+            # still generating are not part of it
+            await self._cancel_creatives()
 
-        email_task = workflow.execute_child_workflow(
-            EmailTemplateWorkflow.run,
-            creative_inputs,
-            id=f"{workflow.info().workflow_id}-email",
-            task_queue=workflow.info().task_queue,
-        )
+            #step 5: Handle approval or rejection
+            if self.approval_status == "feedback":
+                workflow.logger.info(
+                    f"Feedback received: {self.approval_feedback}. "
+                    f"Rerunning creative generation for: {self.feedback_targets or 'all creatives'}"
+                )
+                revision = record_feedback(revision, self.approval_feedback, creative_outputs, self.feedback_targets)
+                rounds_in_run += 1
+                self.approval_status = "pending"
+                await notify_stage_progress("creative", REVISING, revision["round"])
+                if should_continue_as_new(rounds_in_run):
+                    workflow.logger.info(f"Continuing as new after revision round {revision['round']}")
+                    workflow.continue_as_new(args=[research_output, revision, None, channels])
+                continue
+
+            if self.approval_status == "approved":
+                workflow.logger.info("Creatives approved!")
+                await notify_stage_progress("creative", APPROVED, revision["round"])
+                return {
+                    "status": "approved",
+                    "approval_feedback": self.approval_feedback,
+                    "creative_outputs": creative_outputs,
+                    "consolidated": consolidated,
+                }
+
+            if self.approval_status == "rejected":
+                workflow.logger.warning(f"Creatives rejected: {self.approval_feedback}")
+                raise Exception(f"Creatives rejected: {self.approval_feedback}")
 
-        # Wait for all creative workflows to complete
-        sms_result = await sms_task
-        image_result = await image_task
-        video_result = await video_task
-        email_result = await email_task
-
-        # Step 3: Consolidate all creatives
-        creative_outputs = {
-            "sms": sms_result,
-            "image": image_result,
-            "video": video_result,
-            "email": email_result,
+    async def _generate_creatives(
+        self,
+        research_output: Dict[str, Any],
+        creative_inputs: Optional[Dict[str, Any]] = None,
+        channels: Optional[List[str]] = None,
+        revision: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Generate the campaign's creatives for one approval round.
+
+        Returns once the required creatives are ready. If the revision's
+        feedback targets some creatives, the others are reused from its
+        previous output.
+        """
+        generators = generators_for_channels(channels)
+        if not generators:
+            # Nothing to approve, and retrying won't add a generator
+            raise ApplicationError(
+                f"No creative generator serves the campaign channels {channels}",
+                type="NoCreativeGenerator",
+                non_retryable=True,
+            )
+        variants = settings.creative_variants_per_channel
+        plan = {
+            key: generator
+            for generator in generators
+            for key in variant_keys(generator, variants)
         }
 
+        reused: Dict[str, Any] = {}
+        if revision and revision.get("targets") and revision.get("previous_output"):
+            targeted = resolve_feedback_targets(revision["targets"], plan)
+            if targeted:
+                reused = {
+                    key: output
+                    for key, output in revision["previous_output"].items()
+                    if key in plan and key not in targeted
+                }
+                workflow.logger.info(f"Regenerating {targeted}, reusing {list(reused)}")
+            else:
+                workflow.logger.warning(f"Feedback targets {revision['targets']} match no creative, regenerating all")
+
+        # Step 1: Prepare creative inputs (unless already prepared speculatively,
+        # or only some creatives are regenerated from the previous inputs)
+        if creative_inputs is None and reused and self._creative_inputs is not None:
+            creative_inputs = with_revision_context(self._creative_inputs, revision)
+        if creative_inputs is None:
+            creative_inputs = await workflow.execute_activity(
+                prepare_creative_inputs_activity,
+                research_output,
+                task_queue=activity_task_queue(prepare_creative_inputs_activity),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=1),
+                ),
+            )
+
+        self._creative_inputs = creative_inputs
+
+        # Step 2: Execute the generators of the campaign's channels in parallel
+        for channel in channels or []:
+            if not has_creative_generator(channel):
+                workflow.logger.warning(f"No creative generator for channel: {channel}")
+        required = [
+            generator for generator in parse_required_channels(settings.creative_required_channels)
+            if generator in generators
+        ]
+        if not required:
+            # None of the campaign's generators is required; wait for all of
+            # them rather than send nothing for approval
+            required = generators
+        workflow.logger.info(f"Executing creative generators in parallel: {generators} ({variants} variant(s) each)")
+
+        semaphore = None
+        if settings.creative_max_concurrent_generations > 0:
+            semaphore = asyncio.Semaphore(settings.creative_max_concurrent_generations)
+
+        self.creatives = {}
+        self._creative_tasks = {}
+        for generator in generators:
+            for variant, key in enumerate(variant_keys(generator, variants), start=1):
+                if key in reused:
+                    self.creatives[key] = {
+                        "generator": generator,
+                        "variant": variant,
+                        "status": COMPLETED,
+                        "output": reused[key],
+                        "reused": True,
+                    }
+                    continue
+                variant_inputs = creative_inputs
+                if variants > 1:
+                    variant_inputs = {**creative_inputs, "variant": variant, "variants": variants}
+                self.creatives[key] = {"generator": generator, "variant": variant, "status": RUNNING}
+                task = asyncio.create_task(self._generate_creative(generator, key, variant_inputs, semaphore))
+                self._creative_tasks[task] = key
+
+        # Collect results in completion order until the required generators are ready
+        failure: Optional[BaseException] = None
+        while self._creative_tasks and not self._generators_ready(required):
+            done, _ = await workflow.wait(list(self._creative_tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                creative = self.creatives[self._record_creative(task)]
+                if creative["status"] == FAILED and creative["generator"] in required and failure is None:
+                    failure = task.exception()
+
+            if failure is not None and settings.creative_fail_fast:
+                workflow.logger.warning("Required creative generator failed, cancelling the other creatives")
+                await self._cancel_creatives()
+
+        if failure is not None:
+            await self._cancel_creatives()
+            raise failure
+
+        # Optional creatives still running are recorded as they finish
+        for task in self._creative_tasks:
+            task.add_done_callback(self._record_creative)
+
+    async def _submit_for_approval(
+        self,
+        previous_outputs: Optional[Dict[str, Any]] = None,
+        previous_consolidated: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Consolidate the completed creatives and send them for approval.
+
+        Returns the creatives and consolidation awaiting approval. If a
+        decision arrives while consolidating, the previous ones stay
+        awaiting approval, since the decision was made on them.
+        """
+        creative_outputs = self._completed_outputs()
         consolidated = await workflow.execute_activity(
             consolidate_creatives_activity,
             creative_outputs,
+            task_queue=activity_task_queue(consolidate_creatives_activity),
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
                 initial_interval=timedelta(seconds=1),
             ),
         )
+        if previous_outputs is not None and self.approval_status != "pending":
+            return previous_outputs, previous_consolidated
+
+        for key, creative in self.creatives.items():
+            creative["awaiting_approval"] = key in creative_outputs
+        await notify_pending_output(
+            "creative", "creative_outputs", creative_outputs, extra={"consolidated": consolidated}
+        )
+        return creative_outputs, consolidated
+
+    async def _generate_creative(
+        self,
+        generator: str,
+        key: str,
+        creative_inputs: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore],
+    ) -> Dict[str, Any]:
+        """Run one generator step, waiting for a free slot if generations are capped."""
+        step = get_creative_generator(generator)
+        step_id = f"{workflow.info().workflow_id}-{key}"
+        if semaphore is None:
+            return await step.execute(creative_inputs, id=step_id)
+        async with semaphore:
+            return await step.execute(creative_inputs, id=step_id)
 
-        # Step 4: Human-in-the-middle - Wait for approval signal
-        workflow.logger.info("Waiting for creative approval signal...")
-        await workflow.wait_condition(lambda: self.approval_status != "pending")
+    def _generators_ready(self, generators: List[str]) -> bool:
+        return all(
+            creative["status"] == COMPLETED
+            for creative in self.creatives.values()
+            if creative["generator"] in generators
+        )
 
-        #step 5: Handle approval or rejection
-        if self.approval_status == "feedback":
-            workflow.logger.info(f"Feedback received: {self.approval_feedback}. Rerunning creative workflow.")
-            # Rerun the creative workflow with feedback
-            return await self.run(research_output) #pass user feedback to creative generation activities if needed
+    def _completed_outputs(self) -> Dict[str, Any]:
+        return {
+            key: creative["output"]
+            for key, creative in self.creatives.items()
+            if creative["status"] == COMPLETED
+        }
 
-        if self.approval_status == "approved":
-            workflow.logger.info("Creatives approved!")
-            return {
-                "status": "approved",
-                "approval_feedback": self.approval_feedback,
-                "creative_outputs": creative_outputs,
-            }
+    def _record_creative(self, task: asyncio.Task) -> str:
+        """Record a finished creative task's result in the queryable state."""
+        key = self._creative_tasks.pop(task, None)
+        if key is None:
+            # Already recorded
+            return ""
 
-        if self.approval_status == "rejected":
-            workflow.logger.warning(f"Creatives rejected: {self.approval_feedback}")
-            raise Exception(f"Creatives rejected: {self.approval_feedback}")
+        creative = self.creatives[key]
+        if task.cancelled():
+            self.creatives[key] = {**creative, "status": CANCELLED}
+        elif task.exception() is not None:
+            workflow.logger.warning(f"Creative {key} failed: {task.exception()}")
+            self.creatives[key] = {**creative, "status": FAILED, "error": str(task.exception())}
+        else:
+            workflow.logger.info(f"Creative {key} completed")
+            self.creatives[key] = {**creative, "status": COMPLETED, "output": task.result()}
+        return key
 
+    async def _cancel_creatives(self) -> None:
+        """Cancel creatives that are still generating and wait for them."""
+        if not self._creative_tasks:
+            return
+        tasks = list(self._creative_tasks)
+        for task in tasks:
+            task.cancel()
+        await workflow.wait(tasks)
+        for task in tasks:
+            self._record_creative(task)
 
     @workflow.signal(name="provide_feedback")
-    async def provide_feedback(self, feedback: str = "") -> None:
-        """Signal to provide feedback for creatives."""
+    async def provide_feedback(self, feedback: Any = "") -> None:
+        """Signal to provide feedback for creatives, optionally naming the ones to revise."""
         workflow.logger.info("Feedback provided via signal")
         self.approval_status = "feedback"
-        self.approval_feedback = feedback
+        self.approval_feedback, self.feedback_targets = split_feedback(feedback)
 
     @workflow.signal(name="approve_creatives")
     async def approve_creatives(self, feedback: str = "") -> None:
@@ -139,8 +435,26 @@ class CreativeWorkflow:
         self.approval_status = "rejected"
         self.approval_feedback = feedback
 
+    @workflow.update(name=SUBMIT_DECISION_UPDATE)
+    async def submit_decision(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Update to approve, reject or give feedback, accepted only while awaiting approval."""
+        workflow.logger.info(f"Creative decision received via update: {decision['decision']}")
+        self.approval_status = DECISION_STATUSES[decision["decision"]]
+        self.approval_feedback = decision.get("feedback", "")
+        self.feedback_targets = decision.get("targets") or None
+        return {"stage": "creative", "decision": decision["decision"]}
+
+    @submit_decision.validator
+    def validate_submit_decision(self, decision: Dict[str, Any]) -> None:
+        validate_decision("creative", decision, self.awaiting_approval, self.approval_status)
+
     @workflow.query(name="get_approval_status")
     def get_approval_status(self) -> str:
         """Query to get current approval status."""
         return self.approval_status
 
+    @workflow.query(name="get_creative_results")
+    def get_creative_results(self) -> Dict[str, Dict[str, Any]]:
+        """Query the status and output of each creative so far."""
+        return self.creatives
+
@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.creative_activities import email_template_generation_activity
+    from workflows.steps import WorkflowStep
+    from workflows.creatives_workflows.registry import register_creative_generator
 
 
 @workflow.defn(name="EmailTemplateWorkflow")
@@ -18,15 +20,20 @@ class EmailTemplateWorkflow:
         """Execute email template workflow."""
         workflow.logger.info("Starting EmailTemplateWorkflow")
 
-        result = await workflow.execute_activity(
-            email_template_generation_activity,
-            creative_input,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await EMAIL_TEMPLATE_STEP.execute_activity(creative_input)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+EMAIL_TEMPLATE_STEP = WorkflowStep(
+    workflow_run=EmailTemplateWorkflow.run,
+    activity=email_template_generation_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
+
+register_creative_generator("email", EMAIL_TEMPLATE_STEP, channels=["email"])
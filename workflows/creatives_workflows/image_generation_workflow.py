@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.creative_activities import image_generation_activity
+    from workflows.steps import WorkflowStep
+    from workflows.creatives_workflows.registry import register_creative_generator
 
 
 @workflow.defn(name="ImageGenerationWorkflow")
@@ -18,15 +20,20 @@ class ImageGenerationWorkflow:
         """Execute image generation workflow."""
         workflow.logger.info("Starting ImageGenerationWorkflow")
 
-        result = await workflow.execute_activity(
-            image_generation_activity,
-            creative_input,
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await IMAGE_GENERATION_STEP.execute_activity(creative_input)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+IMAGE_GENERATION_STEP = WorkflowStep(
+    workflow_run=ImageGenerationWorkflow.run,
+    activity=image_generation_activity,
+    start_to_close_timeout=timedelta(minutes=10),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
+
+register_creative_generator("image", IMAGE_GENERATION_STEP, channels=["image", "social"])
@@ -0,0 +1,58 @@
+"""Registry of creative generators, keyed by campaign channel.
+
+Each generator is a ``WorkflowStep`` registered under a generator name
+(which is also its child workflow ID suffix) together with the campaign
+channels it serves. The creative stage only fans out to the generators of a
+campaign's channels. To add a channel, define its step and register it in
+the same module, then add its workflow to the worker::
+
+    register_creative_generator("push", PUSH_GENERATION_STEP, channels=["push"])
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from workflows.steps import WorkflowStep
+
+_generators: Dict[str, WorkflowStep] = {}
+_channel_generators: Dict[str, str] = {}
+
+
+def register_creative_generator(name: str, step: WorkflowStep, channels: Iterable[str] = ()) -> None:
+    """Register a creative generator step and the channels it serves."""
+    _generators[name] = step
+    for channel in channels:
+        _channel_generators[channel] = name
+
+
+def get_creative_generator(name: str) -> WorkflowStep:
+    """Get a registered creative generator step."""
+    if name not in _generators:
+        raise ValueError(f"Unknown creative generator: {name}")
+    return _generators[name]
+
+
+def creative_generator_names() -> List[str]:
+    """Names of all registered creative generators, in registration order."""
+    return list(_generators)
+
+
+def has_creative_generator(channel: str) -> bool:
+    """Check whether a channel is served by a registered generator."""
+    return channel in _channel_generators
+
+
+def generators_for_channels(channels: Optional[Iterable[str]]) -> List[str]:
+    """Generators to run for a campaign's channels.
+
+    Without channels every generator runs. Channels with no generator are
+    skipped, and generators serving several channels run once.
+    """
+    if channels is None:
+        return creative_generator_names()
+
+    names: List[str] = []
+    for channel in channels:
+        name = _channel_generators.get(channel)
+        if name is not None and name not in names:
+            names.append(name)
+    return names
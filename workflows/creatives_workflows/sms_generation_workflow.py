@@ -7,6 +7,8 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.creative_activities import sms_generation_activity
+    from workflows.steps import WorkflowStep
+    from workflows.creatives_workflows.registry import register_creative_generator
 
 
 @workflow.defn(name="SMSGenerationWorkflow")
@@ -18,15 +20,20 @@ class SMSGenerationWorkflow:
         """Execute SMS generation workflow."""
         workflow.logger.info("Starting SMSGenerationWorkflow")
 
-        result = await workflow.execute_activity(
-            sms_generation_activity,
-            creative_input,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=1,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await SMS_GENERATION_STEP.execute_activity(creative_input)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+SMS_GENERATION_STEP = WorkflowStep(
+    workflow_run=SMSGenerationWorkflow.run,
+    activity=sms_generation_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=1,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
+
+register_creative_generator("sms", SMS_GENERATION_STEP, channels=["sms"])
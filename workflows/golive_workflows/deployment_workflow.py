@@ -7,6 +7,7 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.golive_activities import deployment_activity
+    from workflows.steps import WorkflowStep
 
 
 @workflow.defn(name="DeploymentWorkflow")
@@ -18,15 +19,18 @@ class DeploymentWorkflow:
         """Execute deployment workflow."""
         workflow.logger.info("Starting DeploymentWorkflow")
 
-        result = await workflow.execute_activity(
-            deployment_activity,
-            deployment_data,
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await DEPLOYMENT_STEP.execute_activity(deployment_data)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+DEPLOYMENT_STEP = WorkflowStep(
+    workflow_run=DeploymentWorkflow.run,
+    activity=deployment_activity,
+    start_to_close_timeout=timedelta(minutes=10),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
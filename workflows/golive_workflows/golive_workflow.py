@@ -1,20 +1,26 @@
 """Main GoLive workflow."""
 
-import logging
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
     from activities.golive_activities import (
         prepare_media_plan_activity,
         summarise_media_buy_report_activity,
     )
-    from workflows.golive_workflows.media_buying_workflow import MediaBuyingWorkflow
-    from workflows.golive_workflows.deployment_workflow import DeploymentWorkflow
-
-logger = logging.getLogger(__name__)
+    from workflows.golive_workflows.media_buying_workflow import MEDIA_BUYING_STEP
+    from workflows.golive_workflows.deployment_workflow import DEPLOYMENT_STEP
+    from workflows.revision import (
+        new_revision_state,
+        record_feedback,
+        with_revision_context,
+        should_continue_as_new,
+    )
+    from workflows.progress import AWAITING_APPROVAL, REVISING, APPROVED, notify_stage_progress
+    from workflows.approvals import SUBMIT_DECISION_UPDATE, DECISION_STATUSES, validate_decision
 
 
 @workflow.defn(name="GoLiveWorkflow")
@@ -24,35 +30,109 @@ class GoLiveWorkflow:
     def __init__(self) -> None:
         self.approval_status: str = "pending"
         self.approval_feedback: str = ""
+        self.awaiting_approval: bool = False
 
     @workflow.run
-    async def run(self, creative_output: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute GoLive workflow."""
+    async def run(
+        self,
+        creative_output: Dict[str, Any],
+        revision: Optional[Dict[str, Any]] = None,
+        prepared_media_plan: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Execute GoLive workflow.
+
+        Args:
+            creative_output: Approved output of the creative stage
+            revision: Revision state carried over from a previous run that
+                continued as new
+            prepared_media_plan: Media plan the orchestrator already prepared
+                from creative_output in pipelined mode
+        """
         workflow.logger.info(f"Starting GoLiveWorkflow with creative_output: {creative_output}")
 
-        # Step 1: Prepare media plan
-        media_plan = await workflow.execute_activity(
-            prepare_media_plan_activity,
-            creative_output,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
+        revision = new_revision_state(revision)
+        rounds_in_run = 0
+
+        while True:
+            media_buy_output = await self._buy_media(
+                with_revision_context(creative_output, revision),
+                prepared_media_plan,
+            )
+            # The prepared plan only matches the first round's input
+            prepared_media_plan = None
+
+            # Step 4: Human-in-the-middle - Wait for approval signal
+            await notify_stage_progress("golive", AWAITING_APPROVAL, revision["round"])
+            workflow.logger.info("Waiting for media buy approval signal...")
+            self.awaiting_approval = True
+            await workflow.wait_condition(lambda: self.approval_status != "pending")
+            self.awaiting_approval = False
+
+            # rerun media buy if feedback is provided
+            if self.approval_status == "feedback":
+                workflow.logger.info(f"Feedback received: {self.approval_feedback}")
+                revision = record_feedback(revision, self.approval_feedback, media_buy_output)
+                rounds_in_run += 1
+                # Reset approval status to pending for next iteration
+                self.approval_status = "pending"
+                await notify_stage_progress("golive", REVISING, revision["round"])
+                if should_continue_as_new(rounds_in_run):
+                    workflow.logger.info(f"Continuing as new after revision round {revision['round']}")
+                    workflow.continue_as_new(args=[creative_output, revision])
+                continue
+
+            if self.approval_status == "rejected":
+                workflow.logger.warning(f"Media buy rejected: {self.approval_feedback}")
+                raise Exception(f"Media buy rejected: {self.approval_feedback}")
+
+            break
+
+        workflow.logger.info("Media buy approved! Proceeding to deployment...")
+        await notify_stage_progress("golive", APPROVED, revision["round"])
+
+        # Step 5: Execute deployment step (DeploymentWorkflow)
+        deployment_result = await DEPLOYMENT_STEP.execute(
+            media_buy_output,
+            id=f"{workflow.info().workflow_id}-deployment",
         )
 
-        # Step 2: Execute MediaBuyingWorkflow
-        media_buy_result = await workflow.execute_child_workflow(
-            MediaBuyingWorkflow.run,
+        return {
+            "status": "deployed",
+            "deployment": deployment_result,
+            "media_buy_summary": media_buy_output["media_buy_summary"],
+            "approval_feedback": self.approval_feedback,
+        }
+
+    async def _buy_media(
+        self,
+        creative_output: Dict[str, Any],
+        media_plan: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Plan and buy media for one approval round."""
+        # Step 1: Prepare media plan (unless already prepared speculatively)
+        if media_plan is None:
+            media_plan = await workflow.execute_activity(
+                prepare_media_plan_activity,
+                creative_output,
+                task_queue=activity_task_queue(prepare_media_plan_activity),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=1),
+                ),
+            )
+
+        # Step 2: Execute media buying step (MediaBuyingWorkflow)
+        media_buy_result = await MEDIA_BUYING_STEP.execute(
             media_plan,
             id=f"{workflow.info().workflow_id}-media-buying",
-            task_queue=workflow.info().task_queue,
         )
 
         # Step 3: Summarise media buy report
         media_buy_summary = await workflow.execute_activity(
             summarise_media_buy_report_activity,
             media_buy_result,
+            task_queue=activity_task_queue(summarise_media_buy_report_activity),
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
@@ -60,49 +140,11 @@ class GoLiveWorkflow:
             ),
         )
 
-        media_buy_output = {
-            "media_buy_result": media_buy_result,
-            "media_buy_summary": media_buy_summary,
-        }
-
-        # Step 4: Human-in-the-middle - Wait for approval signal
-        workflow.logger.info("Waiting for media buy approval signal...")
-        await workflow.wait_condition(lambda: self.approval_status != "pending")
-
-        # rerun media buy if feedback is provided
-        if self.approval_status == "feedback":
-            workflow.logger.info(f"Feedback received: {self.approval_feedback}")
-            # Reset approval status to pending for next iteration
-            self.approval_status = "pending"
-            return await self.run(creative_output) # Restart the workflow with the same creative output & feedback
-
-        if self.approval_status == "rejected":
-            workflow.logger.warning(f"Media buy rejected: {self.approval_feedback}")
-            raise Exception(f"Media buy rejected: {self.approval_feedback}")
-
-        workflow.logger.info("Media buy approved! Proceeding to deployment...")
-
-        # Step 5: Execute DeploymentWorkflow
-        if self.approval_status == "approved":
-            logger.info("Media buy approved, starting deployment workflow.")
-
-
-        deployment_result = await workflow.execute_child_workflow(
-            DeploymentWorkflow.run,
-            media_buy_output,
-            id=f"{workflow.info().workflow_id}-deployment",
-            task_queue=workflow.info().task_queue,
-        )
-
         return {
-            "status": "deployed",
-            "deployment": deployment_result,
+            "media_buy_result": media_buy_result,
             "media_buy_summary": media_buy_summary,
-            "approval_feedback": self.approval_feedback,
         }
 
-
-
     @workflow.signal(name="provide_feedback")
     async def provide_feedback(self, feedback: str) -> None:
         """Signal to provide feedback on media buy."""
@@ -124,6 +166,18 @@ class GoLiveWorkflow:
         self.approval_status = "rejected"
         self.approval_feedback = feedback
 
+    @workflow.update(name=SUBMIT_DECISION_UPDATE)
+    async def submit_decision(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Update to approve, reject or give feedback, accepted only while awaiting approval."""
+        workflow.logger.info(f"Media buy decision received via update: {decision['decision']}")
+        self.approval_status = DECISION_STATUSES[decision["decision"]]
+        self.approval_feedback = decision.get("feedback", "")
+        return {"stage": "golive", "decision": decision["decision"]}
+
+    @submit_decision.validator
+    def validate_submit_decision(self, decision: Dict[str, Any]) -> None:
+        validate_decision("golive", decision, self.awaiting_approval, self.approval_status)
+
     @workflow.query(name="get_approval_status")
     def get_approval_status(self) -> str:
         """Query to get current approval status."""
@@ -7,6 +7,7 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.golive_activities import media_buying_activity
+    from workflows.steps import WorkflowStep
 
 
 @workflow.defn(name="MediaBuyingWorkflow")
@@ -18,15 +19,18 @@ class MediaBuyingWorkflow:
         """Execute media buying workflow."""
         workflow.logger.info("Starting MediaBuyingWorkflow")
 
-        result = await workflow.execute_activity(
-            media_buying_activity,
-            media_plan,
-            start_to_close_timeout=timedelta(minutes=10),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await MEDIA_BUYING_STEP.execute_activity(media_plan)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+MEDIA_BUYING_STEP = WorkflowStep(
+    workflow_run=MediaBuyingWorkflow.run,
+    activity=media_buying_activity,
+    start_to_close_timeout=timedelta(minutes=10),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
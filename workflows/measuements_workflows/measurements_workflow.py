@@ -3,15 +3,28 @@
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
+    from config.settings import settings
     from activities.measurements_activities import (
         fetch_previous_metrics_activity,
         aggregate_measurements_activity,
     )
-    from workflows.measuements_workflows.poll_measurements_workflow import PollMeasurementsWorkflow
-    from workflows.measuements_workflows.retrieval_workflow import RetrievalWorkflow
+    from workflows.measuements_workflows.poll_measurements_workflow import (
+        POLL_MEASUREMENTS_STEP,
+        PollMeasurementsWorkflow,
+    )
+    from workflows.measuements_workflows.retrieval_workflow import RETRIEVAL_STEP
+    from workflows.revision import (
+        new_revision_state,
+        record_feedback,
+        with_revision_context,
+        should_continue_as_new,
+    )
+    from workflows.progress import AWAITING_APPROVAL, REVISING, APPROVED, notify_stage_progress
+    from workflows.approvals import SUBMIT_DECISION_UPDATE, DECISION_STATUSES, validate_decision
 
 
 @workflow.defn(name="MeasurementsWorkflow")
@@ -21,18 +34,87 @@ class MeasurementsWorkflow:
     def __init__(self) -> None:
         self.approval_status: str = "pending"
         self.approval_feedback: str = ""
+        self.awaiting_approval: bool = False
+        # Result of the continuous poll, reused by revision rounds
+        self._poll_result: Optional[Dict[str, Any]] = None
 
     @workflow.run
-    async def run(self, deployment_output: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute measurements workflow."""
+    async def run(
+        self,
+        deployment_output: Dict[str, Any],
+        revision: Optional[Dict[str, Any]] = None,
+        poll_result: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Execute measurements workflow.
+
+        Args:
+            deployment_output: Output of the GoLive stage
+            revision: Revision state carried over from a previous run that
+                continued as new
+            poll_result: Continuous poll result carried over from a previous
+                run that continued as new
+        """
         workflow.logger.info(f"Starting MeasurementsWorkflow with deployment_output: {deployment_output}")
+        self._poll_result = poll_result
+
+        revision = new_revision_state(revision)
+        rounds_in_run = 0
+
+        while True:
+            aggregated = await self._measure(deployment_output, revision)
+
+            # Step 4: Human-in-the-middle - Wait for approval signal
+            await notify_stage_progress("measurements", AWAITING_APPROVAL, revision["round"])
+            workflow.logger.info("Waiting for measurements approval signal...")
+            self.awaiting_approval = True
+            await workflow.wait_condition(lambda: self.approval_status != "pending")
+            self.awaiting_approval = False
+
+            #step 4: Handle approval decision
+
+            # rerun if feedback
+            if self.approval_status == "feedback":
+                workflow.logger.info(f"Feedback received: {self.approval_feedback}. Rerunning measurements aggregation...")
+                revision = record_feedback(revision, self.approval_feedback, aggregated)
+                rounds_in_run += 1
+                self.approval_status = "pending"
+                await notify_stage_progress("measurements", REVISING, revision["round"])
+                if should_continue_as_new(rounds_in_run):
+                    workflow.logger.info(f"Continuing as new after revision round {revision['round']}")
+                    workflow.continue_as_new(args=[deployment_output, revision, self._poll_result])
+                continue
+
+            if self.approval_status == "rejected":
+                workflow.logger.warning(f"Measurements rejected: {self.approval_feedback}")
+                raise Exception(f"Measurements rejected: {self.approval_feedback}")
+
+            break
+
+        workflow.logger.info("Measurements approved! Proceeding to retrieval...")
+        await notify_stage_progress("measurements", APPROVED, revision["round"])
+
+        # Step 5: Execute retrieval step (RetrievalWorkflow)
+        retrieval_result = await RETRIEVAL_STEP.execute(
+            aggregated,
+            id=f"{workflow.info().workflow_id}-retrieval",
+        )
+
+        return {
+            "status": "completed",
+            "measurements": aggregated,
+            "retrieval": retrieval_result,
+            "approval_feedback": self.approval_feedback,
+        }
 
+    async def _measure(self, deployment_output: Dict[str, Any], revision: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect and aggregate measurements for one approval round."""
         # Step 1: Fetch previous metrics
         campaign_id = deployment_output.get("deployment", {}).get("deployment_id", "unknown")
 
         previous_metrics = await workflow.execute_activity(
             fetch_previous_metrics_activity,
             campaign_id,
+            task_queue=activity_task_queue(fetch_previous_metrics_activity),
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
@@ -40,23 +122,37 @@ class MeasurementsWorkflow:
             ),
         )
 
-        # Step 2: Execute PollMeasurementsWorkflow
-        poll_result = await workflow.execute_child_workflow(
-            PollMeasurementsWorkflow.run,
-            campaign_id,
-            id=f"{workflow.info().workflow_id}-poll",
-            task_queue=workflow.info().task_queue,
-        )
+        # Step 2: Execute poll step (PollMeasurementsWorkflow)
+        if settings.measurements_polling_mode == "continuous":
+            # Long-running polling always runs as its own child workflow. It
+            # runs once per stage; revision rounds re-aggregate its result
+            # instead of polling the campaign all over again
+            if self._poll_result is None:
+                self._poll_result = await workflow.execute_child_workflow(
+                    PollMeasurementsWorkflow.run,
+                    campaign_id,
+                    id=f"{workflow.info().workflow_id}-poll",
+                    task_queue=workflow.info().task_queue,
+                )
+            else:
+                workflow.logger.info("Reusing the measurements polled for the previous round")
+            poll_result = self._poll_result
+        else:
+            poll_result = await POLL_MEASUREMENTS_STEP.execute(
+                campaign_id,
+                id=f"{workflow.info().workflow_id}-poll",
+            )
 
         # Step 3: Aggregate measurements
-        measurements_data = {
+        measurements_data = with_revision_context({
             "previous": previous_metrics,
             "current": poll_result,
-        }
+        }, revision)
 
-        aggregated = await workflow.execute_activity(
+        return await workflow.execute_activity(
             aggregate_measurements_activity,
             measurements_data,
+            task_queue=activity_task_queue(aggregate_measurements_activity),
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
@@ -64,38 +160,6 @@ class MeasurementsWorkflow:
             ),
         )
 
-        # Step 4: Human-in-the-middle - Wait for approval signal
-        workflow.logger.info("Waiting for measurements approval signal...")
-        await workflow.wait_condition(lambda: self.approval_status != "pending")
-
-        #step 4: Handle approval decision
-
-        # rerun if feedback
-        if self.approval_status == "feedback":
-            workflow.logger.info(f"Feedback received: {self.approval_feedback}. Rerunning measurements aggregation...")
-            return await self.run(deployment_output)  # Rerun the workflow with the same deployment output
-
-        if self.approval_status == "rejected":
-            workflow.logger.warning(f"Measurements rejected: {self.approval_feedback}")
-            raise Exception(f"Measurements rejected: {self.approval_feedback}")
-
-        workflow.logger.info("Measurements approved! Proceeding to retrieval...")
-
-        # Step 5: Execute RetrievalWorkflow
-        retrieval_result = await workflow.execute_child_workflow(
-            RetrievalWorkflow.run,
-            aggregated,
-            id=f"{workflow.info().workflow_id}-retrieval",
-            task_queue=workflow.info().task_queue,
-        )
-
-        return {
-            "status": "completed",
-            "measurements": aggregated,
-            "retrieval": retrieval_result,
-            "approval_feedback": self.approval_feedback,
-        }
-
     @workflow.signal(name="provide_feedback")
     async def provide_feedback(self, feedback: str = "") -> None:
         """Signal to provide feedback on measurements."""
@@ -117,6 +181,18 @@ class MeasurementsWorkflow:
         self.approval_status = "rejected"
         self.approval_feedback = feedback
 
+    @workflow.update(name=SUBMIT_DECISION_UPDATE)
+    async def submit_decision(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Update to approve, reject or give feedback, accepted only while awaiting approval."""
+        workflow.logger.info(f"Measurements decision received via update: {decision['decision']}")
+        self.approval_status = DECISION_STATUSES[decision["decision"]]
+        self.approval_feedback = decision.get("feedback", "")
+        return {"stage": "measurements", "decision": decision["decision"]}
+
+    @submit_decision.validator
+    def validate_submit_decision(self, decision: Dict[str, Any]) -> None:
+        validate_decision("measurements", decision, self.awaiting_approval, self.approval_status)
+
     @workflow.query(name="get_approval_status")
     def get_approval_status(self) -> str:
         """Query to get current approval status."""
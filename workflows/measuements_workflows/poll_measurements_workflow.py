@@ -1,32 +1,211 @@
-"""Poll measurements workflow."""
+"""Poll measurements workflow.
+
+In "single" polling mode the workflow polls once and returns. In
+"continuous" mode it keeps polling a live campaign for
+``MEASUREMENTS_POLL_DURATION_SECONDS`` on durable timers:
+
+- The platform reports cumulative counters. Each poll adds the increase
+  since the previous poll to the running totals (a drop is treated as a
+  counter reset, so the new value counts as the increase).
+- The interval starts at the minimum right after launch and is multiplied
+  by the backoff factor after every poll whose relative growth stays under
+  the stability threshold. Any larger jump resets it to the minimum.
+- Each poll's increase is merged into a per-hour aggregation table
+  (``metrics.aggregation``), so the measurements stage only rolls it up.
+  Once the table is large it travels as a claim-check reference, so it
+  stays out of history; continuous mode therefore requires
+  ``CLAIM_CHECK_ENABLED`` and the worker refuses to start without it.
+- Every ``MEASUREMENTS_POLL_CONTINUE_AS_NEW_EVERY`` polls the workflow
+  continues as new with its polling state, so history stays bounded.
+
+The ``get_measurements_snapshot`` query returns the latest totals at any
+time, and the ``stop_polling`` signal ends the loop early.
+"""
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
-from datetime import timedelta
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+import asyncio
 
 with workflow.unsafe.imports_passed_through():
-    from activities.measurements_activities import poll_measurements_activity
+    from activities.measurements_activities import merge_measurements_activity, poll_measurements_activity
+    from activities.task_queues import activity_task_queue
+    from config.settings import settings
+    from workflows.steps import WorkflowStep
+
+
+def new_polling_state(deployment_id: str) -> Dict[str, Any]:
+    """Return fresh polling state, pinning the polling settings for all runs."""
+    return {
+        "deployment_id": deployment_id,
+        "config": {
+            "min_interval_seconds": settings.measurements_poll_min_interval_seconds,
+            "max_interval_seconds": settings.measurements_poll_max_interval_seconds,
+            "backoff_factor": settings.measurements_poll_backoff_factor,
+            "stable_threshold": settings.measurements_poll_stable_threshold,
+            "duration_seconds": settings.measurements_poll_duration_seconds,
+            "continue_as_new_every": settings.measurements_poll_continue_as_new_every,
+        },
+        "started_at": workflow.now().isoformat(),
+        "polls": 0,
+        "interval_seconds": settings.measurements_poll_min_interval_seconds,
+        "stable_polls": 0,
+        "last_reported": {},
+        "totals": {},
+        "last_delta": {},
+        "last_polled_at": None,
+        # Hourly aggregation table of the increases (or its claim-check reference)
+        "aggregation_state": None,
+        "done": False,
+    }
+
+
+def accumulate_poll(state: Dict[str, Any], reported: Dict[str, Any]) -> Dict[str, Any]:
+    """Add one poll's increase to the totals and adapt the polling interval."""
+    config = state["config"]
+    previous = state["last_reported"]
+
+    delta = {}
+    for metric, value in reported.items():
+        before = previous.get(metric, 0)
+        # A drop means the platform counter was reset
+        delta[metric] = value - before if value >= before else value
+
+    totals = dict(state["totals"])
+    for metric, increase in delta.items():
+        totals[metric] = totals.get(metric, 0) + increase
+
+    previous_total = sum(state["totals"].values())
+    growth = sum(delta.values()) / max(previous_total, 1)
+
+    if state["polls"] > 0 and growth < config["stable_threshold"]:
+        stable_polls = state["stable_polls"] + 1
+        interval = min(state["interval_seconds"] * config["backoff_factor"], config["max_interval_seconds"])
+    else:
+        stable_polls = 0
+        interval = config["min_interval_seconds"]
+
+    return {
+        **state,
+        "polls": state["polls"] + 1,
+        "interval_seconds": interval,
+        "stable_polls": stable_polls,
+        "last_reported": dict(reported),
+        "totals": totals,
+        "last_delta": delta,
+        "last_polled_at": workflow.now().isoformat(),
+    }
 
 
 @workflow.defn(name="PollMeasurementsWorkflow")
 class PollMeasurementsWorkflow:
     """Sub-workflow for polling measurements."""
 
+    def __init__(self) -> None:
+        self.state: Optional[Dict[str, Any]] = None
+        self.stop_requested: bool = False
+
     @workflow.run
-    async def run(self, deployment_id: str) -> Dict[str, Any]:
-        """Execute poll measurements workflow."""
+    async def run(self, deployment_id: str, state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute poll measurements workflow.
+
+        Args:
+            deployment_id: Deployment to poll measurements for
+            state: Polling state carried over from a previous run that
+                continued as new
+        """
         workflow.logger.info("Starting PollMeasurementsWorkflow")
 
-        result = await workflow.execute_activity(
-            poll_measurements_activity,
-            deployment_id,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        if state is None and settings.measurements_polling_mode == "single":
+            result = await POLL_MEASUREMENTS_STEP.execute_activity(deployment_id)
+            return result
+
+        self.state = state or new_polling_state(deployment_id)
+        config = self.state["config"]
+        ends_at = datetime.fromisoformat(self.state["started_at"]) + timedelta(seconds=config["duration_seconds"])
+        polls_in_run = 0
+
+        while True:
+            # Step 1: Poll and fold the increase into the totals
+            result = await POLL_MEASUREMENTS_STEP.execute_activity(deployment_id)
+            self.state = accumulate_poll(self.state, result.get("measurements", {}))
+            polls_in_run += 1
+
+            # Step 2: Merge the increase into the hourly aggregation table
+            hour = int((workflow.now() - datetime.fromisoformat(self.state["started_at"])).total_seconds() // 3600)
+            merged = await workflow.execute_activity(
+                merge_measurements_activity,
+                {
+                    "state": self.state["aggregation_state"],
+                    "measurements": self.state["last_delta"],
+                    "rows": result.get("rows"),
+                    "hour": hour,
+                },
+                task_queue=activity_task_queue(merge_measurements_activity),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=1),
+                ),
+            )
+            self.state = {**self.state, "aggregation_state": merged["state"]}
+
+            remaining = (ends_at - workflow.now()).total_seconds()
+            if self.stop_requested or remaining <= 0:
+                break
+
+            # Step 3: Hand over to a fresh run before history grows too long
+            if polls_in_run >= config["continue_as_new_every"] or workflow.info().is_continue_as_new_suggested():
+                # Let signal handlers delivered with this task run first, so
+                # a stop_polling isn't dropped with this run
+                await workflow.wait_condition(workflow.all_handlers_finished)
+                if self.stop_requested:
+                    break
+                workflow.logger.info(f"Continuing as new after {self.state['polls']} polls")
+                workflow.continue_as_new(args=[deployment_id, self.state])
+
+            # Step 4: Durable timer until the next poll, cut short by stop_polling
+            interval = min(self.state["interval_seconds"], remaining)
+            try:
+                await workflow.wait_condition(lambda: self.stop_requested, timeout=timedelta(seconds=interval))
+                break
+            except asyncio.TimeoutError:
+                # Not an alias of the builtin TimeoutError before Python 3.11
+                pass
+
+        self.state = {**self.state, "done": True}
+        workflow.logger.info(f"Polling finished after {self.state['polls']} polls")
+
+        return {
+            "status": "success",
+            "message": "Measurements polled successfully",
+            "measurements": self.state["totals"],
+            "polls": self.state["polls"],
+            "started_at": self.state["started_at"],
+            "last_polled_at": self.state["last_polled_at"],
+            "aggregation_state": self.state["aggregation_state"],
+        }
+
+    @workflow.signal(name="stop_polling")
+    async def stop_polling(self) -> None:
+        """Signal to end continuous polling after the current poll."""
+        workflow.logger.info("Stop polling requested via signal")
+        self.stop_requested = True
+
+    @workflow.query(name="get_measurements_snapshot")
+    def get_measurements_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Query the latest totals and polling state (None in single mode)."""
+        return self.state
 
-        return result
 
+# Also used by parent stages that call the activity directly
+POLL_MEASUREMENTS_STEP = WorkflowStep(
+    workflow_run=PollMeasurementsWorkflow.run,
+    activity=poll_measurements_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
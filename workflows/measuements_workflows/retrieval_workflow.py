@@ -7,6 +7,7 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.measurements_activities import retrieval_activity
+    from workflows.steps import WorkflowStep
 
 
 @workflow.defn(name="RetrievalWorkflow")
@@ -18,15 +19,18 @@ class RetrievalWorkflow:
         """Execute retrieval workflow."""
         workflow.logger.info("Starting RetrievalWorkflow")
 
-        result = await workflow.execute_activity(
-            retrieval_activity,
-            measurement_data,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await RETRIEVAL_STEP.execute_activity(measurement_data)
 
         return result
 
+
+# Also used by parent stages that call the activity directly
+RETRIEVAL_STEP = WorkflowStep(
+    workflow_run=RetrievalWorkflow.run,
+    activity=retrieval_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
@@ -1,11 +1,28 @@
 """Marketing Orchestrator - Main parent workflow."""
 
 from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.exceptions import ActivityError, ApplicationError, ChildWorkflowError
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional, Tuple
+import asyncio
 import logging
 
 with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
+    from activities.creative_activities import prepare_creative_inputs_activity
+    from activities.golive_activities import prepare_media_plan_activity
+    from config.settings import settings
+    from workflows.pipelining import STAGE_OUTPUT_PENDING_SIGNAL
+    from workflows.stage_signals import QUEUE_STAGE_SIGNALS_SIGNAL
+    from workflows.progress import (
+        STAGE_PROGRESS_SIGNAL,
+        RUNNING,
+        COMPLETED,
+        FAILED,
+        new_campaign_progress,
+        update_stage_progress,
+    )
     from workflows.researcher_workflows.researcher_workflow import ResearcherWorkflow
     from workflows.creatives_workflows.creative_workflow import CreativeWorkflow
     from workflows.golive_workflows.golive_workflow import GoLiveWorkflow
@@ -25,11 +42,32 @@ class MarketingOrchestratorWorkflow:
     3. GoLiveWorkflow - Media buying and campaign deployment
     4. MeasurementsWorkflow - Campaign measurement and analysis
 
-    Each child workflow includes human-in-the-loop approval steps.
+    Each child workflow includes human-in-the-loop approval steps. The
+    campaign's progress (current stage, per-stage state, timestamps and
+    revision rounds) is returned by the get_campaign_status query.
+
+    Signals for stages that haven't started yet can be sent with the
+    queue_stage_signals signal (e.g. with signal-with-start) and are forwarded
+    to each stage when it starts. The wait_for_research_output update returns
+    the first research output, for update-with-start callers.
+
+    In pipelined mode (ORCHESTRATOR_PIPELINED_STAGES) the preparation activity
+    of the next stage runs speculatively on a stage's output while it waits
+    for approval, and is reused if that output gets approved unchanged.
     """
 
+    def __init__(self) -> None:
+        # Latest output awaiting approval, per stage (pipelined mode only)
+        self._pending_outputs: Dict[str, Dict[str, Any]] = {}
+        self._progress: Dict[str, Any] = new_campaign_progress()
+        # Signals waiting for their stage to start, and running stage children
+        self._queued_signals: Dict[str, List[Dict[str, Any]]] = {}
+        self._stage_handles: Dict[str, workflow.ChildWorkflowHandle] = {}
+        self._signal_requests_seen: set = set()
+        self._research_output: Optional[Dict[str, Any]] = None
+
     @workflow.run
-    async def run(self, campaign_input: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, campaign_input: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute the complete marketing orchestration workflow.
 
@@ -41,6 +79,9 @@ class MarketingOrchestratorWorkflow:
                 - budget: Campaign budget
                 - objectives: Campaign objectives
                 - Any other relevant campaign data
+            options: Orchestration options:
+                - notify_research_output: Have the research stage report its
+                  first output (used by wait_for_research_output)
 
         Returns:
             Dict containing results from all workflow stages
@@ -49,17 +90,20 @@ class MarketingOrchestratorWorkflow:
 
         workflow_id = workflow.info().workflow_id
         task_queue = workflow.info().task_queue
+        options = options or {}
 
         # Stage 1: Research Phase
         workflow.logger.info("=" * 60)
         workflow.logger.info("STAGE 1: RESEARCH PHASE")
         workflow.logger.info("=" * 60)
 
-        research_result = await workflow.execute_child_workflow(
+        research_result, creative_inputs = await self._run_stage(
+            "research",
             ResearcherWorkflow.run,
-            campaign_input,
+            [campaign_input, None, options.get("notify_research_output", False)],
             id=f"{workflow_id}-researcher",
             task_queue=task_queue,
+            prepare_next_stage=prepare_creative_inputs_activity,
         )
 
         workflow.logger.info("Research phase completed successfully!")
@@ -69,11 +113,13 @@ class MarketingOrchestratorWorkflow:
         workflow.logger.info("STAGE 2: CREATIVE PHASE")
         workflow.logger.info("=" * 60)
 
-        creative_result = await workflow.execute_child_workflow(
+        creative_result, media_plan = await self._run_stage(
+            "creative",
             CreativeWorkflow.run,
-            research_result,
+            [research_result, None, creative_inputs, campaign_input.get("channels")],
             id=f"{workflow_id}-creative",
             task_queue=task_queue,
+            prepare_next_stage=prepare_media_plan_activity,
         )
 
         workflow.logger.info("Creative phase completed successfully!")
@@ -83,9 +129,10 @@ class MarketingOrchestratorWorkflow:
         workflow.logger.info("STAGE 3: GOLIVE PHASE")
         workflow.logger.info("=" * 60)
 
-        golive_result = await workflow.execute_child_workflow(
+        golive_result, _ = await self._run_stage(
+            "golive",
             GoLiveWorkflow.run,
-            creative_result,
+            [creative_result, None, media_plan],
             id=f"{workflow_id}-golive",
             task_queue=task_queue,
         )
@@ -97,9 +144,10 @@ class MarketingOrchestratorWorkflow:
         workflow.logger.info("STAGE 4: MEASUREMENTS PHASE")
         workflow.logger.info("=" * 60)
 
-        measurements_result = await workflow.execute_child_workflow(
+        measurements_result, _ = await self._run_stage(
+            "measurements",
             MeasurementsWorkflow.run,
-            golive_result,
+            [golive_result],
             id=f"{workflow_id}-measurements",
             task_queue=task_queue,
         )
@@ -121,8 +169,177 @@ class MarketingOrchestratorWorkflow:
             "measurements": measurements_result,
         }
 
+    async def _run_stage(
+        self,
+        stage: str,
+        stage_run: Callable,
+        args: List[Any],
+        *,
+        id: str,
+        task_queue: str,
+        prepare_next_stage: Optional[Callable] = None,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Run a stage child workflow, tracking its progress.
+
+        Returns:
+            The stage result, and the next stage's prepared input if the
+            speculative preparation can be committed (otherwise None)
+        """
+        update_stage_progress(self._progress, stage, RUNNING)
+        try:
+            result, prepared = await self._execute_stage(
+                stage,
+                stage_run,
+                args,
+                id=id,
+                task_queue=task_queue,
+                prepare_next_stage=prepare_next_stage,
+            )
+        except ChildWorkflowError:
+            update_stage_progress(self._progress, stage, FAILED)
+            raise
+
+        update_stage_progress(self._progress, stage, COMPLETED)
+        return result, prepared
+
+    async def _execute_stage(
+        self,
+        stage: str,
+        stage_run: Callable,
+        args: List[Any],
+        *,
+        id: str,
+        task_queue: str,
+        prepare_next_stage: Optional[Callable],
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Execute a stage child workflow, speculating on the next stage in pipelined mode."""
+        handle = await workflow.start_child_workflow(stage_run, args=args, id=id, task_queue=task_queue)
+        self._stage_handles[stage] = handle
+        try:
+            for queued in self._queued_signals.pop(stage, []):
+                await self._forward_stage_signal(handle, queued)
+
+            if not settings.orchestrator_pipelined_stages or prepare_next_stage is None:
+                return await handle, None
+            return await self._await_pipelined_stage(stage, handle, prepare_next_stage)
+        finally:
+            del self._stage_handles[stage]
+
+    async def _await_pipelined_stage(
+        self,
+        stage: str,
+        handle: workflow.ChildWorkflowHandle,
+        prepare_next_stage: Callable,
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Await a stage child, speculatively preparing the next stage while it awaits approval."""
+
+        speculative_input: Optional[Dict[str, Any]] = None
+        speculative_task: Optional[asyncio.Task] = None
+
+        while not handle.done():
+            await workflow.wait_condition(
+                lambda: handle.done() or self._pending_outputs.get(stage) is not speculative_input
+            )
+            pending = self._pending_outputs.get(stage)
+            if handle.done() or pending is None or pending is speculative_input:
+                continue
+            if pending == speculative_input:
+                # Same output after a feedback round - the speculation still applies
+                speculative_input = pending
+                continue
+
+            # A new output is awaiting approval - restart speculation on it
+            if speculative_task is not None:
+                speculative_task.cancel()
+            workflow.logger.info(f"Speculatively preparing next stage from pending {stage} output")
+            speculative_input = pending
+            speculative_task = workflow.start_activity(
+                prepare_next_stage,
+                pending,
+                task_queue=activity_task_queue(prepare_next_stage),
+                start_to_close_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=1),
+                ),
+            )
+
+        result = await handle
+
+        if speculative_task is None:
+            return result, None
+
+        if result != speculative_input:
+            workflow.logger.info(f"Approved {stage} output differs from speculation, discarding it")
+            speculative_task.cancel()
+            return result, None
+
+        try:
+            prepared = await speculative_task
+        except ActivityError as e:
+            workflow.logger.warning(f"Speculative preparation after {stage} failed, next stage will prepare itself: {e}")
+            return result, None
+
+        workflow.logger.info(f"Committing speculative preparation from {stage} output")
+        return result, prepared
+
+    @workflow.signal(name=STAGE_OUTPUT_PENDING_SIGNAL)
+    async def stage_output_pending(self, stage: str, pending_result: Dict[str, Any]) -> None:
+        """Signal from a stage child that its output is awaiting approval."""
+        workflow.logger.info(f"Stage '{stage}' output is awaiting approval")
+        self._pending_outputs[stage] = pending_result
+        if stage == "research" and self._research_output is None:
+            self._research_output = pending_result["research_outputs"]
+
+    @workflow.signal(name=QUEUE_STAGE_SIGNALS_SIGNAL)
+    async def queue_stage_signals(self, request: Dict[str, Any]) -> None:
+        """Signal carrying signals for stage children, forwarded when each stage runs.
+
+        Args:
+            request: Dict with "signals" (each with stage, signal_name and
+                signal_input) and an optional "request_id"; a request ID
+                that was already received is ignored
+        """
+        request_id = request.get("request_id")
+        if request_id is not None:
+            if request_id in self._signal_requests_seen:
+                workflow.logger.info(f"Ignoring repeated stage signals request: {request_id}")
+                return
+            self._signal_requests_seen.add(request_id)
+
+        for queued in request["signals"]:
+            stage = queued["stage"]
+            if stage in self._stage_handles:
+                await self._forward_stage_signal(self._stage_handles[stage], queued)
+            elif self._progress["stages"][stage]["state"] in (COMPLETED, FAILED):
+                workflow.logger.warning(f"Dropping signal '{queued['signal_name']}' for finished stage '{stage}'")
+            else:
+                self._queued_signals.setdefault(stage, []).append(queued)
+
+    async def _forward_stage_signal(self, handle: workflow.ChildWorkflowHandle, queued: Dict[str, Any]) -> None:
+        workflow.logger.info(f"Forwarding signal '{queued['signal_name']}' to {handle.id}")
+        await handle.signal(queued["signal_name"], queued.get("signal_input"))
+
+    @workflow.update(name="wait_for_research_output")
+    async def wait_for_research_output(self) -> Dict[str, Any]:
+        """Update that completes with the research stage's first output."""
+        await workflow.wait_condition(
+            lambda: self._research_output is not None
+            or self._progress["stages"]["research"]["state"] in (COMPLETED, FAILED)
+        )
+        if self._research_output is None:
+            raise ApplicationError("Research stage finished without reporting its output")
+        return self._research_output
+
+    @workflow.signal(name=STAGE_PROGRESS_SIGNAL)
+    async def stage_progress(self, stage: str, state: str, revision_round: int = 0) -> None:
+        """Signal from a stage child reporting its progress."""
+        workflow.logger.info(f"Stage '{stage}' is {state} (revision round {revision_round})")
+        if stage in self._progress["stages"]:
+            update_stage_progress(self._progress, stage, state, revision_round)
+
     @workflow.query
-    def get_campaign_status(self) -> str:
-        """Query to get the current campaign status."""
-        return "running"
+    def get_campaign_status(self) -> Dict[str, Any]:
+        """Query to get the campaign's progress record."""
+        return self._progress
 
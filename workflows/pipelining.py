@@ -0,0 +1,51 @@
+"""Pipelined stage execution helpers.
+
+In pipelined mode a stage workflow tells the orchestrator about its output as
+soon as it starts waiting for approval. The orchestrator uses that pending
+output to speculatively run the next stage's preparation activity while the
+human approval is still outstanding. The speculative result is only handed to
+the next stage if the approved result is exactly the pending output it was
+computed from; any feedback round or approval comment discards it.
+"""
+
+from temporalio import workflow
+from typing import Dict, Any, Optional
+
+with workflow.unsafe.imports_passed_through():
+    from config.settings import settings
+
+STAGE_OUTPUT_PENDING_SIGNAL = "stage_output_pending"
+
+
+def pending_result(output_key: str, output: Dict[str, Any], extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the result a stage would return if approved without comment."""
+    return {
+        "status": "approved",
+        "approval_feedback": "",
+        output_key: output,
+        **(extra or {}),
+    }
+
+
+async def notify_pending_output(
+    stage: str,
+    output_key: str,
+    output: Dict[str, Any],
+    always: bool = False,
+    extra: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Send a stage's output awaiting approval to the parent orchestrator.
+
+    Does nothing unless pipelined mode is enabled (or ``always`` is set) and
+    the stage was started as a child workflow. ``extra`` holds any other keys
+    of the stage's result.
+    """
+    parent = workflow.info().parent
+    if not (settings.orchestrator_pipelined_stages or always) or parent is None:
+        return
+
+    parent_handle = workflow.get_external_workflow_handle(parent.workflow_id)
+    await parent_handle.signal(
+        STAGE_OUTPUT_PENDING_SIGNAL,
+        args=[stage, pending_result(output_key, output, extra)],
+    )
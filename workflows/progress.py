@@ -0,0 +1,74 @@
+"""Stage progress tracking for campaigns.
+
+Stage workflows report when they are awaiting approval, revising after
+feedback and approved by signalling the parent orchestrator. Together with
+the child start/complete events already in the orchestrator's history, this
+gives a complete record of a campaign's stage transitions in one history.
+
+The orchestrator also keeps that record as a compact progress dict, returned
+by its ``get_campaign_status`` query, so one query answers where a campaign
+is instead of describing the parent and querying each stage child.
+"""
+
+from temporalio import workflow
+from typing import Dict, Any, Optional
+
+STAGE_PROGRESS_SIGNAL = "stage_progress"
+
+STAGES = ["research", "creative", "golive", "measurements"]
+
+# Stage progress states tracked by the orchestrator
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Stage progress states reported by stage workflows
+AWAITING_APPROVAL = "awaiting_approval"
+REVISING = "revising"
+APPROVED = "approved"
+
+
+async def notify_stage_progress(stage: str, state: str, revision_round: int = 0) -> None:
+    """Report a stage's progress to the parent orchestrator, if any."""
+    parent = workflow.info().parent
+    if parent is None:
+        return
+
+    parent_handle = workflow.get_external_workflow_handle(parent.workflow_id)
+    await parent_handle.signal(STAGE_PROGRESS_SIGNAL, args=[stage, state, revision_round])
+
+
+def new_campaign_progress() -> Dict[str, Any]:
+    """Return the progress record of a campaign that has not started a stage yet."""
+    return {
+        "status": RUNNING,
+        "current_stage": None,
+        "stages": {
+            stage: {"state": PENDING, "revision_round": 0, "timestamps": {}}
+            for stage in STAGES
+        },
+    }
+
+
+def update_stage_progress(
+    progress: Dict[str, Any],
+    stage: str,
+    state: str,
+    revision_round: Optional[int] = None,
+) -> None:
+    """Move a stage to a new state, recording when it entered that state."""
+    entry = progress["stages"][stage]
+    entry["state"] = state
+    if revision_round is not None:
+        entry["revision_round"] = revision_round
+    # Latest time the stage entered each state
+    entry["timestamps"][state] = workflow.now().isoformat()
+
+    if state == FAILED:
+        progress["status"] = FAILED
+    if state != COMPLETED:
+        progress["current_stage"] = stage
+    elif stage == STAGES[-1]:
+        progress["current_stage"] = None
+        progress["status"] = COMPLETED
@@ -7,6 +7,7 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.researcher_activities import research_brief_activity
+    from workflows.steps import WorkflowStep
 
 
 @workflow.defn(name="ResearchBriefWorkflow")
@@ -18,14 +19,17 @@ class ResearchBriefWorkflow:
         """Execute research brief workflow."""
         workflow.logger.info("Starting ResearchBriefWorkflow")
 
-        result = await workflow.execute_activity(
-            research_brief_activity,
-            input_data,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await RESEARCH_BRIEF_STEP.execute_activity(input_data)
         return result
 
+
+# Also used by parent stages that call the activity directly
+RESEARCH_BRIEF_STEP = WorkflowStep(
+    workflow_run=ResearchBriefWorkflow.run,
+    activity=research_brief_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
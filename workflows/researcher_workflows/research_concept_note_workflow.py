@@ -7,6 +7,7 @@ from typing import Dict, Any
 
 with workflow.unsafe.imports_passed_through():
     from activities.researcher_activities import research_concept_note_activity
+    from workflows.steps import WorkflowStep
 
 
 @workflow.defn(name="ResearchConceptNoteWorkflow")
@@ -18,14 +19,17 @@ class ResearchConceptNoteWorkflow:
         """Execute research concept note workflow."""
         workflow.logger.info("Starting ResearchConceptNoteWorkflow")
 
-        result = await workflow.execute_activity(
-            research_concept_note_activity,
-            brief_data,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
+        result = await RESEARCH_CONCEPT_NOTE_STEP.execute_activity(brief_data)
         return result
 
+
+# Also used by parent stages that call the activity directly
+RESEARCH_CONCEPT_NOTE_STEP = WorkflowStep(
+    workflow_run=ResearchConceptNoteWorkflow.run,
+    activity=research_concept_note_activity,
+    start_to_close_timeout=timedelta(minutes=5),
+    retry_policy=RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ),
+)
@@ -1,17 +1,43 @@
-"""Main researcher workflow."""
+"""Main researcher workflow.
+
+Research inputs are fetched from all research sources in parallel and
+merged as they arrive (see ``sources.py``). The brief starts once the
+required sources have returned, with every optional source that returned
+by then, so research latency is bounded by the slowest required source
+rather than the sum of all sources.
+"""
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
+import asyncio
+
 with workflow.unsafe.imports_passed_through():
-    from activities.researcher_activities import (
-        compile_research_input_activity,
-        summarise_research_findings_activity,
+    from activities.task_queues import activity_task_queue
+    from activities.researcher_activities import summarise_research_findings_activity
+    from config.settings import settings
+    from workflows.researcher_workflows.sources import (
+        COMPLETED,
+        FAILED,
+        SKIPPED,
+        new_compiled_inputs,
+        parse_required_sources,
+        reduce_source,
+        research_sources,
     )
-    from workflows.researcher_workflows.research_brief_workflow import ResearchBriefWorkflow
-    from workflows.researcher_workflows.research_concept_note_workflow import ResearchConceptNoteWorkflow
+    from workflows.researcher_workflows.research_brief_workflow import RESEARCH_BRIEF_STEP
+    from workflows.researcher_workflows.research_concept_note_workflow import RESEARCH_CONCEPT_NOTE_STEP
+    from workflows.revision import (
+        new_revision_state,
+        record_feedback,
+        with_revision_context,
+        should_continue_as_new,
+    )
+    from workflows.pipelining import notify_pending_output
+    from workflows.progress import AWAITING_APPROVAL, REVISING, APPROVED, notify_stage_progress
+    from workflows.approvals import SUBMIT_DECISION_UPDATE, DECISION_STATUSES, validate_decision
 
 
 @workflow.defn(name="ResearcherWorkflow")
@@ -21,43 +47,124 @@ class ResearcherWorkflow:
     def __init__(self) -> None:
         self.approval_status: str = "pending"
         self.approval_feedback: str = ""
+        self.awaiting_approval: bool = False
 
     @workflow.run
-    async def run(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute researcher workflow."""
+    async def run(
+        self,
+        campaign_data: Dict[str, Any],
+        revision: Optional[Dict[str, Any]] = None,
+        notify_output: bool = False,
+    ) -> Dict[str, Any]:
+        """Execute researcher workflow.
+
+        Args:
+            campaign_data: Campaign input data
+            revision: Revision state carried over from a previous run that
+                continued as new
+            notify_output: Send the first research output to the parent
+                orchestrator even outside pipelined mode
+        """
         workflow.logger.info(f"Starting ResearcherWorkflow with campaign_data: {campaign_data}")
 
-        # Step 1: Compile research inputs
-        compiled_inputs = await workflow.execute_activity(
-            compile_research_input_activity,
-            campaign_data,
-            start_to_close_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                maximum_attempts=3,
-                initial_interval=timedelta(seconds=1),
-            ),
-        )
-
-        # Step 2: Execute ResearchBriefWorkflow
-        brief_result = await workflow.execute_child_workflow(
-            ResearchBriefWorkflow.run,
+        revision = new_revision_state(revision)
+        rounds_in_run = 0
+
+        while True:
+            researcher_output = await self._run_research(with_revision_context(campaign_data, revision))
+            await notify_pending_output("research", "research_outputs", researcher_output, always=notify_output)
+            await notify_stage_progress("research", AWAITING_APPROVAL, revision["round"])
+
+            # Step 5: Human-in-the-middle - Wait for approval signal
+            workflow.logger.info("Waiting for research approval signal...")
+            self.awaiting_approval = True
+            await workflow.wait_condition(
+                lambda: self.approval_status != "pending",
+                timeout=timedelta(hours=24)
+            )
+            self.awaiting_approval = False
+
+            # Rerun research with feedback
+            if self.approval_status == "feedback":
+                workflow.logger.info(f"Research feedback received: {self.approval_feedback}")
+                revision = record_feedback(revision, self.approval_feedback, researcher_output)
+                rounds_in_run += 1
+                self.approval_status = "pending"
+                await notify_stage_progress("research", REVISING, revision["round"])
+                if should_continue_as_new(rounds_in_run):
+                    workflow.logger.info(f"Continuing as new after revision round {revision['round']}")
+                    workflow.continue_as_new(args=[campaign_data, revision])
+                continue
+
+            if self.approval_status == "approved":
+                workflow.logger.info("Research approved!")
+                await notify_stage_progress("research", APPROVED, revision["round"])
+                return {
+                    "status": "approved",
+                    "approval_feedback": self.approval_feedback,
+                    "research_outputs": researcher_output,
+                }
+
+            if self.approval_status == "rejected":
+                workflow.logger.warning(f"Research rejected: {self.approval_feedback}")
+                raise Exception(f"Research rejected: {self.approval_feedback}")
+
+    async def _run_research(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the research steps and return the output awaiting approval."""
+        # Step 1: Fetch all research sources in parallel, merging results as they arrive
+        required = parse_required_sources(settings.research_required_sources)
+        pending = {
+            asyncio.create_task(source.execute(campaign_data)): source.name
+            for source in research_sources()
+        }
+        compiled_inputs = new_compiled_inputs(campaign_data)
+
+        while any(name in required for name in pending.values()):
+            done, _ = await workflow.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = pending.pop(task)
+                compiled_inputs = self._reduce_source(compiled_inputs, name, task)
+                if name in required and compiled_inputs["source_status"][name] != COMPLETED:
+                    workflow.logger.warning(f"Required research source {name} failed, cancelling the others")
+                    for other in pending:
+                        other.cancel()
+                    if pending:
+                        await workflow.wait(list(pending))
+                    raise task.exception()
+
+        # Optional sources that already returned go into the brief as well
+        for task in [task for task in pending if task.done()]:
+            compiled_inputs = self._reduce_source(compiled_inputs, pending.pop(task), task)
+
+        # Step 2: Execute research brief step (ResearchBriefWorkflow) while
+        # the other optional sources may still be running
+        workflow.logger.info(f"Starting research brief with sources: {list(compiled_inputs['sources'])}")
+        brief_result = await RESEARCH_BRIEF_STEP.execute(
             compiled_inputs,
             id=f"{workflow.info().workflow_id}-research-brief",
-            task_queue=workflow.info().task_queue,
         )
 
-        # Step 3: Execute ResearchConceptNoteWorkflow
-        concept_note_result = await workflow.execute_child_workflow(
-            ResearchConceptNoteWorkflow.run,
+        # Step 3: Execute concept note step (ResearchConceptNoteWorkflow)
+        concept_note_result = await RESEARCH_CONCEPT_NOTE_STEP.execute(
             brief_result,
             id=f"{workflow.info().workflow_id}-concept-note",
-            task_queue=workflow.info().task_queue,
         )
 
-        # Step 4: Summarise research findings
+        # Step 4: Merge optional sources that returned meanwhile, skip the rest
+        for task, name in pending.items():
+            if task.done():
+                compiled_inputs = self._reduce_source(compiled_inputs, name, task)
+            else:
+                task.cancel()
+                compiled_inputs = reduce_source(compiled_inputs, name, SKIPPED)
+        if pending:
+            await workflow.wait(list(pending))
+
+        # Step 5: Summarise research findings
         research_findings = await workflow.execute_activity(
             summarise_research_findings_activity,
-            concept_note_result,
+            {**concept_note_result, "sources": compiled_inputs["sources"]},
+            task_queue=activity_task_queue(summarise_research_findings_activity),
             start_to_close_timeout=timedelta(minutes=5),
             retry_policy=RetryPolicy(
                 maximum_attempts=3,
@@ -65,35 +172,23 @@ class ResearcherWorkflow:
             ),
         )
 
-        researcher_output = {
+        return {
             "research_brief": brief_result,
             "concept_note": concept_note_result,
             "research_findings": research_findings,
+            "research_sources": compiled_inputs["source_status"],
         }
 
-        # Step 5: Human-in-the-middle - Wait for approval signal
-        workflow.logger.info("Waiting for research approval signal...")
-        await workflow.wait_condition(
-            lambda: self.approval_status != "pending",
-            timeout=timedelta(hours=24)
-        )
-
-        # Rerun workflow with feedback
-        if self.approval_status == "feedback":
-            workflow.logger.info(f"Research feedback received: {self.approval_feedback}")
-            return await self.run(campaign_data)
-
-        if self.approval_status == "approved":
-            workflow.logger.info("Research approved!")
-            return {
-                "status": "approved",
-                "approval_feedback": self.approval_feedback,
-                "research_outputs": researcher_output,
-            }
-
-        if self.approval_status == "rejected":
-            workflow.logger.warning(f"Research rejected: {self.approval_feedback}")
-            raise Exception(f"Research rejected: {self.approval_feedback}")
+    @staticmethod
+    def _reduce_source(compiled_inputs: Dict[str, Any], name: str, task: asyncio.Task) -> Dict[str, Any]:
+        """Fold a finished source task into the compiled research inputs."""
+        if task.cancelled():
+            return reduce_source(compiled_inputs, name, SKIPPED)
+        if task.exception() is not None:
+            workflow.logger.warning(f"Research source {name} failed: {task.exception()}")
+            return reduce_source(compiled_inputs, name, FAILED, error=str(task.exception()))
+        workflow.logger.info(f"Research source {name} returned")
+        return reduce_source(compiled_inputs, name, COMPLETED, task.result())
 
     @workflow.signal(name="provide_feedback")
     async def provide_feedback(self, feedback: str = "") -> None:
@@ -116,6 +211,18 @@ class ResearcherWorkflow:
         self.approval_status = "rejected"
         self.approval_feedback = feedback
 
+    @workflow.update(name=SUBMIT_DECISION_UPDATE)
+    async def submit_decision(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Update to approve, reject or give feedback, accepted only while awaiting approval."""
+        workflow.logger.info(f"Research decision received via update: {decision['decision']}")
+        self.approval_status = DECISION_STATUSES[decision["decision"]]
+        self.approval_feedback = decision.get("feedback", "")
+        return {"stage": "research", "decision": decision["decision"]}
+
+    @submit_decision.validator
+    def validate_submit_decision(self, decision: Dict[str, Any]) -> None:
+        validate_decision("research", decision, self.awaiting_approval, self.approval_status)
+
     @workflow.query(name="get_approval_status")
     def get_approval_status(self) -> str:
         """Query to get current approval status."""
@@ -0,0 +1,119 @@
+"""Pluggable research sources and the reducer that merges their results.
+
+Each research source is its own activity with its own timeout, which bounds
+the source including retries. The researcher workflow starts all registered
+sources at once and folds each result into the compiled research inputs as
+it arrives. The brief starts as soon as the sources in
+``RESEARCH_REQUIRED_SOURCES`` have returned; the other sources are merged
+if they return before the findings are summarised.
+
+To add a source, define its activity, add it to the light activity pool and
+register it::
+
+    register_research_source(ResearchSource("social_listening", social_listening_activity, timedelta(minutes=2)))
+"""
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+
+with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
+    from activities.researcher_activities import (
+        market_trends_source_activity,
+        audience_insights_source_activity,
+        competitor_analysis_source_activity,
+        historical_performance_source_activity,
+    )
+
+# Research source states
+COMPLETED = "completed"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class ResearchSource:
+    """A research source fetched by one activity."""
+
+    name: str
+    activity: Callable
+    # Bounds the source including retries
+    timeout: timedelta
+    retry_policy: RetryPolicy = field(default_factory=lambda: RetryPolicy(
+        maximum_attempts=3,
+        initial_interval=timedelta(seconds=1),
+    ))
+
+    def execute(self, campaign_data: Dict[str, Any]) -> Awaitable[Any]:
+        """Fetch the source from the current workflow."""
+        return workflow.execute_activity(
+            self.activity,
+            campaign_data,
+            task_queue=activity_task_queue(self.activity),
+            schedule_to_close_timeout=self.timeout,
+            retry_policy=self.retry_policy,
+        )
+
+
+_sources: Dict[str, ResearchSource] = {}
+
+
+def register_research_source(source: ResearchSource) -> None:
+    """Register a research source under its name."""
+    _sources[source.name] = source
+
+
+def research_sources() -> List[ResearchSource]:
+    """All registered research sources, in registration order."""
+    return list(_sources.values())
+
+
+def parse_required_sources(value: str) -> List[str]:
+    """Parse the comma-separated required research sources.
+
+    Raises ValueError on unknown sources; the worker checks the setting at
+    startup, so workflow code never raises it.
+    """
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = set(names) - set(_sources)
+    if unknown:
+        raise ValueError(f"Invalid research sources {value!r}, expected a subset of {', '.join(_sources)}")
+    return names
+
+
+def new_compiled_inputs(campaign_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return compiled research inputs with no source merged yet."""
+    return {
+        "status": "success",
+        "message": "Research inputs compiled successfully",
+        "data": campaign_data,
+        "sources": {},
+        "source_status": {},
+    }
+
+
+def reduce_source(
+    compiled: Dict[str, Any],
+    name: str,
+    status: str,
+    result: Optional[Any] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fold one source's outcome into the compiled research inputs."""
+    sources = dict(compiled["sources"])
+    source_status = {**compiled["source_status"], name: status}
+    if status == COMPLETED:
+        sources[name] = result
+    elif error:
+        source_status[name] = f"{status}: {error}"
+    return {**compiled, "sources": sources, "source_status": source_status}
+
+
+register_research_source(ResearchSource("market_trends", market_trends_source_activity, timedelta(minutes=2)))
+register_research_source(ResearchSource("audience_insights", audience_insights_source_activity, timedelta(minutes=2)))
+register_research_source(ResearchSource("competitor_analysis", competitor_analysis_source_activity, timedelta(minutes=5)))
+register_research_source(ResearchSource("historical_performance", historical_performance_source_activity, timedelta(minutes=5)))
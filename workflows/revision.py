@@ -0,0 +1,82 @@
+"""Shared feedback/revision handling for stage workflows.
+
+Stage workflows loop on ``provide_feedback`` instead of calling ``self.run``
+again. After enough revision rounds in one run, or once the event history
+grows past a threshold, the stage continues as new and carries its revision
+state (round count, recent feedback and the latest output) into the new run.
+This keeps the replay cost of a workflow task bounded no matter how many
+rounds a campaign goes through.
+
+Feedback is either plain text about the whole stage, or addresses parts of
+it: ``{"feedback": "...", "targets": ["video", "sms-v2"]}``. Stages that
+support targets (the creative stage) only redo those parts and reuse the
+rest of the previous output.
+"""
+
+from temporalio import workflow
+from typing import Dict, Any, List, Optional, Tuple
+
+with workflow.unsafe.imports_passed_through():
+    from config.settings import settings
+
+
+def new_revision_state(revision: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Return the revision state carried into this run, or a fresh one."""
+    if revision:
+        return dict(revision)
+    return {
+        "round": 0,
+        "feedback_history": [],
+        "previous_output": None,
+        "targets": None,
+    }
+
+
+def split_feedback(feedback: Any) -> Tuple[str, Optional[List[str]]]:
+    """Split a feedback payload into its text and the parts it targets (if any)."""
+    if isinstance(feedback, dict):
+        return feedback.get("feedback", ""), feedback.get("targets") or None
+    return feedback, None
+
+
+def record_feedback(
+    revision: Dict[str, Any],
+    feedback: Any,
+    output: Dict[str, Any],
+    targets: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Record a feedback round, the output it was given on and its targets."""
+    history = [*revision["feedback_history"], feedback]
+    return {
+        "round": revision["round"] + 1,
+        # Only keep recent feedback so the carried state stays small
+        "feedback_history": history[-settings.revision_feedback_history_size:],
+        "previous_output": output,
+        "targets": targets,
+    }
+
+
+def with_revision_context(data: Dict[str, Any], revision: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the feedback so far to a stage's first activity input.
+
+    The first round passes the input through unchanged.
+    """
+    if revision["round"] == 0:
+        return data
+    return {
+        **data,
+        "revision": {
+            "round": revision["round"],
+            "feedback_history": revision["feedback_history"],
+        },
+    }
+
+
+def should_continue_as_new(rounds_in_run: int) -> bool:
+    """Check whether the current run should hand over to a fresh one."""
+    info = workflow.info()
+    if rounds_in_run >= settings.revision_max_rounds_per_run:
+        return True
+    if info.get_current_history_length() >= settings.revision_max_history_events:
+        return True
+    return info.is_continue_as_new_suggested()
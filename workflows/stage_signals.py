@@ -0,0 +1,46 @@
+"""Stage signals sent to the orchestrator ahead of time.
+
+Callers can hand the orchestrator signals meant for stage workflows that
+have not started yet, e.g. a pre-approval of the research stage or initial
+feedback, together with the campaign start (signal-with-start). The
+orchestrator queues them per stage and forwards them to each stage child as
+soon as it starts, or right away if the stage is already running.
+"""
+
+from typing import Dict, Optional
+
+QUEUE_STAGE_SIGNALS_SIGNAL = "queue_stage_signals"
+
+# Approval signal name -> stage it is meant for
+SIGNAL_STAGES: Dict[str, str] = {
+    "approve_research": "research",
+    "reject_research": "research",
+    "approve_creatives": "creative",
+    "reject_creatives": "creative",
+    "approve_media_buy": "golive",
+    "reject_media_buy": "golive",
+    "approve_measurements": "measurements",
+    "reject_measurements": "measurements",
+}
+
+# Signals every stage accepts, which need an explicit stage
+SHARED_STAGE_SIGNALS = {"provide_feedback"}
+
+
+def stage_for_signal(signal_name: str, stage: Optional[str] = None) -> str:
+    """Resolve the stage a signal is meant for.
+
+    Raises:
+        ValueError: If the signal is unknown, or the stage is missing or
+            doesn't accept the signal
+    """
+    if signal_name in SHARED_STAGE_SIGNALS:
+        if stage not in set(SIGNAL_STAGES.values()):
+            raise ValueError(f"Signal '{signal_name}' needs a stage (research, creative, golive or measurements)")
+        return stage
+
+    if signal_name not in SIGNAL_STAGES:
+        raise ValueError(f"Unknown stage signal: {signal_name}")
+    if stage is not None and stage != SIGNAL_STAGES[signal_name]:
+        raise ValueError(f"Signal '{signal_name}' is for the {SIGNAL_STAGES[signal_name]} stage, not {stage}")
+    return SIGNAL_STAGES[signal_name]
@@ -0,0 +1,61 @@
+"""Single-activity workflow steps.
+
+Each of the leaf sub-workflows (SMS, image, video, email, research brief,
+concept note, media buying, deployment, poll and retrieval) wraps exactly one
+activity. A ``WorkflowStep`` describes that activity call once so a parent
+stage can either start the sub-workflow as a child (per-step visibility in
+the Temporal UI) or call the activity directly, which saves a child workflow
+start, a separate history and its workflow tasks per step.
+
+The mode is chosen with ``WORKFLOW_STEP_MODE`` ("child_workflow" or
+"activity"). Changing it only affects workflows started afterwards as long as
+old workers have drained, since it changes the commands a workflow issues.
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+
+with workflow.unsafe.imports_passed_through():
+    from activities.task_queues import activity_task_queue
+    from config.settings import settings
+
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    """A step that runs one activity, as a child workflow or a direct call."""
+
+    workflow_run: Callable
+    activity: Callable
+    start_to_close_timeout: timedelta
+    retry_policy: RetryPolicy
+
+    def execute_activity(self, arg: Any) -> Awaitable[Any]:
+        """Execute the step's activity from the current workflow."""
+        return workflow.execute_activity(
+            self.activity,
+            arg,
+            task_queue=activity_task_queue(self.activity),
+            start_to_close_timeout=self.start_to_close_timeout,
+            retry_policy=self.retry_policy,
+        )
+
+    def execute(self, arg: Any, *, id: str) -> Awaitable[Any]:
+        """Execute the step according to the configured step mode.
+
+        Args:
+            arg: Input passed to the sub-workflow or activity
+            id: Child workflow ID to use in child workflow mode
+        """
+        if settings.workflow_step_mode == "activity":
+            return self.execute_activity(arg)
+
+        return workflow.execute_child_workflow(
+            self.workflow_run,
+            arg,
+            id=id,
+            task_queue=workflow.info().task_queue,
+        )